@@ -0,0 +1,8 @@
+import os
+import sys
+import importlib.util
+
+# asv environments put the checked-out commit on the path via a .pth file;
+# with --python=same (or a plain import) fall back to this working tree.
+if importlib.util.find_spec("modules") is None:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
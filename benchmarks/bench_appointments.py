@@ -0,0 +1,34 @@
+from modules.data_store import load_dataset
+from modules.storage import get_storage
+from modules.appointment import get_appointments_by_student
+from modules.availability import BookingIndex, weekly_availability
+from modules.aggregates import AppointmentAggregates
+from .common import SCALES, make_data_dir, use_data_dir
+
+
+class Appointments:
+    params = SCALES
+    param_names = ["rows"]
+    timeout = 600
+
+    def setup_cache(self):
+        return {n: make_data_dir(n) for n in self.params}
+
+    def setup(self, dirs, rows):
+        use_data_dir(dirs[rows])
+        self.appointments = get_storage().appointments()
+        self.teachers = load_dataset("teachers")
+        self.student_id = str(self.appointments['Student_ID'].iloc[len(self.appointments) // 2])
+        get_appointments_by_student(self.student_id)
+
+    def time_appointments_by_student(self, dirs, rows):
+        get_appointments_by_student(self.student_id)
+
+    def time_booking_index_build(self, dirs, rows):
+        BookingIndex.from_appointments(self.appointments)
+
+    def time_aggregates_build(self, dirs, rows):
+        AppointmentAggregates.from_frame(self.appointments, self.teachers)
+
+    def time_weekly_availability(self, dirs, rows):
+        weekly_availability(self.teachers)
@@ -0,0 +1,33 @@
+import os
+import tempfile
+import numpy as np
+from modules.faq import FaqIndex
+from modules.synthetic_data import make_faq
+
+
+class FaqSearch:
+    params = [1_000, 100_000]
+    param_names = ["entries"]
+    timeout = 600
+
+    def setup_cache(self):
+        paths = {}
+        for n in self.params:
+            path = os.path.join(tempfile.mkdtemp(prefix=f"dashboard-faq-{n}-"), "faq.npz")
+            FaqIndex.build(make_faq(n, np.random.default_rng(0))['Question']).save(path, np.zeros(2, dtype=np.int64))
+            paths[n] = path
+        return paths
+
+    def setup(self, paths, entries):
+        self.path = paths[entries]
+        self.index, _ = FaqIndex.load(self.path)
+        self.queries = make_faq(100, np.random.default_rng(1))['Question'].tolist()
+
+    def time_load_index(self, paths, entries):
+        FaqIndex.load(self.path)
+
+    def time_search(self, paths, entries):
+        self.index.search(self.queries[0])
+
+    def time_search_batch_100(self, paths, entries):
+        self.index.search_batch(self.queries)
@@ -0,0 +1,28 @@
+from modules.data_store import DATASETS, load_dataset, clear_cache
+from modules.snapshots import read_csv_typed, load_snapshot, rebuild_snapshots
+from .common import SCALES, make_data_dir, use_data_dir
+
+
+class DatasetLoad:
+    params = SCALES
+    param_names = ["rows"]
+    timeout = 600
+
+    def setup_cache(self):
+        return {n: make_data_dir(n) for n in self.params}
+
+    def setup(self, dirs, rows):
+        use_data_dir(dirs[rows])
+        rebuild_snapshots()
+        self.spec = DATASETS["quiz_results"]
+
+    def time_parse_csv(self, dirs, rows):
+        read_csv_typed(self.spec["path"], self.spec["columns"], self.spec["dtypes"])
+
+    def time_load_snapshot(self, dirs, rows):
+        load_snapshot(self.spec["path"], self.spec["columns"], self.spec["dtypes"])
+
+    def peakmem_load_all_datasets(self, dirs, rows):
+        clear_cache()
+        for name in DATASETS:
+            load_dataset(name)
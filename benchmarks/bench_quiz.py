@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+from modules.question_bank import QuestionBank
+from modules.adaptive_quiz import QuestionStats
+from modules.synthetic_data import make_quiz_questions
+
+
+class Quiz:
+    params = [1_000, 50_000]
+    param_names = ["questions"]
+
+    def setup(self, questions):
+        rng = np.random.default_rng(0)
+        self.df = make_quiz_questions(questions, rng)
+        self.bank = QuestionBank(self.df)
+        self.ids = self.bank.sample(10)
+        self.chosen = rng.integers(0, 4, size=10)
+        # 1000 quizzes graded together, as a report over a whole class would.
+        self.batch_ids = rng.integers(0, questions, size=10_000)
+        self.batch_chosen = rng.integers(0, 4, size=10_000)
+        self.stats = QuestionStats.from_log(self.bank, pd.DataFrame(
+            columns=['Student_ID', 'Question_Key', 'Correct', 'Ability']))
+
+    def time_build_bank(self, questions):
+        QuestionBank(self.df)
+
+    def time_sample(self, questions):
+        self.bank.sample(10)
+
+    def time_stratified_sample(self, questions):
+        self.bank.stratified_sample(10)
+
+    def time_grade_quiz(self, questions):
+        self.bank.grade(self.ids, self.chosen)
+
+    def time_grade_batch(self, questions):
+        self.bank.grade(self.batch_ids, self.batch_chosen)
+
+    def time_adaptive_next_question(self, questions):
+        self.stats.next_question("1001", exclude=self.ids)
+
+    def time_record_answer(self, questions):
+        self.stats.record("1001", int(self.ids[0]), True, 0.6)
@@ -0,0 +1,61 @@
+import io
+from modules.storage import get_storage
+from modules.analytics import StudentAnalytics, get_student_analytics
+from modules.aggregates import get_aggregates
+from modules.admin_analytics import _build_figures
+from modules.charts import render_student_charts
+from modules.pdf_generator import generate_pdf_report
+from .common import SCALES, make_data_dir, use_data_dir
+
+
+class ProgressReport:
+    params = SCALES
+    param_names = ["rows"]
+    timeout = 600
+
+    def setup_cache(self):
+        return {n: make_data_dir(n) for n in self.params}
+
+    def setup(self, dirs, rows):
+        use_data_dir(dirs[rows])
+        storage = get_storage()
+        self.quiz = storage.quiz_results()
+        self.thoughts = storage.thoughts()
+        self.analytics = get_student_analytics()
+        self.student_id = self.analytics.student_ids()[0]
+
+    def time_student_analytics_build(self, dirs, rows):
+        StudentAnalytics(self.quiz, self.thoughts)
+
+    def time_student_lookup(self, dirs, rows):
+        self.analytics.student_summary(self.student_id)
+        self.analytics.timeline(self.student_id)
+
+    def time_admin_figures(self, dirs, rows):
+        _build_figures(get_aggregates())
+
+
+class PdfReport:
+    timeout = 300
+
+    def setup_cache(self):
+        return make_data_dir(1_000)
+
+    def setup(self, path):
+        use_data_dir(path)
+        analytics = get_student_analytics()
+        self.student_id = analytics.student_ids()[0]
+        self.name = analytics.student_name(self.student_id)
+        self.summary = analytics.student_summary(self.student_id)
+        self.timeline = analytics.timeline(self.student_id)
+        history = analytics.quiz_history(self.student_id)
+        self.chart_args = (history['DateTime'].tolist(), history['Score'].tolist(),
+                           self.summary['correct_total'], self.summary['wrong_total'])
+        self.charts = render_student_charts(*self.chart_args)
+
+    def time_render_charts(self, path):
+        render_student_charts(*self.chart_args)
+
+    def time_generate_pdf_report(self, path):
+        images = {k: io.BytesIO(v) for k, v in self.charts.items() if v}
+        generate_pdf_report(self.name, self.student_id, self.summary, self.timeline, images)
@@ -0,0 +1,37 @@
+from modules.data_store import load_dataset
+from modules.teacher_search import TeacherSearchIndex
+from .common import make_data_dir, use_data_dir
+
+
+class TeacherSearch:
+    params = [1_000, 100_000]
+    param_names = ["teachers"]
+    timeout = 600
+
+    def setup_cache(self):
+        return {n: make_data_dir(1_000, teachers=n) for n in self.params}
+
+    def setup(self, dirs, teachers):
+        use_data_dir(dirs[teachers])
+        self.df = load_dataset("teachers")
+        self.index = TeacherSearchIndex(self.df)
+        row = self.df.iloc[len(self.df) // 2]
+        self.teacher_id = row['Teacher_ID']
+        self.name = row['Teacher_Name']
+        first = self.name.split()[0]
+        self.typo = first[0] + first[2] + first[1] + first[3:]  # one transposition
+
+    def time_build_index(self, dirs, teachers):
+        TeacherSearchIndex(self.df)
+
+    def time_exact_id(self, dirs, teachers):
+        self.index.search(self.teacher_id)
+
+    def time_full_name(self, dirs, teachers):
+        self.index.search(self.name)
+
+    def time_prefix(self, dirs, teachers):
+        self.index.search(self.name[:3])
+
+    def time_fuzzy(self, dirs, teachers):
+        self.index.search(self.typo)
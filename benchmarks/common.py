@@ -0,0 +1,24 @@
+"""Shared fixture for the asv suite: synthetic data directories per scale."""
+import os
+import tempfile
+
+SCALES = [1_000, 100_000]
+
+
+def make_data_dir(rows, teachers=None, seed=0):
+    """
+    Generates a data/ directory with `rows` appointments, thoughts and quiz
+    results and returns its parent. The modules read data/ relative to the
+    working directory, so benchmarks chdir into it in setup().
+    """
+    from modules.synthetic_data import generate
+    out = tempfile.mkdtemp(prefix=f"dashboard-bench-{rows}-")
+    generate(out, teachers=teachers or max(100, rows // 100), appointments=rows, thoughts=rows // 2,
+             quiz_results=rows, quiz_questions=max(1000, rows // 10), seed=seed)
+    return out
+
+
+def use_data_dir(path):
+    os.chdir(path)
+    from modules.data_store import clear_cache
+    clear_cache()
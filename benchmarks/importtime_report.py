@@ -0,0 +1,82 @@
+"""
+Cold-start import cost of the app shell and of each page, from
+`python -X importtime`, so a page that starts pulling a heavy library in
+at startup shows up as a regression.
+
+    python benchmarks/importtime_report.py [--top 15] [--module modules.views.home ...]
+
+Each target is imported in a fresh interpreter. The table lists total
+import time per target plus its most expensive top-level packages.
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from modules.views import PAGES, page_module
+
+# Everything app.py imports before a page is chosen.
+SHELL_MODULES = ["streamlit", "modules.ui_components", "modules.data_store", "modules.storage",
+                 "modules.user_store", "modules.views"]
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr):
+    """[(module, self_us, cumulative_us, depth)] from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def measure(modules, preload=()):
+    """
+    Imports `preload` first (not counted), then `modules`, in a fresh
+    interpreter. Returns the parsed importtime rows for `modules` only.
+    """
+    code = "; ".join([f"import {m}" for m in preload] + ["import sys", "sys.stderr.write('--start--\\n')"]
+                     + [f"import {m}" for m in modules])
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr[-2000:])
+    return parse_importtime(proc.stderr.split("--start--", 1)[1])
+
+
+def summarize(rows, top):
+    total_ms = sum(r[1] for r in rows) / 1000
+    roots = sorted((r for r in rows if r[3] == 0), key=lambda r: r[2], reverse=True)
+    return total_ms, [(m, cum / 1000) for m, _, cum, _ in roots[:top]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=5, help="heaviest packages to list per target")
+    parser.add_argument("--module", nargs="*", help="extra modules to measure on top of the shell")
+    args = parser.parse_args()
+
+    targets = [("app shell", SHELL_MODULES, ())]
+    for name in PAGES:
+        targets.append((f"page: {name}", [page_module(name)], SHELL_MODULES))
+    for module in args.module or []:
+        targets.append((module, [module], SHELL_MODULES))
+
+    print(f"{'target':32s} {'ms':>9s}  heaviest imports (cumulative ms)")
+    print("-" * 100)
+    for label, modules, preload in targets:
+        total_ms, heaviest = summarize(measure(modules, preload), args.top)
+        detail = ", ".join(f"{m} {ms:.0f}" for m, ms in heaviest)
+        print(f"{label:32s} {total_ms:9.1f}  {detail}")
+    print("\nPage rows are measured after the app shell is already imported.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Per-report latency of generate_pdf_report with a fresh ReportTemplate per
+call (how every report used to be built) versus the shared template.
+
+    python benchmarks/pdf_report_latency.py [--reports 200] [--timeline 50]
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.pdf_generator import generate_pdf_report, get_report_template, ReportTemplate
+
+
+def sample_inputs(timeline_rows):
+    summary = {"total_quizzes": 12, "avg_score": 7.5, "total_thoughts": 4,
+               "correct_total": 90, "wrong_total": 30}
+    timeline = pd.DataFrame({
+        "DateTime": pd.date_range("2025-01-01", periods=timeline_rows, freq="D")[::-1],
+        "Type": ["Quiz", "Thought"] * (timeline_rows // 2) + ["Quiz"] * (timeline_rows % 2),
+        "Detail": [f"Score {i % 11} / 10" for i in range(timeline_rows)],
+    })
+    return summary, timeline
+
+
+def measure(reports, build):
+    times = []
+    for _ in range(reports):
+        start = time.perf_counter()
+        build()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reports", type=int, default=200)
+    parser.add_argument("--timeline", type=int, default=50)
+    args = parser.parse_args()
+
+    summary, timeline = sample_inputs(args.timeline)
+    get_report_template()
+
+    runs = {
+        "per-call template (before)": lambda: generate_pdf_report(
+            "Bench Student", "0001", summary, timeline, {}, template=ReportTemplate()),
+        "shared template (after)": lambda: generate_pdf_report(
+            "Bench Student", "0001", summary, timeline, {}),
+    }
+    for label, build in runs.items():
+        build()  # warm-up
+        times = measure(args.reports, build)
+        print(f"{label:28s} mean {statistics.mean(times):7.2f} ms  "
+              f"median {statistics.median(times):7.2f} ms  "
+              f"p95 {sorted(times)[int(len(times) * 0.95) - 1]:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
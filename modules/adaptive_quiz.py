@@ -0,0 +1,239 @@
+import math
+import random
+import threading
+import zlib
+import datetime
+import numpy as np
+import pandas as pd
+from modules.data_store import DATASETS, load_dataset, load_cached, store_cached, data_version
+from modules.csv_writer import get_writer
+from modules.question_bank import get_question_bank, question_bank_version
+
+# Bands over the estimated probability of answering correctly, hardest first.
+BAND_EDGES = np.array([0.2, 0.4, 0.6, 0.8])
+BAND_NAMES = ["Very hard", "Hard", "Medium", "Easy", "Very easy"]
+CACHE_KEY = "question_stats"
+
+_write_lock = threading.Lock()
+
+
+def question_key(text):
+    """Stable id for a question across bank reloads (crc32 of its text)."""
+    return zlib.crc32(str(text).encode("utf-8"))
+
+
+def _band(p):
+    return int(np.searchsorted(BAND_EDGES, p, side='right'))
+
+
+class _BandIndex:
+    """Members of one difficulty band: a list plus positions, so add, remove and random pick are O(1)."""
+
+    def __init__(self):
+        self.items = []
+        self.pos = {}
+
+    def add(self, qid):
+        self.pos[qid] = len(self.items)
+        self.items.append(qid)
+
+    def remove(self, qid):
+        i = self.pos.pop(qid)
+        last = self.items.pop()
+        if last != qid:
+            self.items[i] = last
+            self.pos[last] = i
+
+    def pick(self, exclude, rng, tries=8):
+        if not self.items:
+            return None
+        for _ in range(tries):
+            qid = self.items[rng.randrange(len(self.items))]
+            if qid not in exclude:
+                return qid
+        rest = [q for q in self.items if q not in exclude]
+        return rng.choice(rest) if rest else None
+
+
+class QuestionStats:
+    """
+    Running difficulty and discrimination estimates for every question in
+    the bank, plus each student's ability, updated in O(1) per answer.
+
+    difficulty   = smoothed share of correct answers, (correct + 1) / (attempts + 2)
+    discrimination = mean ability of students who got it right minus the
+                     mean ability of those who got it wrong
+    Questions are kept in one index per difficulty band so adaptive
+    selection never scans the bank.
+    """
+
+    def __init__(self, bank):
+        n = len(bank)
+        self.bank = bank
+        self.key_to_qid = {question_key(q): i for i, q in enumerate(bank.questions)}
+        self.attempts = np.zeros(n, dtype=np.int32)
+        self.correct = np.zeros(n, dtype=np.int32)
+        self.ability_right = np.zeros(n, dtype=np.float64)
+        self.ability_wrong = np.zeros(n, dtype=np.float64)
+        self.student_attempts = {}
+        self.student_correct = {}
+        self.bands = [_BandIndex() for _ in BAND_NAMES]
+        self.band_of = np.full(n, -1, dtype=np.int8)
+        # Running sum of difficulty over answered questions, for the bank-wide mean.
+        self._p_sum = 0.0
+        self._p_count = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_log(cls, bank, answers_df):
+        stats = cls(bank)
+        if not answers_df.empty:
+            qids = answers_df['Question_Key'].map(stats.key_to_qid)
+            known = qids.notna()
+            correct = answers_df['Correct'][known].astype(np.int64)
+            ability = answers_df['Ability'][known].astype(np.float64)
+            log = pd.DataFrame({
+                "qid": qids[known].astype(np.int64),
+                "correct": correct,
+                "ability_right": ability * correct,
+                "ability_wrong": ability * (1 - correct),
+            })
+            per_q = log.groupby('qid').agg(
+                attempts=('correct', 'size'),
+                correct=('correct', 'sum'),
+                ability_right=('ability_right', 'sum'),
+                ability_wrong=('ability_wrong', 'sum'),
+            )
+            idx = per_q.index.to_numpy()
+            stats.attempts[idx] = per_q['attempts'].to_numpy()
+            stats.correct[idx] = per_q['correct'].to_numpy()
+            stats.ability_right[idx] = per_q['ability_right'].to_numpy()
+            stats.ability_wrong[idx] = per_q['ability_wrong'].to_numpy()
+
+            per_s = answers_df.groupby(answers_df['Student_ID'].astype(str), observed=True)['Correct'].agg(['size', 'sum'])
+            stats.student_attempts = per_s['size'].astype(int).to_dict()
+            stats.student_correct = per_s['sum'].astype(int).to_dict()
+
+        answered = stats.attempts > 0
+        stats._p_sum = float(((stats.correct[answered] + 1) / (stats.attempts[answered] + 2)).sum())
+        stats._p_count = int(answered.sum())
+        for qid in np.flatnonzero(bank.answer_keys >= 0):
+            band = _band(stats.difficulty(qid))
+            stats.band_of[qid] = band
+            stats.bands[band].add(int(qid))
+        return stats
+
+    def difficulty(self, qid):
+        return (self.correct[qid] + 1) / (self.attempts[qid] + 2)
+
+    def discrimination(self, qid):
+        right = self.correct[qid]
+        wrong = self.attempts[qid] - right
+        if right == 0 or wrong == 0:
+            return 0.0
+        return self.ability_right[qid] / right - self.ability_wrong[qid] / wrong
+
+    def ability(self, student_id):
+        """Smoothed share of questions the student has answered correctly."""
+        student_id = str(student_id)
+        return (self.student_correct.get(student_id, 0) + 1) / (self.student_attempts.get(student_id, 0) + 2)
+
+    def record(self, student_id, qid, correct, ability):
+        """Folds one answer in. O(1): a few counter updates and at most one band move."""
+        student_id = str(student_id)
+        with self._lock:
+            if self.attempts[qid]:
+                self._p_sum -= self.difficulty(qid)
+            else:
+                self._p_count += 1
+            self.attempts[qid] += 1
+            if correct:
+                self.correct[qid] += 1
+                self.ability_right[qid] += ability
+            else:
+                self.ability_wrong[qid] += ability
+            self.student_attempts[student_id] = self.student_attempts.get(student_id, 0) + 1
+            self.student_correct[student_id] = self.student_correct.get(student_id, 0) + int(bool(correct))
+
+            self._p_sum += self.difficulty(qid)
+            band = _band(self.difficulty(qid))
+            old = self.band_of[qid]
+            if old >= 0 and band != old:
+                self.bands[old].remove(int(qid))
+                self.bands[band].add(int(qid))
+                self.band_of[qid] = band
+
+    def target_band(self, ability):
+        """
+        Band a student of this ability is about as likely to get right as
+        wrong on. Uses a Rasch-style match of the student's ability against
+        how hard the average question is.
+        """
+        mean_p = self._p_sum / self._p_count if self._p_count else 0.5
+        logit = lambda p: math.log(p / (1 - p))
+        theta = logit(ability) - logit(mean_p)
+        return _band(1 / (1 + math.exp(theta)))
+
+    def next_question(self, student_id, exclude=(), rng=None):
+        """
+        Picks an unasked question from the band matching the student's
+        ability, widening to neighbouring bands when that one is used up.
+        """
+        rng = rng or random
+        exclude = set(int(q) for q in exclude)
+        target = self.target_band(self.ability(student_id))
+        with self._lock:
+            for step in range(len(self.bands)):
+                for band in ((target - step, target + step) if step else (target,)):
+                    if 0 <= band < len(self.bands):
+                        qid = self.bands[band].pick(exclude, rng)
+                        if qid is not None:
+                            return qid
+        return None
+
+    def frame(self):
+        """Per-question statistics, hardest first."""
+        ids = np.arange(len(self.bank))
+        difficulty = (self.correct + 1) / (self.attempts + 2)
+        df = pd.DataFrame({
+            "Question": self.bank.questions,
+            "Attempts": self.attempts,
+            "Correct": self.correct,
+            "Difficulty": difficulty.round(3),
+            "Discrimination": [round(self.discrimination(q), 3) for q in ids],
+            "Band": [BAND_NAMES[b] if b >= 0 else "" for b in self.band_of],
+        })
+        return df.sort_values("Difficulty", kind="stable")
+
+
+def stats_version():
+    return (data_version("quiz_answers"), question_bank_version())
+
+
+def get_question_stats():
+    """Returns question statistics for the current answer log and bank."""
+    return load_cached(CACHE_KEY, stats_version(),
+                       lambda: QuestionStats.from_log(get_question_bank(), load_dataset("quiz_answers")))
+
+
+def log_answers(student_id, question_ids, correct):
+    """
+    Appends one row per answer to the answer log and folds the answers into
+    the cached statistics, re-tagged with the log's new version.
+    """
+    spec = DATASETS["quiz_answers"]
+    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    student_id = str(student_id)
+    with _write_lock:
+        stats = get_question_stats()
+        ability = round(stats.ability(student_id), 4)
+        rows = [{"DateTime": now, "Student_ID": student_id,
+                 "Question_Key": question_key(stats.bank.questions[qid]),
+                 "Correct": int(bool(ok)), "Ability": ability}
+                for qid, ok in zip(question_ids, correct)]
+        writer = get_writer()
+        for i, row in enumerate(rows):
+            writer.append(spec["path"], spec["columns"], row, wait=(i == len(rows) - 1))
+        for qid, ok in zip(question_ids, correct):
+            stats.record(student_id, int(qid), bool(ok), ability)
+        store_cached(CACHE_KEY, stats_version(), stats)
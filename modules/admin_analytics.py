@@ -0,0 +1,45 @@
+import json
+from modules.data_store import load_cached
+from modules.aggregates import get_aggregates, aggregates_version
+
+
+def _build_figures(agg):
+    import plotly.express as px
+    figures = {"trend": None, "teachers": None, "subjects": None}
+
+    appt_over_time = agg.daily_frame()
+    if not appt_over_time.empty:
+        figures["trend"] = px.line(
+            appt_over_time, x='Date', y='Count', markers=True,
+            title="Appointments Trend Over Time", labels={'Count': 'Number of Appointments'}
+        ).to_json()
+
+    teacher_counts = agg.teacher_frame()
+    if not teacher_counts.empty:
+        figures["teachers"] = px.bar(
+            teacher_counts, x='Teacher_Name', y='Bookings', color='Bookings',
+            title="Top Teachers by Appointments", text='Bookings'
+        ).to_json()
+
+    subj_chart = agg.subject_frame()
+    if not subj_chart.empty:
+        figures["subjects"] = px.pie(
+            subj_chart, names='Subject', values='Count', title="Appointments per Subject"
+        ).to_json()
+    return figures
+
+
+def admin_figures():
+    """
+    Serialized Plotly figures for the Admin Panel (trend, teachers,
+    subjects), built from the materialized aggregates once per data version.
+    A value is None when there is nothing to plot.
+    """
+    agg = get_aggregates()
+    return load_cached("admin_figures", aggregates_version(), lambda: _build_figures(agg))
+
+
+def admin_figure(name):
+    """Figure as a plain dict, ready for st.plotly_chart, or None."""
+    spec = admin_figures()[name]
+    return json.loads(spec) if spec else None
@@ -1,8 +1,20 @@
 import streamlit as st
 import pandas as pd
 import os
-import plotly.express as px
 from datetime import datetime
+from modules.data_store import load_csv
+from modules.storage import get_storage
+from modules.intent_model import get_intent_model
+from modules.assistant import latency_stats
+from modules.train_intent import retrain as retrain_intent_model
+from modules.aggregates import rebuild_aggregates
+from modules.admin_analytics import admin_figure
+from modules.analytics import get_student_analytics
+from modules.bulk_reports import generate_bulk_reports_zip
+from modules.ingest import ingest_teacher_csv
+from modules.adaptive_quiz import get_question_stats
+from modules.views import render_timings
+from modules.diagnostics import memory_diagnostic, estimate_pod_mb
 
 def admin_panel(data_path="data/teacher_dataset_100.csv"):
     st.title(" Admin Panel - Analytics & Management")
@@ -11,12 +23,20 @@ def admin_panel(data_path="data/teacher_dataset_100.csv"):
     st.subheader(" Upload New Teacher Dataset")
     uploaded_file = st.file_uploader("Upload (.csv)", type=["csv"])
     if uploaded_file:
-        df = pd.read_csv(uploaded_file)
-        if not df.empty:
-            df.to_csv(data_path, index=False)
-            st.success("Teacher dataset updated successfully!")
-        else:
-            st.error("Uploaded file is empty!")
+        skip_invalid = st.checkbox("Skip invalid rows instead of rejecting the file", value=False)
+        if st.button("Validate & Import"):
+            with st.spinner("Validating teacher dataset..."):
+                result = ingest_teacher_csv(uploaded_file, data_path, skip_invalid=skip_invalid)
+            if result.missing_columns:
+                st.error("Missing required columns: " + ", ".join(result.missing_columns))
+            elif result.applied:
+                st.success(f"Teacher dataset updated successfully! {result.rows_written} of {result.rows_read} rows imported.")
+            elif result.empty:
+                st.error("Uploaded file is empty!")
+            else:
+                st.error(f"Upload rejected: {result.error_count} invalid value(s) in {result.rows_read} rows. The current dataset was not changed.")
+            if result.error_count:
+                st.dataframe(result.errors_frame(), use_container_width=True)
 
     st.subheader(" Download Current Dataset")
     if os.path.exists(data_path):
@@ -28,7 +48,7 @@ def admin_panel(data_path="data/teacher_dataset_100.csv"):
         )
 
     if os.path.exists(data_path):
-        df = pd.read_csv(data_path)
+        df = load_csv(data_path)
         st.markdown("### Teacher Dataset Stats")
         col1, col2, col3 = st.columns(3)
         col1.metric("Total Teachers", len(df))
@@ -39,62 +59,97 @@ def admin_panel(data_path="data/teacher_dataset_100.csv"):
             st.dataframe(df)
 
     st.subheader(" Appointment Data & Analytics")
-    appointment_file = "data/appointments.csv"
-    if os.path.exists(appointment_file):
-        appt_df = pd.read_csv(appointment_file)
-
-        if appt_df.empty:
-            st.info("No appointments have been booked yet.")
-        else:
-            if 'Date' in appt_df.columns:
-                appt_df['Date'] = pd.to_datetime(appt_df['Date'], errors='coerce')
-
-            st.write(f"Total Appointments: {len(appt_df)}")
-            st.dataframe(appt_df.tail(10))
-
-            if appt_df['Date'].notna().any():
-                st.markdown("#### Appointments Over Time")
-                appt_over_time = appt_df.groupby(appt_df['Date'].dt.date).size().reset_index(name='Count')
-                fig1 = px.line(appt_over_time, x='Date', y='Count', markers=True,
-                               title="Appointments Trend Over Time", labels={'Count': 'Number of Appointments'})
-                st.plotly_chart(fig1, use_container_width=True)
-
-            if 'Teacher_Name' in appt_df.columns and not appt_df['Teacher_Name'].isna().all():
-                st.markdown("#### Most Booked Teachers")
-                teacher_counts = appt_df['Teacher_Name'].value_counts().reset_index()
-                teacher_counts.columns = ['Teacher_Name', 'Bookings']
-                fig2 = px.bar(teacher_counts, x='Teacher_Name', y='Bookings', color='Bookings',
-                              title="Top Teachers by Appointments", text='Bookings')
-                st.plotly_chart(fig2, use_container_width=True)
-
-            if 'Teacher_ID' in appt_df.columns and not df.empty:
-                st.markdown("#### Subject Popularity")
-                subject_counts = appt_df.merge(df[['Teacher_ID', 'Subject']], on='Teacher_ID', how='left')
-                subj_chart = subject_counts['Subject'].value_counts().reset_index()
-                subj_chart.columns = ['Subject', 'Count']
-                fig3 = px.pie(subj_chart, names='Subject', values='Count', title="Appointments per Subject")
-                st.plotly_chart(fig3, use_container_width=True)
-
-            if st.button("🗑 Clear All Appointments"):
-                os.remove(appointment_file)
-                st.warning("⚠ All appointment records deleted!")
+    storage = get_storage()
+    total_appointments = storage.count_appointments()
+    if total_appointments == 0:
+        st.info("No appointments have been booked yet.")
     else:
-        st.info("No appointments file found yet.")
+        appt_df = storage.appointments()
 
-    st.subheader(" Student Thoughts & Feedback")
-    thoughts_file = "data/student_thoughts.csv"
-    if os.path.exists(thoughts_file):
-        t_df = pd.read_csv(thoughts_file, parse_dates=['Date'])
-        if t_df.empty:
-            st.info("No thoughts submitted yet.")
-        else:
-            st.write(f"Total Thoughts: {len(t_df)}")
-            st.dataframe(t_df.tail(10))
+        st.write(f"Total Appointments: {total_appointments}")
+        st.dataframe(appt_df.tail(10))
 
-            if st.button("🗑 Clear All Thoughts"):
-                os.remove(thoughts_file)
-                st.warning("⚠ All student thoughts cleared!")
-    else:
-        st.info("No thoughts submitted yet.")
+        fig1 = admin_figure("trend")
+        if fig1:
+            st.markdown("#### Appointments Over Time")
+            st.plotly_chart(fig1, use_container_width=True)
+
+        fig2 = admin_figure("teachers")
+        if fig2:
+            st.markdown("#### Most Booked Teachers")
+            st.plotly_chart(fig2, use_container_width=True)
 
+        fig3 = admin_figure("subjects")
+        if fig3:
+            st.markdown("#### Subject Popularity")
+            st.plotly_chart(fig3, use_container_width=True)
 
+        if st.button("🔄 Rebuild Statistics"):
+            rebuild_aggregates()
+            st.success("Statistics rebuilt from the full appointment history.")
+
+        if st.button("🗑 Clear All Appointments"):
+            storage.clear_appointments()
+            st.warning("⚠ All appointment records deleted!")
+
+    st.subheader(" Student Thoughts & Feedback")
+    total_thoughts = storage.count_thoughts()
+    if total_thoughts == 0:
+        st.info("No thoughts submitted yet.")
+    else:
+        st.write(f"Total Thoughts: {total_thoughts}")
+        st.dataframe(storage.thoughts().tail(10))
+
+        if st.button("🗑 Clear All Thoughts"):
+            storage.clear_thoughts()
+            st.warning("⚠ All student thoughts cleared!")
+
+    st.subheader(" Bulk Progress Reports")
+    all_students = get_student_analytics().student_ids()
+    selected = st.multiselect("Students (leave empty for all)", all_students)
+    if st.button("📄 Generate Reports"):
+        bar = st.progress(0.0)
+        zip_bytes, stats = generate_bulk_reports_zip(
+            selected or None,
+            progress=lambda done, total: bar.progress(done / total, text=f"{done}/{total} reports")
+        )
+        st.success(f"Generated {stats['reports']} reports in {stats['seconds']}s "
+                   f"({stats['reports_per_sec']} reports/sec)")
+        if stats['skipped']:
+            st.warning(f"Skipped student IDs with no usable file name: {', '.join(stats['skipped'])}")
+        st.download_button("⬇ Download Reports (.zip)", data=zip_bytes,
+                           file_name="progress_reports.zip", mime="application/zip")
+
+    st.subheader(" Quiz Question Statistics")
+    with st.expander(" Difficulty & discrimination per question"):
+        st.dataframe(get_question_stats().frame(), use_container_width=True)
+
+    st.subheader(" Memory")
+    with st.expander(" Process, shared cache and per-session memory"):
+        report = memory_diagnostic(st.session_state)
+        st.json(report)
+        users = st.number_input("Concurrent users to size for", min_value=1, value=500, step=100)
+        st.info(f"Estimated RSS with {users} users: ~{estimate_pod_mb(users, report)} MB")
+
+    st.subheader(" Page Render Times")
+    with st.expander(" Data load and render time of recent page views"):
+        timings = pd.DataFrame(render_timings(), columns=["page", "load_ms", "render_ms"])
+        if timings.empty:
+            st.info("No pages rendered yet.")
+        else:
+            st.dataframe(timings.groupby("page")[["load_ms", "render_ms"]].describe(percentiles=[0.5, 0.95]),
+                         use_container_width=True)
+
+    st.subheader(" Assistant Model")
+    with st.expander(" Intent model load time & inference latency"):
+        st.json(get_intent_model().stats())
+        st.markdown("**Ask Assistant latency (recent calls)**")
+        st.json(latency_stats())
+    full_retrain = st.checkbox("Retrain from scratch (otherwise only new or renamed teachers are trained in)")
+    if st.button("🔁 Retrain Assistant Model"):
+        with st.spinner("Training intent model on the current roster..."):
+            info = retrain_intent_model(incremental=not full_retrain)
+        if info["mode"] == "unchanged":
+            st.info("The model is already up to date with the teacher roster.")
+        else:
+            st.success(f"Model v{info['version']} trained ({info['mode']}, {info['samples']} queries) in {info['seconds']}s")
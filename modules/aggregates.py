@@ -0,0 +1,128 @@
+import heapq
+import threading
+from collections import Counter
+import pandas as pd
+from modules.data_store import load_dataset, load_cached, store_cached, data_version
+from modules.storage import get_storage
+
+CACHE_KEY = "appointment_aggregates"
+
+
+class AppointmentAggregates:
+    """
+    Running totals over the appointments table: per-teacher, per-day and
+    per-subject counts plus a top-k heap of teachers. Updated in O(log n)
+    per booking; rebuilt from the full table only when the data changes
+    behind our back or on demand.
+    """
+
+    def __init__(self, teacher_subjects=None):
+        self.teacher_subjects = teacher_subjects or {}
+        self.total = 0
+        self.teacher_counts = Counter()
+        self.day_counts = Counter()
+        self.subject_counts = Counter()
+        # (-count, name) entries; stale ones are skipped and dropped lazily
+        self._heap = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, appointments_df, teacher_df):
+        agg = cls(dict(zip(teacher_df['Teacher_ID'].astype(str), teacher_df['Subject'])))
+        if appointments_df.empty:
+            return agg
+        agg.total = len(appointments_df)
+        agg.teacher_counts = Counter(appointments_df['Teacher_Name'].dropna().value_counts().to_dict())
+        days = appointments_df['Date'].astype(str).str[:10]
+        agg.day_counts = Counter(days[days.str.match(r"\d{4}-\d{2}-\d{2}")].value_counts().to_dict())
+        subjects = appointments_df['Teacher_ID'].astype(str).map(agg.teacher_subjects)
+        agg.subject_counts = Counter(subjects.dropna().value_counts().to_dict())
+        agg._heap = [(-count, name) for name, count in agg.teacher_counts.items()]
+        heapq.heapify(agg._heap)
+        return agg
+
+    def add(self, row):
+        with self._lock:
+            self.total += 1
+            name = row.get('Teacher_Name')
+            if name:
+                self.teacher_counts[name] += 1
+                heapq.heappush(self._heap, (-self.teacher_counts[name], name))
+            day = str(row.get('Date', ''))[:10]
+            if day:
+                self.day_counts[day] += 1
+            subject = self.teacher_subjects.get(str(row.get('Teacher_ID')))
+            if subject:
+                self.subject_counts[subject] += 1
+            if len(self._heap) > 4 * len(self.teacher_counts) + 16:
+                self._heap = [(-c, n) for n, c in self.teacher_counts.items()]
+                heapq.heapify(self._heap)
+
+    def top_teachers(self, k=3):
+        """Returns [(teacher_name, count)] for the k most booked teachers."""
+        with self._lock:
+            result, keep, seen = [], [], set()
+            while self._heap and len(result) < k:
+                entry = heapq.heappop(self._heap)
+                count, name = -entry[0], entry[1]
+                if name in seen or self.teacher_counts.get(name) != count:
+                    continue
+                seen.add(name)
+                keep.append(entry)
+                result.append((name, count))
+            for entry in keep:
+                heapq.heappush(self._heap, entry)
+            return result
+
+    def most_booked_teacher(self):
+        top = self.top_teachers(1)
+        return top[0][0] if top else None
+
+    def teacher_frame(self):
+        with self._lock:
+            rows = self.teacher_counts.most_common()
+        return pd.DataFrame(rows, columns=['Teacher_Name', 'Bookings'])
+
+    def daily_frame(self):
+        with self._lock:
+            rows = sorted(self.day_counts.items())
+        df = pd.DataFrame(rows, columns=['Date', 'Count'])
+        df['Date'] = pd.to_datetime(df['Date'])
+        return df
+
+    def subject_frame(self):
+        with self._lock:
+            rows = self.subject_counts.most_common()
+        return pd.DataFrame(rows, columns=['Subject', 'Count'])
+
+
+def aggregates_version():
+    return (get_storage().version("appointments"), data_version("teachers"))
+
+
+def _build():
+    return AppointmentAggregates.from_frame(get_storage().appointments(), load_dataset("teachers"))
+
+
+def get_aggregates():
+    """Returns the aggregates for the current appointments/teachers version."""
+    return load_cached(CACHE_KEY, aggregates_version(), _build)
+
+
+def add_appointment(row, write):
+    """
+    Runs write() for one new appointment and folds it into the cached
+    aggregates, re-tagged with the table's new version so the write doesn't
+    trigger a full rebuild.
+    """
+    agg = get_aggregates()
+    write()
+    agg.add(row)
+    store_cached(CACHE_KEY, aggregates_version(), agg)
+
+
+def rebuild_aggregates():
+    """Recomputes everything from the full appointments table."""
+    agg = _build()
+    store_cached(CACHE_KEY, aggregates_version(), agg)
+    return agg
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+from modules.data_store import load_cached
+from modules.storage import get_storage
+
+QUESTIONS_PER_QUIZ = 10
+
+TIMELINE_COLUMNS = ["DateTime", "Type", "Detail"]
+
+
+class StudentAnalytics:
+    """
+    Per-student progress figures for every student, computed in one
+    vectorized pass over quiz_results and student_thoughts. After that a
+    report page is a dictionary lookup plus a slice.
+    """
+
+    def __init__(self, quiz_df, thoughts_df):
+        quiz = pd.DataFrame({
+            "Student_ID": quiz_df['Student_ID'].astype(str),
+            "DateTime": pd.to_datetime(quiz_df['DateTime'], errors='coerce'),
+            "Score": pd.to_numeric(quiz_df['Score'], errors='coerce'),
+        })
+        if 'Total_Questions' in quiz_df.columns:
+            quiz['Total_Questions'] = pd.to_numeric(quiz_df['Total_Questions'], errors='coerce')
+        else:
+            quiz['Total_Questions'] = QUESTIONS_PER_QUIZ
+        quiz = quiz.sort_values(['Student_ID', 'DateTime'], kind='stable').reset_index(drop=True)
+        self.quiz = quiz
+
+        grouped = quiz.groupby('Student_ID', sort=False)
+        summary = grouped.agg(
+            total_quizzes=('Score', 'size'),
+            avg_score=('Score', 'mean'),
+            correct_total=('Score', 'sum'),
+            total_attempts=('Total_Questions', 'sum'),
+        )
+        summary['wrong_total'] = summary['total_attempts'] - summary['correct_total']
+
+        # Competition ranking by average score: rank = 1 + number of students
+        # with a strictly higher average, found by binary search.
+        self._sorted_neg_avg = np.sort(-summary['avg_score'].to_numpy())
+        summary['rank'] = np.searchsorted(self._sorted_neg_avg, -summary['avg_score'].to_numpy(), side='left') + 1
+        self.total_ranked = len(summary)
+
+        thought_ids = thoughts_df['Student_ID'].astype(str)
+        self.thought_counts = thought_ids.value_counts().to_dict()
+
+        # Latest name each student used, preferring quiz submissions.
+        names = pd.concat([
+            pd.Series(thoughts_df['Student_Name'].to_numpy(), index=thought_ids.to_numpy()),
+            pd.Series(quiz_df['Name'].to_numpy(), index=quiz_df['Student_ID'].astype(str).to_numpy()),
+        ])
+        self.names = names[~names.index.duplicated(keep='last')].to_dict()
+        self.summary = summary.to_dict('index')
+        self._quiz_rows = grouped.indices
+
+        thoughts = pd.DataFrame({
+            "Student_ID": thought_ids,
+            "DateTime": pd.to_datetime(thoughts_df['Date'], errors='coerce'),
+            "Type": "Thought",
+            "Detail": thoughts_df['Thought'],
+        })
+        quiz_events = pd.DataFrame({
+            "Student_ID": quiz['Student_ID'],
+            "DateTime": quiz['DateTime'],
+            "Type": "Quiz",
+            "Detail": "Score " + quiz['Score'].map("{:g}".format) + " / "
+                      + quiz['Total_Questions'].map("{:g}".format),
+        })
+        timeline = pd.concat([quiz_events, thoughts], ignore_index=True)
+        timeline = timeline.sort_values(['Student_ID', 'DateTime'], ascending=[True, False],
+                                        kind='stable', na_position='last').reset_index(drop=True)
+        self.timeline_frame = timeline
+        self._timeline_rows = timeline.groupby('Student_ID', sort=False).indices
+
+    def student_ids(self):
+        return sorted(self.names)
+
+    def student_name(self, student_id):
+        return self.names.get(str(student_id), "")
+
+    def rank_for_score(self, avg_score):
+        """Rank an average score would get among all ranked students."""
+        return int(np.searchsorted(self._sorted_neg_avg, -avg_score, side='left')) + 1
+
+    def student_summary(self, student_id):
+        student_id = str(student_id)
+        row = self.summary.get(student_id)
+        total_thoughts = int(self.thought_counts.get(student_id, 0))
+        if row is None:
+            return {
+                "total_quizzes": 0, "avg_score": 0, "total_thoughts": total_thoughts,
+                "correct_total": 0, "wrong_total": 0, "rank": None,
+                "total_students": self.total_ranked,
+            }
+        return {
+            "total_quizzes": int(row['total_quizzes']),
+            "avg_score": round(float(row['avg_score']), 2),
+            "total_thoughts": total_thoughts,
+            "correct_total": int(row['correct_total']),
+            "wrong_total": int(row['wrong_total']),
+            "rank": int(row['rank']),
+            "total_students": self.total_ranked,
+        }
+
+    def quiz_history(self, student_id):
+        rows = self._quiz_rows.get(str(student_id))
+        if rows is None:
+            return self.quiz.iloc[0:0]
+        return self.quiz.iloc[rows]
+
+    def timeline(self, student_id):
+        """Quiz and thought events for one student, most recent first."""
+        rows = self._timeline_rows.get(str(student_id))
+        if rows is None:
+            return pd.DataFrame(columns=TIMELINE_COLUMNS)
+        return self.timeline_frame.iloc[rows][TIMELINE_COLUMNS].reset_index(drop=True)
+
+
+def analytics_version():
+    storage = get_storage()
+    return (storage.version("quiz_results"), storage.version("thoughts"))
+
+
+def get_student_analytics():
+    """Returns analytics for the current version of quiz results and thoughts."""
+    storage = get_storage()
+    return load_cached("student_analytics", analytics_version(),
+                       lambda: StudentAnalytics(storage.quiz_results(), storage.thoughts()))
@@ -1,33 +1,31 @@
 import streamlit as st
 import pandas as pd
-import os
-
-APPOINTMENTS_FILE = "data/appointments.csv"
+from modules.storage import get_storage
+from modules.availability import available_slots, book_slot
+from modules.aggregates import add_appointment
 
 def ensure_appointments_file():
-    headers = ["Student_Name", "Student_ID", "Teacher_ID", "Teacher_Name", "Slot", "Date"]
-    if not os.path.exists(APPOINTMENTS_FILE) or os.stat(APPOINTMENTS_FILE).st_size == 0:
-        with open(APPOINTMENTS_FILE, "w") as f:
-            f.write(",".join(headers) + "\n")
+    """
+    Makes sure the storage backend is initialised (CSV headers written or
+    SQLite schema created).
+    """
+    return get_storage()
 
 
 def show_calendar(teacher_row):
     """
-    Returns list of clickable slots for a teacher.
+    Returns list of clickable slots for a teacher: the free window split into
+    fixed-length slots for each available day of the coming week, minus
+    slots that are already booked.
     """
-    free_start = teacher_row['Free_Start']
-    free_end = teacher_row['Free_End']
-    days = teacher_row['Available_Days'].split(",")
-    slots = [f"{day} {free_start}-{free_end}" for day in days]
-    return slots
+    return available_slots(teacher_row)
 
 
 def book_appointment(student_name, student_id, teacher_row, slot):
     """
-    Appends a new appointment entry into the CSV file.
-    Automatically writes headers if file is empty.
+    Appends a new appointment entry through the storage backend.
+    Returns False (and writes nothing) if the slot was booked meanwhile.
     """
-    ensure_appointments_file() 
 
     data = {
         "Student_Name": student_name,
@@ -38,12 +36,16 @@ def book_appointment(student_name, student_id, teacher_row, slot):
         "Date": pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")
     }
 
-    df = pd.DataFrame([data])
+    def _write():
+        add_appointment(data, lambda: get_storage().add_appointment(data))
 
-    df.to_csv(APPOINTMENTS_FILE, mode='a', index=False, header=False)
+    if not book_slot(teacher_row['Teacher_ID'], slot, _write):
+        st.error(f"Sorry, {slot} with {teacher_row['Teacher_Name']} was just booked. Please pick another slot.")
+        return False
 
     st.success(f"Appointment booked for {teacher_row['Teacher_Name']} at {slot}")
     st.balloons()
+    return True
 
 
 def get_appointments_by_student(student_id):
@@ -51,12 +53,8 @@ def get_appointments_by_student(student_id):
     Returns all appointments for a specific student ID.
     If the file is empty, returns an empty DataFrame safely.
     """
-    ensure_appointments_file()
     try:
-        df = pd.read_csv(APPOINTMENTS_FILE)
-        if "Student_ID" not in df.columns:
-            return pd.DataFrame()
-        return df[df['Student_ID'].astype(str) == str(student_id)]
+        return get_storage().appointments_for_student(student_id)
     except pd.errors.EmptyDataError:
         return pd.DataFrame()
     except Exception as e:
@@ -0,0 +1,213 @@
+import time
+import random
+import argparse
+import threading
+from collections import deque
+from datetime import datetime
+import numpy as np
+from modules.data_store import load_cached, data_version
+from modules.teacher_search import get_teacher_index
+from modules.availability import WEEKDAYS, expand_days, format_minutes, to_minutes
+from modules.intent_model import get_intent_model
+from modules.faq import answer_faq_batch, MIN_SCORE as FAQ_MIN_SCORE
+
+TEACHER_INTENTS = ("find_location", "check_availability", "book_appointment")
+GREETING_ANSWER = "Hello! Ask me where a teacher sits or when they are free, by name or ID."
+FALLBACK_ANSWER = "Sorry, I can only help with teacher locations, free times and appointments."
+NO_TEACHER_ANSWER = "I couldn't tell which teacher you mean. Try their full name or ID (e.g. T101)."
+
+# Recent batches kept for the latency percentiles.
+LATENCY_WINDOW = 2000
+
+# Same templates the notebook trains on, used to generate benchmark traffic.
+QUERY_TEMPLATES = [
+    "Where is {name}?", "{tid} kaha milenge?", "{name} abhi kahan hain?", "{tid} ki location kya hai?",
+    "Is {name} free right now?", "{tid} ka free time kab hai?", "When is {name} available?",
+    "Book appointment with {name} at 2 PM", "Can I meet {name} tomorrow?", "{tid} se baat karni hai",
+    "Hi", "Namaste", "Tell me a joke",
+]
+
+
+class TeacherRecords:
+    """
+    Answer material for every teacher, aligned with the search index's
+    positions and built once per roster version: the location sentence,
+    the free window in minutes and a Mon..Sun mask of working days.
+    """
+
+    def __init__(self, teacher_df):
+        df = teacher_df.reset_index(drop=True)
+        self.labels = (df['Teacher_Name'].astype(str) + " (" + df['Teacher_ID'].astype(str) + ")").tolist()
+        self.locations = (df['Teacher_Name'].astype(str) + " (" + df['Teacher_ID'].astype(str) + ", "
+                          + df['Subject'].astype(str) + ") sits in cabin " + df['Cabin_Number'].astype(str)
+                          + ", " + df['Block'].astype(str) + ", and lectures in room "
+                          + df['Room_Number'].astype(str) + ".").tolist()
+        # Times repeat across the roster: parse each distinct one once.
+        to_min = lambda col: df[col].astype(str).map(
+            {t: to_minutes(t) for t in df[col].astype(str).unique()}).to_numpy(dtype=int)
+        self.free_start = to_min('Free_Start')
+        self.free_end = to_min('Free_End')
+        day_masks = {d: [w in expand_days(d) for w in WEEKDAYS] for d in df['Available_Days'].astype(str).unique()}
+        self.days = np.array([day_masks[d] for d in df['Available_Days'].astype(str)], dtype=bool).reshape(-1, 7)
+
+    def availability(self, pos, now):
+        """Whether the teacher is free at `now`, else their next free window this week."""
+        minute = now.hour * 60 + now.minute
+        start, end = self.free_start[pos], self.free_end[pos]
+        today = now.weekday()
+        window = f"{format_minutes(start)}-{format_minutes(end)}"
+        if self.days[pos, today] and start <= minute < end:
+            return f"{self.labels[pos]} is free right now, until {format_minutes(end)}."
+        for k in range(8):
+            day = (today + k) % 7
+            if self.days[pos, day] and (k or minute < start):
+                when = "today" if k == 0 else "tomorrow" if k == 1 else f"on {WEEKDAYS[day]}"
+                return f"{self.labels[pos]} is next free {when}, {window}."
+        return f"{self.labels[pos]} has no free hours listed."
+
+    def answer(self, intent, pos, now):
+        if intent == "find_location":
+            return self.locations[pos]
+        if intent == "check_availability":
+            return self.availability(pos, now)
+        return (f"{self.availability(pos, now)} You can book a slot on the Book Appointment page.")
+
+
+class LatencyTracker:
+    """Rolling window of (queries, milliseconds) per call, for percentile reporting."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, queries, ms):
+        with self._lock:
+            self._samples.append((queries, ms))
+
+    def percentiles(self):
+        with self._lock:
+            samples = np.array(self._samples, dtype=float).reshape(-1, 2)
+        if not len(samples):
+            return {"calls": 0}
+        per_call = samples[:, 1]
+        per_query = per_call / samples[:, 0]
+        p = lambda values, q: round(float(np.percentile(values, q)), 3)
+        return {
+            "calls": len(samples),
+            "queries": int(samples[:, 0].sum()),
+            "call_ms": {"p50": p(per_call, 50), "p95": p(per_call, 95), "p99": p(per_call, 99)},
+            "per_query_ms": {"p50": p(per_query, 50), "p95": p(per_query, 95), "p99": p(per_query, 99)},
+            "queries_per_sec": round(float(samples[:, 0].sum() / per_call.sum() * 1000), 1),
+        }
+
+
+_latency = LatencyTracker()
+
+
+def get_teacher_records():
+    """Returns the answer records for the current version of the teacher dataset."""
+    return load_cached("assistant_records", data_version("teachers"),
+                       lambda: TeacherRecords(get_teacher_index().df))
+
+
+def answer_queries(texts, now=None):
+    """
+    Answers a batch of free-text questions. Intents come from one model
+    call over the whole batch (one vectorizer transform for the uncached
+    texts); teachers are resolved through the search index and answered
+    from the precomputed records. Anything left over is looked up in the
+    student FAQ. Returns one dict per text with query, intent, teacher_id
+    and answer.
+    """
+    start = time.perf_counter()
+    now = now or datetime.now()
+    texts = [str(t) for t in texts]
+    intents = get_intent_model().predict_intents(texts)
+    index = get_teacher_index()
+    records = get_teacher_records()
+
+    results = []
+    unanswered = []
+    for text, intent in zip(texts, intents):
+        teacher_id = None
+        if intent in TEACHER_INTENTS:
+            pos = index.find_mention(text)
+            if pos is None:
+                answer = NO_TEACHER_ANSWER
+                unanswered.append(len(results))
+            else:
+                teacher_id = index.df['Teacher_ID'].iat[pos]
+                answer = records.answer(intent, pos, now)
+        elif intent == "greeting":
+            answer = GREETING_ANSWER
+        else:
+            answer = FALLBACK_ANSWER
+            unanswered.append(len(results))
+        results.append({"query": text, "intent": intent, "teacher_id": teacher_id, "answer": answer})
+
+    # Questions that aren't about a known teacher may still be in the student FAQ.
+    if unanswered:
+        for i, hits in zip(unanswered, answer_faq_batch([texts[i] for i in unanswered], k=1)):
+            if hits and hits[0]['score'] >= FAQ_MIN_SCORE:
+                results[i].update(intent="faq", answer=hits[0]['answer'])
+
+    if texts:
+        _latency.add(len(texts), (time.perf_counter() - start) * 1000)
+    return results
+
+
+def answer_query(text, now=None):
+    return answer_queries([text], now)[0]
+
+
+def latency_stats():
+    return _latency.percentiles()
+
+
+def sample_queries(n, seed=0):
+    """`n` questions in the notebook's templates over the current roster."""
+    rng = random.Random(seed)
+    df = get_teacher_index().df
+    names, ids = df['Teacher_Name'].astype(str).tolist(), df['Teacher_ID'].astype(str).tolist()
+    queries = []
+    for _ in range(n):
+        i = rng.randrange(len(names))
+        queries.append(rng.choice(QUERY_TEMPLATES).format(name=names[i], tid=ids[i]))
+    return queries
+
+
+def benchmark(queries=10_000, batch_size=1000, singles=200):
+    """Answers `queries` generated questions in batches, then `singles` one at a time."""
+    get_intent_model().warm_up()
+    texts = sample_queries(queries)
+    # Distinct from the batch texts so the single calls miss the LRU too.
+    singles_texts = [t + " please" for t in sample_queries(singles, seed=1)]
+    batch_tracker, single_tracker = LatencyTracker(), LatencyTracker()
+    for i in range(0, len(texts), batch_size):
+        chunk = texts[i:i + batch_size]
+        t0 = time.perf_counter()
+        answer_queries(chunk)
+        batch_tracker.add(len(chunk), (time.perf_counter() - t0) * 1000)
+    for text in singles_texts:
+        t0 = time.perf_counter()
+        answer_query(text)
+        single_tracker.add(1, (time.perf_counter() - t0) * 1000)
+    return {"batched": batch_tracker.percentiles(), "single": single_tracker.percentiles()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ask the teacher assistant from the command line.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ask = sub.add_parser("ask", help="answer one or more questions")
+    ask.add_argument("questions", nargs="+")
+    bench = sub.add_parser("bench", help="latency percentiles over generated questions")
+    bench.add_argument("--queries", type=int, default=10_000)
+    bench.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.command == "ask":
+        for row in answer_queries(args.questions):
+            print(f"[{row['intent']}] {row['query']}\n  {row['answer']}")
+    else:
+        for mode, stats in benchmark(args.queries, args.batch_size).items():
+            print(f"{mode:8s} {stats}")
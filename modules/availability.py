@@ -0,0 +1,256 @@
+import re
+import bisect
+import threading
+from datetime import datetime, date, timedelta
+import numpy as np
+import pandas as pd
+from modules.data_store import load_cached, store_cached
+from modules.storage import get_storage
+
+SLOT_MINUTES = 30
+DAYS_AHEAD = 7
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+_FULL_DAY_NAMES = dict(zip(WEEKDAYS, ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]))
+
+# Slot labels look like "Mon 2025-10-13 12:00-12:30". Older bookings used the
+# undated "Mon-Fri 12:00-13:00" form; those are kept but can't conflict.
+_SLOT_RE = re.compile(r"^(?:[A-Za-z]{3} )?(\d{4}-\d{2}-\d{2}) (\d{1,2}:\d{2})-(\d{1,2}:\d{2})$")
+
+_booking_lock = threading.Lock()
+
+
+def _day_name(token):
+    """"mon", "Monday" -> "Mon"; None if `token` isn't a weekday."""
+    token = token.strip().title()
+    return next((d for d in WEEKDAYS if token in (d, _FULL_DAY_NAMES[d])), None)
+
+
+def parse_days(available_days):
+    """
+    (days, ok) for a day string: the working days in week order, and whether
+    every comma-separated part was a day or a day range. Ingest validates
+    with `ok`; the rest of the app just uses the days it could read.
+    """
+    days = set()
+    ok = True
+    for part in str(available_days).split(","):
+        if not part.strip():
+            continue
+        if "-" in part:
+            first, last = (_day_name(p) for p in part.split("-", 1))
+            if first and last:
+                i, j = WEEKDAYS.index(first), WEEKDAYS.index(last)
+                span = (j - i) % 7
+                days.update(WEEKDAYS[(i + k) % 7] for k in range(span + 1))
+                continue
+        elif _day_name(part):
+            days.add(_day_name(part))
+            continue
+        ok = False
+    return [d for d in WEEKDAYS if d in days], ok and bool(days)
+
+
+def expand_days(available_days):
+    """
+    "Mon-Fri" -> [Mon, Tue, Wed, Thu, Fri]; "Fri,Thu,Mon" -> [Mon, Thu, Fri].
+    Ranges may wrap ("Sat-Mon"), be spelled out ("Monday - Friday") and can
+    be mixed with single days.
+    """
+    return parse_days(available_days)[0]
+
+
+def to_minutes(hhmm):
+    hours, minutes = str(hhmm).strip().split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def format_minutes(total):
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+
+def format_minutes_array(minutes):
+    """format_minutes over a whole Series/array at once."""
+    minutes = pd.Series(minutes).astype(int)
+    return (minutes // 60).astype(str).str.zfill(2) + ":" + (minutes % 60).astype(str).str.zfill(2)
+
+
+def split_window(free_start, free_end, slot_minutes=SLOT_MINUTES):
+    """Splits a free window into (start, end) minute pairs of slot_minutes each."""
+    start, end = to_minutes(free_start), to_minutes(free_end)
+    return [(s, s + slot_minutes) for s in range(start, end - slot_minutes + 1, slot_minutes)]
+
+
+def slot_label(day, start, end):
+    return f"{WEEKDAYS[day.weekday()]} {day.isoformat()} {format_minutes(start)}-{format_minutes(end)}"
+
+
+def parse_slot(label):
+    """Returns (date_iso, start_min, end_min) for a dated slot label, else None."""
+    m = _SLOT_RE.match(str(label).strip())
+    if not m:
+        return None
+    return m.group(1), to_minutes(m.group(2)), to_minutes(m.group(3))
+
+
+class BookingIndex:
+    """
+    Booked intervals per (teacher, date), kept as parallel sorted arrays of
+    start and end minutes so conflict checks are a bisect: O(log n).
+    """
+
+    def __init__(self):
+        self._starts = {}
+        self._ends = {}
+
+    @classmethod
+    def from_appointments(cls, appointments_df):
+        index = cls()
+        if appointments_df.empty:
+            return index
+        for tid, slot in zip(appointments_df['Teacher_ID'].astype(str), appointments_df['Slot']):
+            parsed = parse_slot(slot)
+            if parsed:
+                index.add(tid, *parsed)
+        return index
+
+    def _find(self, starts, ends, start, end):
+        i = bisect.bisect_right(starts, start)
+        if i > 0 and ends[i - 1] > start:
+            return i - 1
+        if i < len(starts) and starts[i] < end:
+            return i
+        return None
+
+    def is_free(self, teacher_id, day_iso, start, end):
+        key = (str(teacher_id), day_iso)
+        starts = self._starts.get(key)
+        if not starts:
+            return True
+        return self._find(starts, self._ends[key], start, end) is None
+
+    def add(self, teacher_id, day_iso, start, end):
+        key = (str(teacher_id), day_iso)
+        starts = self._starts.setdefault(key, [])
+        ends = self._ends.setdefault(key, [])
+        i = bisect.bisect_left(starts, start)
+        starts.insert(i, start)
+        ends.insert(i, end)
+
+    def booked(self, teacher_id, day_iso):
+        key = (str(teacher_id), day_iso)
+        return list(zip(self._starts.get(key, []), self._ends.get(key, [])))
+
+    def frame(self):
+        """All booked intervals as a DataFrame, for vectorized joins."""
+        rows = [(tid, day, s, e)
+                for (tid, day), starts in self._starts.items()
+                for s, e in zip(starts, self._ends[(tid, day)])]
+        return pd.DataFrame(rows, columns=['Teacher_ID', 'Date', 'Start', 'End'])
+
+
+def get_booking_index():
+    """Returns the booking index for the current version of the appointments table."""
+    storage = get_storage()
+    return load_cached("booking_index", storage.version("appointments"),
+                       lambda: BookingIndex.from_appointments(storage.appointments()))
+
+
+def _upcoming_days(days_ahead, today=None):
+    today = today or date.today()
+    return [today + timedelta(days=k) for k in range(days_ahead)]
+
+
+def available_slots(teacher_row, days_ahead=DAYS_AHEAD, slot_minutes=SLOT_MINUTES, now=None):
+    """
+    Returns dated, bookable slot labels for one teacher over the next
+    `days_ahead` days, skipping slots that are booked or already past.
+    """
+    now = now or datetime.now()
+    days = set(expand_days(teacher_row['Available_Days']))
+    window = split_window(teacher_row['Free_Start'], teacher_row['Free_End'], slot_minutes)
+    index = get_booking_index()
+    tid = teacher_row['Teacher_ID']
+    now_minutes = now.hour * 60 + now.minute
+
+    slots = []
+    for day in _upcoming_days(days_ahead, now.date()):
+        if WEEKDAYS[day.weekday()] not in days:
+            continue
+        day_iso = day.isoformat()
+        for start, end in window:
+            if day == now.date() and start <= now_minutes:
+                continue
+            if index.is_free(tid, day_iso, start, end):
+                slots.append(slot_label(day, start, end))
+    return slots
+
+
+def book_slot(teacher_id, slot, write):
+    """
+    Conflict-checks `slot` and calls write() only if it is still free, all
+    under one lock so two sessions can't book the same slot. The booking is
+    then added to the cached index in place, re-tagged with the table's new
+    version, so the write doesn't force a rebuild. Returns False on conflict.
+    """
+    parsed = parse_slot(slot)
+    with _booking_lock:
+        index = get_booking_index()
+        if parsed is not None and not index.is_free(teacher_id, *parsed):
+            return False
+        write()
+        if parsed is not None:
+            index.add(teacher_id, *parsed)
+        store_cached("booking_index", get_storage().version("appointments"), index)
+    return True
+
+
+def weekly_availability(teacher_df, week_start=None, slot_minutes=SLOT_MINUTES):
+    """
+    Availability of every teacher for the 7 days from `week_start` in one
+    vectorized pass. Returns one row per slot with Teacher_ID, Date, Start,
+    End, Slot and Booked.
+    """
+    week_start = week_start or date.today()
+    week = pd.to_datetime([week_start + timedelta(days=k) for k in range(7)])
+    weekday_names = np.array([WEEKDAYS[d.weekday()] for d in week])
+
+    tids = teacher_df['Teacher_ID'].astype(str).to_numpy()
+    starts = pd.to_timedelta(teacher_df['Free_Start'].astype(str) + ":00").dt.total_seconds().to_numpy() // 60
+    ends = pd.to_timedelta(teacher_df['Free_End'].astype(str) + ":00").dt.total_seconds().to_numpy() // 60
+    n_slots = np.maximum((ends - starts) // slot_minutes, 0).astype(int)
+
+    # teachers x 7 mask of working days; day strings repeat across the
+    # roster, so each distinct one is expanded once and broadcast by code.
+    codes, patterns = pd.factorize(teacher_df['Available_Days'].astype(str))
+    pattern_masks = np.array([np.isin(weekday_names, expand_days(p)) for p in patterns],
+                             dtype=bool).reshape(-1, len(weekday_names))
+    mask = pattern_masks[codes]
+    if mask.size == 0:
+        return pd.DataFrame(columns=['Teacher_ID', 'Date', 'Start', 'End', 'Slot', 'Booked'])
+    t_idx, d_idx = np.nonzero(mask)
+
+    per_pair = n_slots[t_idx]
+    t_rep = np.repeat(t_idx, per_pair)
+    d_rep = np.repeat(d_idx, per_pair)
+    offsets = np.arange(per_pair.sum()) - np.repeat(np.cumsum(per_pair) - per_pair, per_pair)
+    slot_start = (starts[t_rep] + offsets * slot_minutes).astype(int)
+
+    out = pd.DataFrame({
+        'Teacher_ID': tids[t_rep],
+        'Date': week[d_rep].strftime("%Y-%m-%d"),
+        'Start': slot_start,
+        'End': slot_start + slot_minutes,
+    })
+    out['Slot'] = (weekday_names[d_rep] + " " + out['Date'] + " "
+                   + format_minutes_array(out['Start']) + "-" + format_minutes_array(out['End']))
+
+    booked = get_booking_index().frame()
+    if booked.empty:
+        out['Booked'] = False
+        return out
+    # Overlap test per (teacher, date): a slot is booked if some booking starts
+    # before the slot ends and ends after it starts.
+    merged = out.reset_index().merge(booked, on=['Teacher_ID', 'Date'], how='inner', suffixes=('', '_b'))
+    hit = merged.loc[(merged['Start_b'] < merged['End']) & (merged['End_b'] > merged['Start']), 'index']
+    out['Booked'] = out.index.isin(hit.unique())
+    return out
@@ -0,0 +1,145 @@
+import os
+import io
+import re
+import time
+import zipfile
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+from modules.analytics import get_student_analytics, TIMELINE_COLUMNS
+
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def _report_filename(student_id):
+    """
+    File (and zip entry) name for a student's report. Student IDs are typed
+    in by users, so anything outside [A-Za-z0-9_-] is replaced and a path
+    like "../../x" can't leave the output directory. None if nothing is left.
+    """
+    safe = _UNSAFE_CHARS.sub("_", str(student_id)).strip("_")
+    return f"{safe}_progress_report.pdf" if safe else None
+
+
+def report_filenames(student_ids):
+    """
+    ({student_id: filename}, [skipped ids]). IDs whose name would be empty
+    or collide with an earlier ID's are skipped rather than overwriting it.
+    """
+    names, skipped, taken = {}, [], set()
+    for sid in student_ids:
+        name = _report_filename(sid)
+        if name is None or name in taken:
+            skipped.append(sid)
+        else:
+            names[sid] = name
+            taken.add(name)
+    return names, skipped
+
+
+def _build_report(job):
+    """Runs in a worker process: turns one pre-computed job into PDF bytes."""
+    from modules.pdf_generator import generate_pdf_report
+    from modules.charts import render_student_charts
+    student_id, name, summary, timeline_rows, dates, scores = job
+    timeline_df = pd.DataFrame(timeline_rows, columns=TIMELINE_COLUMNS)
+    charts = render_student_charts(dates, scores, summary['correct_total'], summary['wrong_total'])
+    images = {k: io.BytesIO(v) for k, v in charts.items() if v}
+    return student_id, generate_pdf_report(name, student_id, summary, timeline_df, images)
+
+
+def build_jobs(student_ids=None, analytics=None):
+    """
+    One picklable job per student, taken from the vectorized analytics so
+    workers never re-read the CSVs.
+    """
+    analytics = analytics or get_student_analytics()
+    ids = analytics.student_ids() if student_ids is None else [str(s) for s in student_ids]
+    jobs = []
+    for sid in ids:
+        timeline = analytics.timeline(sid)
+        history = analytics.quiz_history(sid)
+        jobs.append((sid, analytics.student_name(sid), analytics.student_summary(sid),
+                     list(timeline.itertuples(index=False, name=None)),
+                     history['DateTime'].tolist(), history['Score'].tolist()))
+    return jobs
+
+
+def generate_bulk_reports(output, student_ids=None, workers=None, progress=None):
+    """
+    Generates progress-report PDFs for all students (or `student_ids`) in a
+    process pool. `output` is a .zip path, a directory, or a writable binary
+    file object (written as a zip). Finished PDFs are streamed out as they
+    complete. `progress(done, total)` is called after each report.
+    Returns throughput stats.
+    """
+    start = time.perf_counter()
+    jobs = build_jobs(student_ids)
+    filenames, skipped = report_filenames([job[0] for job in jobs])
+    jobs = [job for job in jobs if job[0] in filenames]
+    total = len(jobs)
+
+    to_dir = isinstance(output, (str, os.PathLike)) and not str(output).endswith(".zip")
+    if to_dir:
+        os.makedirs(output, exist_ok=True)
+        archive = None
+    else:
+        archive = zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED)
+
+    done = 0
+    total_bytes = 0
+    try:
+        # Spawned, not forked: forking the multithreaded Streamlit server can
+        # copy a lock some other thread holds into the child.
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(_build_report, job) for job in jobs]
+            for future in as_completed(futures):
+                sid, pdf_bytes = future.result()
+                if archive is not None:
+                    archive.writestr(filenames[sid], pdf_bytes)
+                else:
+                    with open(os.path.join(output, filenames[sid]), "wb") as f:
+                        f.write(pdf_bytes)
+                done += 1
+                total_bytes += len(pdf_bytes)
+                if progress:
+                    progress(done, total)
+    finally:
+        if archive is not None:
+            archive.close()
+
+    seconds = time.perf_counter() - start
+    return {
+        "reports": done,
+        "seconds": round(seconds, 3),
+        "reports_per_sec": round(done / seconds, 2) if seconds > 0 else None,
+        "bytes": total_bytes,
+        "skipped": skipped,
+    }
+
+
+def generate_bulk_reports_zip(student_ids=None, workers=None, progress=None):
+    """Same as generate_bulk_reports but returns (zip_bytes, stats) for download buttons."""
+    buffer = io.BytesIO()
+    stats = generate_bulk_reports(buffer, student_ids, workers, progress)
+    return buffer.getvalue(), stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate progress-report PDFs for many students.")
+    parser.add_argument("--out", default="progress_reports.zip", help="output .zip file or directory")
+    parser.add_argument("--students", nargs="*", help="student IDs (default: all)")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    def _print_progress(done, total):
+        print(f"\r{done}/{total} reports", end="", flush=True)
+
+    stats = generate_bulk_reports(args.out, args.students, args.workers, _print_progress)
+    print()
+    print(f"Wrote {stats['reports']} reports to {args.out} in {stats['seconds']}s "
+          f"({stats['reports_per_sec']} reports/sec)")
+    if stats["skipped"]:
+        print(f"Skipped {len(stats['skipped'])} student IDs with no usable file name: {stats['skipped']}")
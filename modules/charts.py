@@ -0,0 +1,101 @@
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from modules.analytics import get_student_analytics, analytics_version
+
+CHART_WORKERS = 4
+CACHE_SIZE = 256
+
+_executor = ThreadPoolExecutor(max_workers=CHART_WORKERS, thread_name_prefix="chart-render")
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def _to_png(fig):
+    FigureCanvasAgg(fig)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    return buf.getvalue()
+
+
+def render_score_chart(dates, scores):
+    """Quiz scores over time as PNG bytes. Uses its own Figure, so it is safe to call from any thread."""
+    fig = Figure(figsize=(8, 5))
+    ax = fig.add_subplot()
+    ax.plot(dates, scores, marker='o', linestyle='-', color='green')
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Score")
+    ax.set_title("Quiz Scores Over Time")
+    ax.tick_params(axis='x', labelrotation=20)
+    ax.grid(True)
+    return _to_png(fig)
+
+
+def render_correct_wrong_chart(correct_total, wrong_total):
+    fig = Figure(figsize=(6, 6))
+    ax = fig.add_subplot()
+    ax.pie([correct_total, wrong_total],
+           labels=['Correct', 'Wrong'],
+           colors=['#4CAF50', '#FF5722'],
+           autopct='%1.1f%%',
+           startangle=90,
+           explode=(0.05, 0.05))
+    ax.set_title("Correct vs Wrong Answers")
+    return _to_png(fig)
+
+
+def render_student_charts(dates, scores, correct_total, wrong_total):
+    """
+    Returns {'scores_png': bytes|None, 'correct_wrong_png': bytes|None};
+    both are None when the student has no quizzes.
+    """
+    if len(scores) == 0:
+        return {'scores_png': None, 'correct_wrong_png': None}
+    return {
+        'scores_png': render_score_chart(dates, scores),
+        'correct_wrong_png': render_correct_wrong_chart(correct_total, wrong_total),
+    }
+
+
+def _forget_failed(key):
+    def callback(future):
+        if future.exception() is not None:
+            with _lock:
+                if _cache.get(key) is future:
+                    del _cache[key]
+    return callback
+
+
+def student_charts_async(student_id):
+    """
+    Returns a Future for the student's chart PNGs, cached by
+    (student_id, data version). Renders run on a small thread pool so
+    several reports don't serialize on matplotlib in the request thread;
+    concurrent requests for the same student share one render.
+    """
+    student_id = str(student_id)
+    key = (student_id, analytics_version())
+    with _lock:
+        future = _cache.get(key)
+        if future is not None:
+            _cache.move_to_end(key)
+            return future
+
+        analytics = get_student_analytics()
+        history = analytics.quiz_history(student_id)
+        summary = analytics.student_summary(student_id)
+        future = _executor.submit(render_student_charts,
+                                  history['DateTime'].tolist(), history['Score'].tolist(),
+                                  summary['correct_total'], summary['wrong_total'])
+        _cache[key] = future
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    future.add_done_callback(_forget_failed(key))
+    return future
+
+
+def student_charts(student_id, timeout=60):
+    return student_charts_async(student_id).result(timeout)
@@ -0,0 +1,172 @@
+import os
+import csv
+import queue
+import atexit
+import threading
+import time
+from modules.data_store import bump_generation
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; rows are still serialised by the single writer thread
+    fcntl = None
+
+# How long the writer waits to gather more rows into one batch (seconds).
+FLUSH_INTERVAL = float(os.environ.get("TEACHER_ASSISTANT_FLUSH_INTERVAL", "0.05"))
+MAX_BATCH = 1000
+
+
+class _Pending:
+    __slots__ = ("path", "columns", "row", "done", "error")
+
+    def __init__(self, path, columns, row):
+        self.path = path
+        self.columns = columns
+        self.row = row
+        self.done = threading.Event()
+        self.error = None
+
+
+class CSVAppendWriter:
+    """
+    Single background thread that appends rows to the CSV logs.
+
+    Rows from every session are queued and group-committed: each batch is
+    written with one open/lock/write/fsync per file, using csv quoting so
+    commas or quotes in names can not break a row.
+    """
+
+    def __init__(self, flush_interval=FLUSH_INTERVAL, max_batch=MAX_BATCH):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.batches = 0
+        self.rows_written = 0
+
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            with self._start_lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name="csv-append-writer", daemon=True)
+                    self._thread.start()
+
+    def append(self, path, columns, row, wait=True, timeout=10):
+        """
+        Queues `row` (a dict keyed by `columns`) for `path`. With wait=True
+        this returns once the batch holding the row has been fsynced, so the
+        next rerun is guaranteed to see it.
+        """
+        self._ensure_started()
+        item = _Pending(path, columns, row)
+        self._queue.put(item)
+        if wait:
+            if not item.done.wait(timeout):
+                raise TimeoutError(f"Timed out writing to {path}")
+            if item.error is not None:
+                raise item.error
+        return item
+
+    def flush(self, timeout=10):
+        """Blocks until everything queued so far is on disk."""
+        self._ensure_started()
+        marker = _Pending(None, None, None)
+        self._queue.put(marker)
+        marker.done.wait(timeout)
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            by_path = {}
+            for item in batch:
+                if item.path is not None:
+                    by_path.setdefault(item.path, []).append(item)
+            for path, items in by_path.items():
+                try:
+                    self._write(path, items[0].columns, items)
+                except Exception as e:
+                    for item in items:
+                        item.error = e
+            self.batches += 1
+            for item in batch:
+                item.done.set()
+
+    def _write(self, path, columns, items):
+        with _open_locked(path, "a") as f:
+            try:
+                writer = csv.writer(f, lineterminator="\n")
+                if f.tell() == 0:
+                    writer.writerow(columns)
+                writer.writerows([item.row.get(c, "") for c in columns] for item in items)
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        self.rows_written += len(items)
+        bump_generation(path)
+
+
+def _open_locked(path, mode):
+    """
+    Opens `path` holding an exclusive flock. If the file was replaced while
+    we waited for the lock (see rewrite), reopen so we never write into the
+    unlinked old file.
+    """
+    while True:
+        f = open(path, mode, newline="")
+        if fcntl is None:
+            return f
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            if os.fstat(f.fileno()).st_ino == os.stat(path).st_ino:
+                return f
+        except FileNotFoundError:
+            pass
+        f.close()
+
+
+def rewrite(path, transform):
+    """
+    Replaces a CSV log with transform(rows) atomically, under the same lock
+    appenders take. `rows` is a list of lists including the header.
+    """
+    get_writer().flush()
+    with _open_locked(path, "r+") as f:
+        rows = list(csv.reader(f))
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", newline="") as out:
+            csv.writer(out, lineterminator="\n").writerows(transform(rows))
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp, path)
+    bump_generation(path)
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    """Returns the process-wide CSV append writer."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = CSVAppendWriter()
+                atexit.register(_writer.flush)
+    return _writer
@@ -0,0 +1,179 @@
+import os
+import threading
+import pandas as pd
+
+DATA_DIR = "data"
+
+# Parsed datasets are shared by every session in the process; with
+# copy-on-write a caller's edits copy the touched columns instead of
+# changing the shared frame. Default from pandas 3 on.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Every CSV the dashboard reads, with the columns used when the file is
+# missing or empty so callers always get a well-formed DataFrame back.
+# "dtypes" is the schema registry: the compact dtypes each column is held
+# in memory as (categories for repeated strings, small ints, datetime64).
+# Both storage backends and the Arrow snapshots apply it.
+DATASETS = {
+    "teachers": {
+        "path": os.path.join(DATA_DIR, "teacher_dataset_100.csv"),
+        "columns": ['Teacher_ID', 'Teacher_Name', 'Subject', 'Block', 'Room_Number',
+                    'Cabin_Number', 'Lecture_Start', 'Lecture_End', 'Free_Start',
+                    'Free_End', 'Available_Days'],
+        "dtypes": {'Teacher_Name': 'category', 'Subject': 'category', 'Block': 'category',
+                   'Room_Number': 'int16', 'Cabin_Number': 'int16',
+                   'Lecture_Start': 'category', 'Lecture_End': 'category',
+                   'Free_Start': 'category', 'Free_End': 'category',
+                   'Available_Days': 'category'},
+    },
+    "appointments": {
+        "path": os.path.join(DATA_DIR, "appointments.csv"),
+        "columns": ['Student_Name', 'Student_ID', 'Teacher_ID', 'Teacher_Name', 'Slot', 'Date'],
+        "dtypes": {'Teacher_ID': 'category', 'Teacher_Name': 'category', 'Date': 'datetime64[ns]'},
+    },
+    "thoughts": {
+        "path": os.path.join(DATA_DIR, "student_thoughts.csv"),
+        "columns": ['Student_Name', 'Student_ID', 'Teacher_Name', 'Thought', 'Date'],
+        "dtypes": {'Teacher_Name': 'category', 'Date': 'datetime64[ns]'},
+    },
+    "quiz_results": {
+        "path": os.path.join(DATA_DIR, "quiz_results.csv"),
+        "columns": ['Name', 'Student_ID', 'DateTime', 'Score', 'Total_Questions'],
+        "dtypes": {'DateTime': 'datetime64[ns]', 'Score': 'int16', 'Total_Questions': 'int16'},
+    },
+    "quiz_questions": {
+        "path": os.path.join(DATA_DIR, "quiz_questions_dataset.csv"),
+        "columns": ['Question', 'Option_A', 'Option_B', 'Option_C', 'Option_D', 'Correct_Option'],
+        "dtypes": {'Correct_Option': 'category'},
+    },
+    "quiz_answers": {
+        "path": os.path.join(DATA_DIR, "quiz_answers.csv"),
+        "columns": ['DateTime', 'Student_ID', 'Question_Key', 'Correct', 'Ability'],
+        "dtypes": {'DateTime': 'datetime64[ns]', 'Student_ID': 'category', 'Question_Key': 'int64',
+                   'Correct': 'int8', 'Ability': 'float32'},
+    },
+    "users": {
+        "path": os.path.join(DATA_DIR, "users.csv"),
+        "columns": ['username', 'password'],
+        "dtypes": {'username': 'str', 'password': 'str'},
+    },
+    "faq": {
+        "path": os.path.join(DATA_DIR, "student_faq.csv"),
+        "columns": ['Question', 'Answer'],
+        "dtypes": {'Question': 'str', 'Answer': 'str'},
+    },
+}
+
+_lock = threading.Lock()
+_key_locks = {}
+_cache = {}
+_generations = {}
+
+
+def dataset_path(name):
+    return DATASETS[name]["path"]
+
+
+def _key(path):
+    return os.path.normpath(path)
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def bump_generation(path_or_name):
+    """
+    Marks a dataset as changed. Writers call this after touching a file so
+    readers refresh even if mtime/size did not move.
+    """
+    path = DATASETS[path_or_name]["path"] if path_or_name in DATASETS else path_or_name
+    key = _key(path)
+    with _lock:
+        _generations[key] = _generations.get(key, 0) + 1
+
+
+def generation(key):
+    """Write-generation counter for a key that is not backed by a single file."""
+    return _generations.get(_key(key), 0)
+
+
+def data_version(path_or_name):
+    """
+    Returns a hashable token that changes whenever the file changes on disk
+    or one of our writers bumps its generation.
+    """
+    path = DATASETS[path_or_name]["path"] if path_or_name in DATASETS else path_or_name
+    key = _key(path)
+    return (_generations.get(key, 0), _file_signature(path))
+
+
+def load_cached(key, version, loader):
+    """
+    Returns loader() memoised under `key` until `version` changes. Used for
+    anything derived from a dataset (parsed frames, indexes, aggregates).
+    """
+    entry = _cache.get(key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.RLock())
+    with key_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        value = loader()
+        _cache[key] = (version, value)
+        return value
+
+
+def store_cached(key, version, value):
+    """
+    Replaces the cached value for `key`. Lets incrementally maintained
+    structures carry themselves over to the version produced by their own write.
+    """
+    _cache[key] = (version, value)
+
+
+def load_csv(path, columns=None, dtypes=None):
+    """
+    Returns the parsed CSV at `path`. The data is shared by every session in
+    the process and only re-parsed when the file's version changes; each
+    caller gets a shallow copy, so its writes copy-on-write and never
+    reach the shared frame.
+    Loads go through the on-disk Arrow snapshot when pyarrow is installed,
+    so a fresh process does not re-parse and re-infer every CSV.
+    """
+    from modules.snapshots import load_snapshot
+
+    if dtypes is None:
+        # The cache and snapshot are per file, so every caller of a known
+        # dataset must get the same dtypes.
+        spec = next((d for d in DATASETS.values() if _key(d["path"]) == _key(path)), {})
+        dtypes = spec.get("dtypes")
+        columns = columns or spec.get("columns")
+    shared = load_cached(_key(path), data_version(path),
+                         lambda: load_snapshot(path, columns, dtypes))
+    return shared.copy(deep=False)
+
+
+def load_dataset(name):
+    spec = DATASETS[name]
+    return load_csv(spec["path"], spec["columns"], spec.get("dtypes"))
+
+
+def cached_items():
+    """Snapshot of the (key, value) pairs currently held in the process cache."""
+    with _lock:
+        return [(key, entry[1]) for key, entry in _cache.items()]
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,145 @@
+import os
+import sys
+import argparse
+import resource
+import numpy as np
+import pandas as pd
+from modules.data_store import cached_items
+from modules.schema import value_bytes, session_memory
+
+MB = 1024 * 1024
+
+# What a student mid-quiz keeps in st.session_state, for sizing estimates
+# when no live sessions are available (e.g. from the command line).
+TYPICAL_SESSION = {
+    "username": "student_1001", "page": "Quiz", "quiz_started": True, "quiz_submitted": False,
+    "quiz_saved": False, "quiz_adaptive": False, "quiz_bank_version": (3, (1760000000000000000, 48213)),
+    "question_ids": tuple(range(10)), "answers": {i: 1 for i in range(10)},
+    **{f"q_{i}": 1 for i in range(10)},
+}
+
+
+def deep_bytes(value, seen=None):
+    """
+    Approximate deep size of a cached object: frames and arrays by their
+    buffers, containers and plain objects by walking their contents. Each
+    object is counted once, however many references point at it.
+    """
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return value_bytes(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(deep_bytes(k, seen) + deep_bytes(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(deep_bytes(v, seen) for v in value)
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        return sys.getsizeof(value) + deep_bytes(vars(value), seen)
+    return sys.getsizeof(value)
+
+
+def process_memory():
+    """Current and peak resident set size of this process, in MB."""
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss = None
+    try:
+        with open("/proc/self/statm") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+    return {"rss_mb": round(rss / MB, 1) if rss else None,
+            "peak_rss_mb": round(peak_kb / 1024 if sys.platform != "darwin" else peak_kb / MB, 1)}
+
+
+def shared_cache_memory():
+    """MB per entry of the process-wide cache (datasets, indexes, aggregates), largest first."""
+    seen = set()
+    sizes = {str(key): deep_bytes(value, seen) for key, value in cached_items()}
+    sizes = dict(sorted(sizes.items(), key=lambda kv: kv[1], reverse=True))
+    return {"total_mb": round(sum(sizes.values()) / MB, 2),
+            "entries_mb": {k: round(v / MB, 3) for k, v in sizes.items()}}
+
+
+def active_session_states():
+    """session_state of every connected Streamlit session; empty outside a running app."""
+    try:
+        from streamlit.runtime import exists, get_instance
+        if not exists():
+            return []
+        sessions = get_instance()._session_mgr.list_active_sessions()
+        return [info.session.session_state.filtered_state for info in sessions]
+    except Exception:
+        return []
+
+
+def memory_diagnostic(current_state=None):
+    """
+    Process RSS, the shared caches every session reads from, and the
+    per-session state of connected users, with a rough per-user cost for
+    sizing pods: baseline (RSS less session state) + users x per-session.
+    Streamlit's own per-connection buffers are not in session_state, so
+    check the estimate against RSS under real load once.
+    """
+    states = active_session_states()
+    per_session = [sum(session_memory(s).values()) for s in states]
+    if not per_session:
+        per_session = [sum(session_memory(TYPICAL_SESSION).values())]
+    process = process_memory()
+    report = {
+        "process": process,
+        "shared_cache": shared_cache_memory(),
+        "sessions": {
+            "active": len(states),
+            "total_kb": round(sum(per_session) / 1024, 1) if states else 0,
+            "mean_kb": round(float(np.mean(per_session)) / 1024, 2),
+            "max_kb": round(max(per_session) / 1024, 2),
+        },
+    }
+    if current_state is not None:
+        report["current_session_bytes"] = session_memory(current_state)
+    if process["rss_mb"]:
+        report["baseline_mb"] = round(process["rss_mb"] - report["sessions"]["total_kb"] / 1024, 1)
+    return report
+
+
+def estimate_pod_mb(users, report=None):
+    """RSS to expect with `users` concurrent sessions, from a memory_diagnostic() report."""
+    report = report or memory_diagnostic()
+    baseline = report.get("baseline_mb") or report["process"]["peak_rss_mb"]
+    return round(baseline + users * report["sessions"]["mean_kb"] / 1024, 1)
+
+
+def warm_caches():
+    """Loads every dataset and the structures the pages build from them, as a busy server would hold."""
+    from modules.data_store import DATASETS, load_dataset
+    from modules.teacher_search import get_teacher_index
+    from modules.aggregates import get_aggregates
+    from modules.analytics import get_student_analytics
+    from modules.question_bank import get_question_bank
+    from modules.availability import get_booking_index
+    for name in DATASETS:
+        load_dataset(name)
+    get_teacher_index()
+    get_aggregates()
+    get_student_analytics()
+    get_question_bank()
+    get_booking_index()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process and per-session memory report, for sizing pods.")
+    parser.add_argument("--users", type=int, nargs="*", default=[100, 500, 1000],
+                        help="concurrent session counts to estimate RSS for")
+    args = parser.parse_args()
+
+    warm_caches()
+    report = memory_diagnostic()
+    print(f"process RSS: {report['process']['rss_mb']} MB (peak {report['process']['peak_rss_mb']} MB)")
+    print(f"shared caches: {report['shared_cache']['total_mb']} MB")
+    for key, mb in list(report['shared_cache']['entries_mb'].items())[:10]:
+        print(f"  {mb:10.3f} MB  {key}")
+    print(f"per-session state: {report['sessions']['mean_kb']} KB (typical quiz session)")
+    for users in args.users:
+        print(f"  ~{estimate_pod_mb(users, report)} MB with {users} concurrent users")
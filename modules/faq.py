@@ -0,0 +1,299 @@
+import os
+import re
+import time
+import struct
+import zipfile
+import argparse
+import threading
+from collections import OrderedDict
+import numpy as np
+from modules.data_store import DATA_DIR, DATASETS, load_dataset, load_cached, data_version
+
+INDEX_PATH = os.path.join(DATA_DIR, ".faq", "student_faq.npz")
+# Hashed character 3-5 grams within word boundaries: robust to typos and
+# word forms, and stateless, so the whole index is plain arrays.
+N_FEATURES = 2 ** 20
+NGRAM_RANGE = (3, 5)
+# Grams found in more than this share of questions carry almost no signal
+# but have the longest posting lists; they are left out of the index.
+MAX_DF = 0.3
+TOP_K = 3
+# Below this cosine similarity a match is not offered as an answer.
+MIN_SCORE = 0.35
+CACHE_SIZE = 4096
+
+_ARRAYS = ("data", "indices", "indptr", "idf", "meta")
+
+
+def normalize_question(text):
+    """Lowercase words only, so "5?" and "5" or a missing comma don't change the grams."""
+    return " ".join(re.findall(r"\w+", str(text).lower()))
+
+
+def _vectorizer():
+    from sklearn.feature_extraction.text import HashingVectorizer
+    return HashingVectorizer(analyzer="char_wb", ngram_range=NGRAM_RANGE, n_features=N_FEATURES,
+                             alternate_sign=False, norm=None, dtype=np.float32)
+
+
+def _source_signature(path):
+    stat = os.stat(path)
+    return np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+
+def _mmap_npz(path):
+    """
+    Memory-maps each array of an uncompressed .npz in place (np.load can't
+    map members of a zip). Falls back to reading them if the file is compressed.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as f:
+        for info in zf.infolist():
+            name = info.filename[:-4]
+            if info.compress_type != zipfile.ZIP_STORED:
+                return dict(np.load(path))
+            # Local file header: 30 fixed bytes, then the name and extra field.
+            f.seek(info.header_offset + 26)
+            name_len, extra_len = struct.unpack("<HH", f.read(4))
+            f.seek(info.header_offset + 30 + name_len + extra_len)
+            version = np.lib.format.read_magic(f)
+            read_header = (np.lib.format.read_array_header_1_0 if version == (1, 0)
+                           else np.lib.format.read_array_header_2_0)
+            shape, fortran, dtype = read_header(f)
+            arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=f.tell(), shape=shape,
+                                     order="F" if fortran else "C")
+    return arrays
+
+
+class FaqIndex:
+    """
+    TF-IDF over the FAQ questions, stored column-wise (one posting list of
+    (question, weight) per hashed gram) so a lookup only touches the
+    postings of the grams in the query. Rows are L2-normalised, so the
+    summed products are cosine similarities.
+    """
+
+    def __init__(self, data, indices, indptr, idf, n_questions):
+        import scipy.sparse as sp
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.idf = idf
+        self.n_questions = n_questions
+        # Wraps the (possibly memory-mapped) arrays without copying them.
+        self.matrix = sp.csc_matrix((data, indices, indptr), shape=(n_questions, N_FEATURES), copy=False)
+        self.vectorizer = _vectorizer()
+
+    def __len__(self):
+        return self.n_questions
+
+    @classmethod
+    def build(cls, questions):
+        import scipy.sparse as sp
+        questions = [normalize_question(q) for q in questions]
+        counts = _vectorizer().transform(questions).tocsc()
+        n = len(questions)
+        df = np.diff(counts.indptr)
+        idf = (np.log((1 + n) / (1 + df)) + 1).astype(np.float32)
+        idf[df > max(MAX_DF * n, 1)] = 0
+
+        X = counts.tocsr()
+        X.data = np.log1p(X.data) * idf[X.indices]
+        X.eliminate_zeros()
+        norms = np.sqrt(np.asarray(X.multiply(X).sum(axis=1)).ravel())
+        X = sp.diags(1 / np.where(norms > 0, norms, 1)).dot(X).tocsc().astype(np.float32)
+        index_dtype = np.int32 if X.nnz < 2 ** 31 else np.int64
+        return cls(X.data, X.indices.astype(index_dtype), X.indptr.astype(index_dtype), idf, n)
+
+    def save(self, path, source):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+        meta = np.concatenate([source, [self.n_questions]]).astype(np.int64)
+        np.savez(tmp, data=self.data, indices=self.indices, indptr=self.indptr, idf=self.idf, meta=meta)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Returns (index, source signature) with the arrays memory-mapped from `path`."""
+        arrays = _mmap_npz(path)
+        if any(name not in arrays for name in _ARRAYS):
+            raise ValueError(f"{path} is not an FAQ index")
+        meta = np.asarray(arrays["meta"])
+        index = cls(arrays["data"], arrays["indices"], arrays["indptr"], arrays["idf"], int(meta[2]))
+        return index, meta[:2]
+
+    def _query_vectors(self, texts):
+        Q = self.vectorizer.transform([normalize_question(t) for t in texts]).tocsr()
+        Q.data = np.log1p(Q.data) * self.idf[Q.indices]
+        return Q
+
+    def _score(self, cols, weights):
+        """Cosine similarity of every question to the query, from the posting lists of its grams only."""
+        keep = weights > 0
+        cols, weights = cols[keep], weights[keep]
+        norm = np.sqrt((weights ** 2).sum())
+        if not len(cols) or norm == 0:
+            return None
+        return self.matrix[:, cols] @ (weights / norm)
+
+    def _top(self, scores, k):
+        if scores is None:
+            return []
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(i), float(scores[i])) for i in top if scores[i] > 0]
+
+    def search_batch(self, texts, k=TOP_K):
+        """[(row, score), ...] best first for each text, from one vectorizer transform."""
+        Q = self._query_vectors(texts)
+        return [self._top(self._score(Q.indices[Q.indptr[i]:Q.indptr[i + 1]], Q.data[Q.indptr[i]:Q.indptr[i + 1]]), k)
+                for i in range(len(texts))]
+
+    def search(self, text, k=TOP_K):
+        return self.search_batch([text], k)[0]
+
+
+class FaqSearch:
+    """An FAQ index plus its answers and a query LRU, for one version of the FAQ file."""
+
+    def __init__(self, index, faq_df, cache_size=CACHE_SIZE):
+        self.index = index
+        self.questions = faq_df['Question'].tolist()
+        self.answers = faq_df['Answer'].tolist()
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _result(self, hits):
+        return [{"question": self.questions[row], "answer": self.answers[row], "score": round(score, 4)}
+                for row, score in hits]
+
+    def ask_batch(self, texts, k=TOP_K):
+        """Top-k matches for each text; cached texts skip the index."""
+        keys = [(normalize_question(t), k) for t in texts]
+        results = [None] * len(keys)
+        missing = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    results[i] = self._cache[key]
+                else:
+                    missing.setdefault(key, []).append(i)
+        if missing:
+            batch = list(missing)
+            found = self.index.search_batch([q for q, _ in batch], k)
+            with self._lock:
+                for key, hits in zip(batch, found):
+                    value = self._result(hits)
+                    for i in missing[key]:
+                        results[i] = value
+                    self._cache[key] = value
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return results
+
+    def ask(self, text, k=TOP_K):
+        return self.ask_batch([text], k)[0]
+
+
+def load_or_build_index(csv_path=None, index_path=INDEX_PATH):
+    """
+    Memory-maps the persisted index if it was built from the current CSV,
+    otherwise builds it from the questions and saves it.
+    """
+    csv_path = csv_path or DATASETS["faq"]["path"]
+    source = _source_signature(csv_path)
+    try:
+        index, built_from = FaqIndex.load(index_path)
+        if np.array_equal(built_from, source):
+            return index
+    except (OSError, ValueError, zipfile.BadZipFile):
+        pass
+    index = FaqIndex.build(load_dataset("faq")['Question'])
+    index.save(index_path, source)
+    return index
+
+
+def get_faq_search():
+    """Returns the FAQ search for the current version of student_faq.csv, or None if there is no FAQ."""
+    if not os.path.exists(DATASETS["faq"]["path"]):
+        return None
+    return load_cached("faq_search", data_version("faq"),
+                       lambda: FaqSearch(load_or_build_index(), load_dataset("faq")))
+
+
+def answer_faq_batch(questions, k=TOP_K):
+    search = get_faq_search()
+    if search is None:
+        return [[] for _ in questions]
+    return search.ask_batch(questions, k)
+
+
+def answer_faq(question, k=TOP_K):
+    return answer_faq_batch([question], k)[0]
+
+
+def benchmark(entries=100_000, lookups=1000, batch_size=1000, seed=0):
+    """Build time, persisted-load time and lookup latency over a synthetic FAQ of `entries` questions."""
+    import tempfile
+    import pandas as pd
+    from modules.synthetic_data import make_faq
+    rng = np.random.default_rng(seed)
+    faq = make_faq(entries, rng)
+    queries = make_faq(lookups, np.random.default_rng(seed + 1))['Question'].tolist()
+
+    start = time.perf_counter()
+    index = FaqIndex.build(faq['Question'])
+    build_s = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "faq.npz")
+        index.save(path, np.zeros(2, dtype=np.int64))
+        start = time.perf_counter()
+        index, _ = FaqIndex.load(path)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        single = []
+        for q in queries:
+            t0 = time.perf_counter()
+            index.search(q)
+            single.append((time.perf_counter() - t0) * 1000)
+        start = time.perf_counter()
+        for i in range(0, len(queries), batch_size):
+            index.search_batch(queries[i:i + batch_size])
+        batch_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        search = FaqSearch(index, pd.DataFrame({"Question": faq['Question'], "Answer": faq['Answer']}))
+        search.ask(queries[0])
+        t0 = time.perf_counter()
+        search.ask(queries[0])
+        cached_us = (time.perf_counter() - t0) * 1e6
+    p = lambda q: round(float(np.percentile(single, q)), 3)
+    return {"entries": entries, "build_s": round(build_s, 2), "mmap_load_ms": round(load_ms, 2),
+            "lookup_ms": {"p50": p(50), "p95": p(95), "p99": p(99)},
+            "batched_ms_per_query": round(batch_ms, 3), "cached_lookup_us": round(cached_us, 1)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Student FAQ search.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="(re)build the persisted index from student_faq.csv")
+    ask = sub.add_parser("ask", help="answer one or more questions")
+    ask.add_argument("questions", nargs="+")
+    ask.add_argument("-k", type=int, default=TOP_K)
+    bench = sub.add_parser("bench", help="lookup latency over a synthetic FAQ")
+    bench.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if os.path.exists(INDEX_PATH):
+            os.remove(INDEX_PATH)
+        print(f"Indexed {len(load_or_build_index())} questions -> {INDEX_PATH}")
+    elif args.command == "ask":
+        for question, hits in zip(args.questions, answer_faq_batch(args.questions, args.k)):
+            print(question)
+            for hit in hits:
+                print(f"  {hit['score']:.3f}  {hit['question']} -> {hit['answer']}")
+    else:
+        print(benchmark(args.entries))
@@ -0,0 +1,223 @@
+import os
+import re
+import stat
+import argparse
+import tempfile
+import warnings
+import numpy as np
+import pandas as pd
+from modules.data_store import DATASETS, bump_generation
+from modules.availability import parse_days
+
+REQUIRED_COLUMNS = DATASETS["teachers"]["columns"]
+TIME_COLUMNS = ['Lecture_Start', 'Lecture_End', 'Free_Start', 'Free_End']
+INT_COLUMNS = [c for c, dtype in DATASETS["teachers"]["dtypes"].items() if dtype.startswith("int")]
+CHUNK_ROWS = 50_000
+MAX_REPORTED_ERRORS = 1000
+
+_TIME_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]\d)$")
+_INT_RE = re.compile(r"^\d+$")
+# pandas reports rows with the wrong field count as "Skipping line N: expected A fields, saw B".
+_BAD_LINE_RE = re.compile(r"line (\d+): (.*)")
+
+
+class IngestResult:
+    def __init__(self):
+        self.rows_read = 0
+        self.rows_written = 0
+        self.errors = []
+        self.error_count = 0
+        self.missing_columns = []
+        self.applied = False
+
+    def add_error(self, line, column, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"Line": line, "Column": column, "Error": message})
+
+    @property
+    def empty(self):
+        """True when the upload had no data rows (or no bytes at all)."""
+        return self.rows_read == 0 and not self.missing_columns and not self.error_count
+
+    def errors_frame(self):
+        return pd.DataFrame(self.errors, columns=["Line", "Column", "Error"])
+
+
+def _read_error(error):
+    if isinstance(error, UnicodeDecodeError):
+        return "file is not UTF-8 text"
+    return f"could not parse the file: {str(error).strip()}"
+
+
+def _to_minutes(value):
+    match = _TIME_RE.match(str(value).strip())
+    return int(match.group(1)) * 60 + int(match.group(2)) if match else None
+
+
+def _valid_days(value):
+    return parse_days(value)[1]
+
+
+def validate_chunk(chunk, lines, seen_ids, result):
+    """
+    Checks one chunk against the teacher schema. `lines` are the file line
+    numbers of its rows. Returns a boolean mask of valid rows and records
+    row-level errors on `result`.
+    """
+    lines = np.asarray(lines)
+    valid = pd.Series(True, index=chunk.index)
+
+    def reject(mask, column, message):
+        nonlocal valid
+        for line in lines[mask.to_numpy()]:
+            result.add_error(int(line), column, message)
+        valid &= ~mask
+
+    for col in ['Teacher_ID', 'Teacher_Name', 'Subject']:
+        reject(chunk[col].str.strip() == "", col, "value is required")
+
+    # Times and day strings repeat heavily across a roster; parse each
+    # distinct value once and map the result back onto the chunk.
+    mins = {}
+    for col in TIME_COLUMNS:
+        mins[col] = chunk[col].map({v: _to_minutes(v) for v in chunk[col].unique()})
+        reject(mins[col].isna(), col, "expected HH:MM (00:00-23:59)")
+
+    # Comparisons with a missing time are False, so each pair is checked
+    # wherever both of its own times parsed.
+    reject(mins['Free_Start'] >= mins['Free_End'], 'Free_End', "must be after Free_Start")
+    reject(mins['Lecture_Start'] >= mins['Lecture_End'], 'Lecture_End', "must be after Lecture_Start")
+
+    for col in INT_COLUMNS:
+        reject(~chunk[col].str.strip().str.match(_INT_RE), col, "expected a whole number")
+
+    days = chunk['Available_Days']
+    day_ok = days.map({d: _valid_days(d) for d in days.unique()})
+    reject(~day_ok, 'Available_Days', "expected days like Mon-Fri or Mon,Wed,Fri")
+
+    ids = chunk['Teacher_ID'].str.strip()
+    seen = np.fromiter((i in seen_ids for i in ids), dtype=bool, count=len(ids))
+    dup = ids.duplicated(keep='first') | seen
+    reject(dup & (ids != ""), 'Teacher_ID', "duplicate Teacher_ID")
+    seen_ids.update(ids[valid])
+    return valid
+
+
+def _chunk_lines(next_line, count, bad_lines):
+    """File line numbers of the next `count` parsed rows, stepping over lines pandas skipped."""
+    bad = np.fromiter(bad_lines, dtype=np.int64)
+    candidates = np.arange(next_line, next_line + count + len(bad))
+    return candidates[~np.isin(candidates, bad)][:count]
+
+
+def _install_mode(dest):
+    """Permissions for the new roster: the old file's, or rw-r--r-- for a new one."""
+    try:
+        return stat.S_IMODE(os.stat(dest).st_mode)
+    except FileNotFoundError:
+        return 0o644
+
+
+def ingest_teacher_csv(source, dest=None, chunk_rows=CHUNK_ROWS, skip_invalid=False):
+    """
+    Streams a teacher roster from `source` (path or file object) in chunks,
+    validates every row and writes valid rows to a temp file next to `dest`.
+    The temp file replaces `dest` atomically only if the header is complete
+    and either no row failed or skip_invalid=True. Memory use is bounded by
+    chunk_rows regardless of file size.
+    """
+    dest = dest or DATASETS["teachers"]["path"]
+    result = IngestResult()
+    seen_ids = set()
+
+    try:
+        reader = pd.read_csv(source, chunksize=chunk_rows, dtype=str, keep_default_na=False,
+                             skipinitialspace=True, on_bad_lines="warn")
+    except pd.errors.EmptyDataError:
+        return result  # no bytes at all: reported as empty, not as missing columns
+    except (UnicodeDecodeError, pd.errors.ParserError) as e:
+        result.add_error(1, None, _read_error(e))
+        return result
+    fd, tmp_path = tempfile.mkstemp(prefix=".teachers-", suffix=".csv", dir=os.path.dirname(dest) or ".")
+    try:
+        with os.fdopen(fd, "w", newline="") as out:
+            out.write(",".join(REQUIRED_COLUMNS) + "\n")
+            next_line = 2
+            bad_lines = set()
+            unreadable = False
+            chunks = iter(reader)
+            while True:
+                # Rows with the wrong number of fields are skipped by pandas
+                # with a warning naming the line; they become row errors.
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter("always", pd.errors.ParserWarning)
+                    try:
+                        chunk = next(chunks, None)
+                    except (UnicodeDecodeError, pd.errors.ParserError) as e:
+                        result.add_error(next_line, None, _read_error(e))
+                        unreadable = True
+                        break
+                for warning in caught:
+                    for line, message in _BAD_LINE_RE.findall(str(warning.message)):
+                        bad_lines.add(int(line))
+                        result.add_error(int(line), None, message)
+                        result.rows_read += 1
+                if chunk is None:
+                    break
+                if next_line == 2:
+                    result.missing_columns = [c for c in REQUIRED_COLUMNS if c not in chunk.columns]
+                    if result.missing_columns:
+                        return result
+                chunk = chunk[REQUIRED_COLUMNS]
+                lines = _chunk_lines(next_line, len(chunk), bad_lines)
+                valid = validate_chunk(chunk, lines, seen_ids, result)
+                result.rows_read += len(chunk)
+                next_line = int(lines[-1]) + 1 if len(lines) else next_line
+                if result.error_count and not skip_invalid:
+                    continue  # keep validating so the report is complete, but write nothing
+                good = chunk[valid]
+                good.to_csv(out, header=False, index=False)
+                result.rows_written += len(good)
+            out.flush()
+            os.fsync(out.fileno())
+
+        # A file that can't be read to the end is never installed, even with
+        # skip_invalid: the rows after the failure are unknown.
+        if unreadable or (result.error_count and not skip_invalid):
+            result.rows_written = 0
+            return result
+        if result.rows_written == 0:
+            return result
+
+        # mkstemp creates the file 0600; keep the roster readable as before.
+        os.chmod(tmp_path, _install_mode(dest))
+        os.replace(tmp_path, dest)
+        tmp_path = None
+        bump_generation(dest)
+        result.applied = True
+        return result
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validate and install a teacher roster CSV.")
+    parser.add_argument("source")
+    parser.add_argument("--dest", default=DATASETS["teachers"]["path"])
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--skip-invalid", action="store_true", help="drop bad rows instead of rejecting the file")
+    args = parser.parse_args()
+
+    res = ingest_teacher_csv(args.source, args.dest, args.chunk_rows, args.skip_invalid)
+    if res.empty:
+        print("The file is empty.")
+    if res.missing_columns:
+        print("Missing required columns: " + ", ".join(res.missing_columns))
+    for err in res.errors[:50]:
+        print(f"line {err['Line']}: {err['Column']}: {err['Error']}")
+    if res.error_count > 50:
+        print(f"... {res.error_count - 50} more errors")
+    print(f"read {res.rows_read} rows, wrote {res.rows_written}, "
+          f"{'installed' if res.applied else 'NOT installed'} at {args.dest}")
@@ -0,0 +1,163 @@
+import os
+import re
+import time
+import threading
+from collections import OrderedDict
+
+MODEL_PATH = "models/teacher_intent_model.pkl"
+# Set TEACHER_ASSISTANT_MODEL_MMAP=r to memory-map large numpy arrays in the pickle.
+MMAP_MODE = os.environ.get("TEACHER_ASSISTANT_MODEL_MMAP") or None
+CACHE_SIZE = 4096
+
+
+def normalize_query(text):
+    """Same light cleaning the notebook applies before training: lowercase, single spaces."""
+    return re.sub(r"\s+", " ", str(text).lower()).strip()
+
+
+class IntentModel:
+    """
+    Loads the TF-IDF + LogisticRegression intent pipeline once per process,
+    on first use, and serves batched predictions with an LRU cache.
+    """
+
+    def __init__(self, path=MODEL_PATH, mmap_mode=MMAP_MODE, cache_size=CACHE_SIZE):
+        self.path = path
+        self.mmap_mode = mmap_mode
+        self.cache_size = cache_size
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._warm_started = False
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.load_seconds = None
+        self.load_error = None
+        self.batches = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.last_batch_ms = None
+        self.total_inference_ms = 0.0
+
+    @property
+    def loaded(self):
+        return self._model is not None
+
+    def load(self):
+        if self._model is not None:
+            return self._model
+        with self._load_lock:
+            if self._model is None:
+                import joblib
+                start = time.perf_counter()
+                try:
+                    self._model = joblib.load(self.path, mmap_mode=self.mmap_mode)
+                except Exception as e:
+                    self.load_error = e
+                    raise
+                self.load_seconds = time.perf_counter() - start
+                self.load_error = None
+        return self._model
+
+    def reload(self):
+        """Drops the loaded model and cached predictions; the next call loads the file again."""
+        with self._load_lock:
+            self._model = None
+            self._warm_started = False
+        with self._cache_lock:
+            self._cache.clear()
+
+    def warm_up(self):
+        """Loads the model and runs one prediction so the first real query is fast."""
+        self.predict_intents(["hello"], use_cache=False)
+
+    def warm_up_async(self):
+        """Starts warm_up() in a background thread, at most once per process."""
+        with self._load_lock:
+            if self._warm_started or self._model is not None:
+                return
+            self._warm_started = True
+        threading.Thread(target=self._safe_warm_up, name="intent-model-warmup", daemon=True).start()
+
+    def _safe_warm_up(self):
+        try:
+            self.warm_up()
+        except Exception:
+            pass  # load_error is kept for stats(); the next real call raises it
+
+    @property
+    def classes(self):
+        return list(self.load().classes_)
+
+    def predict_intents(self, texts, use_cache=True):
+        """
+        Returns one intent label per text. Cached texts are answered from the
+        LRU; the rest go through the model in a single predict() call.
+        """
+        queries = [normalize_query(t) for t in texts]
+        results = [None] * len(queries)
+        missing = {}
+        if use_cache:
+            with self._cache_lock:
+                for i, q in enumerate(queries):
+                    if q in self._cache:
+                        self._cache.move_to_end(q)
+                        results[i] = self._cache[q]
+                        self.cache_hits += 1
+                    else:
+                        missing.setdefault(q, []).append(i)
+        else:
+            for i, q in enumerate(queries):
+                missing.setdefault(q, []).append(i)
+
+        if missing:
+            model = self.load()
+            batch = list(missing)
+            start = time.perf_counter()
+            predicted = model.predict(batch)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.batches += 1
+            self.last_batch_ms = elapsed_ms
+            self.total_inference_ms += elapsed_ms
+            self.cache_misses += len(batch)
+
+            with self._cache_lock:
+                for q, label in zip(batch, predicted):
+                    for i in missing[q]:
+                        results[i] = label
+                    if use_cache:
+                        self._cache[q] = label
+                        self._cache.move_to_end(q)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return results
+
+    def stats(self):
+        return {
+            "loaded": self.loaded,
+            "load_seconds": self.load_seconds,
+            "load_error": str(self.load_error) if self.load_error else None,
+            "batches": self.batches,
+            "last_batch_ms": self.last_batch_ms,
+            "avg_batch_ms": self.total_inference_ms / self.batches if self.batches else None,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_size": len(self._cache),
+        }
+
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_intent_model():
+    """Returns the process-wide IntentModel (not loaded until first used)."""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                _model = IntentModel()
+    return _model
+
+
+def predict_intents(texts):
+    return get_intent_model().predict_intents(texts)
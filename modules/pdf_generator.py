@@ -3,34 +3,108 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Tabl
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 import io
+import copy
+import threading
 import pandas as pd
 from datetime import datetime
 
+TIMELINE_ROWS = 50
+
+
+class ReportTemplate:
+    """
+    Styles, table styles and static flowables for the progress report,
+    built once and shared by every report.
+    Static paragraphs are handed out as shallow copies: the markup is parsed
+    once, while layout state set during build stays per report.
+    """
+
+    def __init__(self):
+        self.styles = getSampleStyleSheet()
+        self.title_style = ParagraphStyle('Title', parent=self.styles['Heading1'], alignment=1, fontSize=18, spaceAfter=14)
+        self.normal = self.styles['Normal']
+        self.heading = self.styles['Heading2']
+
+        self.summary_table_style = TableStyle([
+            ('BACKGROUND', (0,0), (-1,0), colors.lightgrey),
+            ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE')
+        ])
+        self.timeline_table_style = TableStyle([
+            ('GRID', (0,0), (-1,-1), 0.25, colors.grey),
+            ('BACKGROUND', (0,0), (-1,0), colors.whitesmoke),
+        ])
+
+        self._title = Paragraph("Student Progress Report", self.title_style)
+        self._scores_heading = Paragraph("Quiz Scores Over Time", self.heading)
+        self._correct_wrong_heading = Paragraph("Correct vs Wrong", self.heading)
+        self._timeline_heading = Paragraph("Activity Timeline (most recent first)", self.heading)
+        self.spacer = Spacer(1, 12)
+
+    def title(self):
+        return copy.copy(self._title)
+
+    def scores_heading(self):
+        return copy.copy(self._scores_heading)
+
+    def correct_wrong_heading(self):
+        return copy.copy(self._correct_wrong_heading)
+
+    def timeline_heading(self):
+        return copy.copy(self._timeline_heading)
+
+    def paragraph(self, text, style_name="Normal"):
+        return Paragraph(text, self.styles[style_name])
+
+
+_template = None
+_template_lock = threading.Lock()
+
+
+def get_report_template():
+    global _template
+    if _template is None:
+        with _template_lock:
+            if _template is None:
+                _template = ReportTemplate()
+    return _template
+
+
 def _make_paragraph(text, style_name="Normal"):
-    styles = getSampleStyleSheet()
-    return Paragraph(text, styles[style_name])
+    return get_report_template().paragraph(text, style_name)
 
-def generate_pdf_report(student_name, student_id, summary: dict, timeline_df: pd.DataFrame, images: dict):
+
+def timeline_table_data(timeline_df, limit=TIMELINE_ROWS):
+    """Header + rows of strings for the timeline table, converted column-wise."""
+    td = timeline_df.head(limit)
+    body = pd.DataFrame({
+        "DateTime": td['DateTime'].astype(str),
+        "Type": td['Type'].astype(str),
+        "Detail": td['Detail'].astype(str),
+    }).to_numpy().tolist()
+    return [["DateTime", "Type", "Detail"]] + body
+
+
+def generate_pdf_report(student_name, student_id, summary: dict, timeline_df: pd.DataFrame, images: dict, template=None):
     """
     Returns PDF bytes (in-memory) for download.
     images: dict of name -> BytesIO PNG buffers
     summary: dict with keys total_quizzes, total_thoughts, correct_total, wrong_total
+    template: ReportTemplate to use; defaults to the shared one
     """
+    template = template or get_report_template()
 
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4)
     elements = []
-
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle('Title', parent=styles['Heading1'], alignment=1, fontSize=18, spaceAfter=14)
-    normal = styles['Normal']
+    normal = template.normal
 
     # Title
-    elements.append(Paragraph(f"Student Progress Report", title_style))
+    elements.append(template.title())
     elements.append(Paragraph(f"Name: <b>{student_name}</b>", normal))
     elements.append(Paragraph(f"Student ID: <b>{student_id}</b>", normal))
     elements.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", normal))
-    elements.append(Spacer(1, 12))
+    elements.append(template.spacer)
 
     summary_table_data = [
         ["Total Quizzes", summary.get("total_quizzes", 0)],
@@ -40,40 +114,28 @@ def generate_pdf_report(student_name, student_id, summary: dict, timeline_df: pd
         ["Total Wrong Answers (approx)", summary.get("wrong_total", 0)]
     ]
     t = Table(summary_table_data, colWidths=[200, 200])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.lightgrey),
-        ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE')
-    ]))
+    t.setStyle(template.summary_table_style)
     elements.append(t)
-    elements.append(Spacer(1, 12))
+    elements.append(template.spacer)
 
     if images.get('scores_png'):
-        elements.append(Paragraph("Quiz Scores Over Time", styles['Heading2']))
+        elements.append(template.scores_heading())
         images['scores_png'].seek(0)
         img = Image(images['scores_png'], width=450, height=250)
         elements.append(img)
-        elements.append(Spacer(1, 12))
+        elements.append(template.spacer)
 
     if images.get('correct_wrong_png'):
-        elements.append(Paragraph("Correct vs Wrong", styles['Heading2']))
+        elements.append(template.correct_wrong_heading())
         images['correct_wrong_png'].seek(0)
         img2 = Image(images['correct_wrong_png'], width=350, height=200)
         elements.append(img2)
-        elements.append(Spacer(1, 12))
+        elements.append(template.spacer)
 
     if not timeline_df.empty:
-        elements.append(Paragraph("Activity Timeline (most recent first)", styles['Heading2']))
-        td = timeline_df.copy()
-        td['DateTime'] = td['DateTime'].astype(str)
-        table_data = [["DateTime", "Type", "Detail"]]
-        for _, r in td.head(50).iterrows():
-            table_data.append([r['DateTime'], r['Type'], str(r['Detail'])])
-        tbl = Table(table_data, colWidths=[150, 80, 240])
-        tbl.setStyle(TableStyle([
-            ('GRID', (0,0), (-1,-1), 0.25, colors.grey),
-            ('BACKGROUND', (0,0), (-1,0), colors.whitesmoke),
-        ]))
+        elements.append(template.timeline_heading())
+        tbl = Table(timeline_table_data(timeline_df), colWidths=[150, 80, 240])
+        tbl.setStyle(template.timeline_table_style)
         elements.append(tbl)
 
     doc.build(elements)
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+from modules.data_store import load_dataset, load_cached, data_version
+
+OPTION_LETTERS = np.array(['A', 'B', 'C', 'D'])
+OPTION_COLUMNS = ['Option_A', 'Option_B', 'Option_C', 'Option_D']
+DEFAULT_SUBJECT = "General"
+
+
+class QuestionBank:
+    """
+    Read-only question bank shared by every quiz session in the process.
+    Options live in an (N, 4) array and answer keys in an int8 array of
+    option positions, so sampling hands out index arrays and grading a
+    whole quiz is one vectorized comparison.
+    """
+
+    def __init__(self, df):
+        df = df.reset_index(drop=True)
+        self.questions = df['Question'].astype(str).to_numpy()
+        self.options = df[OPTION_COLUMNS].astype(str).to_numpy()
+        letters = df['Correct_Option'].astype(str).str.strip().str.upper().to_numpy()
+        keys = np.full(len(df), -1, dtype=np.int8)
+        for pos, letter in enumerate(OPTION_LETTERS):
+            keys[letters == letter] = pos
+        self.answer_keys = keys
+
+        if 'Subject' in df.columns:
+            subjects = df['Subject'].astype(str).fillna(DEFAULT_SUBJECT)
+        else:
+            subjects = pd.Series(DEFAULT_SUBJECT, index=df.index)
+        self.subjects = subjects.astype('category')
+        self.subject_index = {str(k): v.astype(np.int32)
+                              for k, v in self.subjects.groupby(self.subjects, observed=True).indices.items()}
+        # Questions without a valid answer key are never handed out.
+        self._valid = np.flatnonzero(keys >= 0).astype(np.int32)
+        for arr in (self.questions, self.options, self.answer_keys, self._valid, *self.subject_index.values()):
+            arr.flags.writeable = False
+
+    def __len__(self):
+        return len(self.questions)
+
+    def subject_names(self):
+        return sorted(self.subject_index)
+
+    def _pool(self, subject=None):
+        if subject is None:
+            return self._valid
+        pool = self.subject_index.get(subject, np.empty(0, dtype=np.int32))
+        return pool[self.answer_keys[pool] >= 0]
+
+    def sample(self, n, subject=None, rng=None):
+        """n distinct question indices, optionally from one subject."""
+        rng = rng or np.random.default_rng()
+        pool = self._pool(subject)
+        return rng.choice(pool, size=min(n, len(pool)), replace=False).astype(np.int32)
+
+    def stratified_sample(self, n, subjects=None, rng=None):
+        """
+        n distinct question indices spread over `subjects` (default: all)
+        in proportion to how many questions each subject has.
+        """
+        rng = rng or np.random.default_rng()
+        subjects = subjects or self.subject_names()
+        pools = [self._pool(s) for s in subjects]
+        sizes = np.array([len(p) for p in pools], dtype=float)
+        if sizes.sum() == 0:
+            return np.empty(0, dtype=np.int32)
+        n = min(n, int(sizes.sum()))
+        quota = np.floor(n * sizes / sizes.sum()).astype(int)
+        # Hand the rounding remainder to the subjects with the largest fractions.
+        remainder = n - quota.sum()
+        order = np.argsort(-(n * sizes / sizes.sum() - quota))
+        for i in order:
+            if remainder == 0:
+                break
+            if quota[i] < sizes[i]:
+                quota[i] += 1
+                remainder -= 1
+        picked = [rng.choice(p, size=q, replace=False) for p, q in zip(pools, quota) if q]
+        ids = np.concatenate(picked).astype(np.int32)
+        rng.shuffle(ids)
+        return ids
+
+    def grade(self, ids, chosen):
+        """
+        Boolean array: chosen[i] (option position, -1 if unanswered) is the
+        answer key of question ids[i].
+        """
+        return self.answer_keys[np.asarray(ids)] == np.asarray(chosen, dtype=np.int8)
+
+    def correct_options(self, ids):
+        ids = np.asarray(ids)
+        return self.options[ids, self.answer_keys[ids]]
+
+
+def question_bank_version():
+    return data_version("quiz_questions")
+
+
+def get_question_bank():
+    """Returns the question bank for the current version of the questions dataset."""
+    return load_cached("question_bank", question_bank_version(),
+                       lambda: QuestionBank(load_dataset("quiz_questions")))
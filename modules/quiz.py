@@ -1,8 +1,12 @@
 import streamlit as st
 import pandas as pd
-import random
+import numpy as np
 import datetime
-import os  
+from modules.question_bank import get_question_bank, question_bank_version
+from modules.storage import get_storage
+from modules.adaptive_quiz import get_question_stats, log_answers
+
+QUIZ_LENGTH = 10
 
 def quiz_tab():
     st.markdown("## Student Quiz")
@@ -15,23 +19,50 @@ def quiz_tab():
         if "quiz_started" not in st.session_state:
             st.session_state.quiz_started = False
 
-        df = pd.read_csv("data/quiz_questions_dataset.csv")
+        bank = get_question_bank()
+        if st.session_state.quiz_started and st.session_state.get("quiz_bank_version") != question_bank_version():
+            st.info("The question bank was updated. Please start a new quiz.")
+            st.session_state.quiz_started = False
+            st.session_state.quiz_submitted = False
 
         if not st.session_state.quiz_started:
+            mode = st.radio("Quiz mode", ["Standard", "Adaptive"], horizontal=True,
+                            help="Adaptive quizzes pick each next question to match how you are doing.")
+            subject = None
+            if mode == "Standard" and len(bank.subject_names()) > 1:
+                choice = st.selectbox("Subject", ["All subjects"] + bank.subject_names())
+                subject = None if choice == "All subjects" else choice
             if st.button("Start Quiz"):
-                st.session_state.questions = df.sample(n=10).reset_index(drop=True)
+                # Only a tuple of question indices goes into the session; the
+                # text stays in the shared, read-only question bank.
+                st.session_state.quiz_adaptive = mode == "Adaptive"
+                if st.session_state.quiz_adaptive:
+                    first = get_question_stats().next_question(student_id)
+                    st.session_state.question_ids = (int(first),)
+                elif subject is None:
+                    st.session_state.question_ids = tuple(bank.stratified_sample(QUIZ_LENGTH).tolist())
+                else:
+                    st.session_state.question_ids = tuple(bank.sample(QUIZ_LENGTH, subject=subject).tolist())
+                st.session_state.quiz_bank_version = question_bank_version()
                 st.session_state.answers = {}
                 st.session_state.quiz_submitted = False
+                st.session_state.quiz_saved = False
                 st.session_state.quiz_started = True
 
-        if st.session_state.quiz_started and not st.session_state.quiz_submitted:
-            questions = st.session_state.questions
-            for i, row in questions.iterrows():
-                st.markdown(f"**Q{i+1}: {row['Question']}**")
-                options = [row['Option_A'], row['Option_B'], row['Option_C'], row['Option_D']]
+        if (st.session_state.quiz_started and not st.session_state.quiz_submitted
+                and st.session_state.get("quiz_adaptive", False)):
+            adaptive_step(bank, student_id)
+
+        if (st.session_state.quiz_started and not st.session_state.quiz_submitted
+                and not st.session_state.get("quiz_adaptive", False)):
+            ids = st.session_state.question_ids
+            for i, qid in enumerate(ids):
+                st.markdown(f"**Q{i+1}: {bank.questions[qid]}**")
+                options = bank.options[qid]
                 selected = st.radio(
                     f"Select your answer for Q{i+1}",
-                    options,
+                    range(len(options)),
+                    format_func=lambda k, options=options: options[k],
                     key=f"q_{i}"
                 )
                 st.session_state.answers[i] = selected
@@ -40,55 +71,80 @@ def quiz_tab():
                 st.session_state.quiz_submitted = True
 
         if st.session_state.get("quiz_submitted", False):
-            questions = st.session_state.questions
-            correct_count = 0
-            wrong_count = 0
-            analysis_data = []
-
-            for i, row in questions.iterrows():
-                correct_option_letter = row['Correct_Option']
-                correct_answer = row[f'Option_{correct_option_letter}']
-                user_answer = st.session_state.answers.get(i, "")
-
-                is_correct = (user_answer == correct_answer)
-                if is_correct:
-                    correct_count += 1
-                else:
-                    wrong_count += 1
+            ids = np.array(st.session_state.question_ids, dtype=np.int32)
+            chosen = np.array([st.session_state.answers.get(i, -1) for i in range(len(ids))], dtype=np.int8)
+            correct = bank.grade(ids, chosen)
+            correct_count = int(correct.sum())
+            wrong_count = len(ids) - correct_count
 
-                analysis_data.append({
-                    "Q#": i+1,
-                    "Question": row['Question'],
-                    "Your Answer": user_answer,
-                    "Correct Answer": correct_answer,
-                    "Result": "Correct" if is_correct else "Wrong"
-                })
-
-            st.success(f" {student_name}, you got {correct_count} correct and {wrong_count} wrong out of 10.")
+            st.success(f" {student_name}, you got {correct_count} correct and {wrong_count} wrong out of {len(ids)}.")
 
             st.markdown("### Detailed Analysis")
-            analysis_df = pd.DataFrame(analysis_data)
+            answered = bank.options[ids, np.maximum(chosen, 0)]
+            analysis_df = pd.DataFrame({
+                "Q#": np.arange(1, len(ids) + 1),
+                "Question": bank.questions[ids],
+                "Your Answer": np.where(chosen >= 0, answered, ""),
+                "Correct Answer": bank.correct_options(ids),
+                "Result": np.where(correct, "Correct", "Wrong"),
+            })
             st.dataframe(analysis_df, use_container_width=True)
 
-            save_result(student_name, student_id, correct_count, len(questions))
+            # Save once per quiz, not on every rerun of the results page.
+            # Adaptive quizzes have already logged each answer as it was given.
+            if not st.session_state.get("quiz_saved", False):
+                if not st.session_state.get("quiz_adaptive", False):
+                    log_answers(student_id, ids, correct)
+                save_result(student_name, student_id, correct_count, len(ids))
+                st.session_state.quiz_saved = True
 
             if st.button("Restart Quiz"):
                 st.session_state.quiz_started = False
                 st.session_state.quiz_submitted = False
                 st.session_state.answers = {}
+                st.rerun()
     else:
         st.info("Please enter your name and ID to start the quiz.")
 
-def save_result(name, student_id, score, total_questions):
-    """Append quiz result to CSV with date & time."""
-    result_file = "data/quiz_results.csv"
+def adaptive_step(bank, student_id):
+    """
+    Shows the current adaptive question. On "Next" the answer is graded and
+    logged, which updates the student's ability, and the next question is
+    drawn from the matching difficulty band.
+    """
+    ids = st.session_state.question_ids
+    i = len(ids) - 1
+    qid = ids[i]
+    st.progress(i / QUIZ_LENGTH, text=f"Question {i+1} of {QUIZ_LENGTH}")
+    st.markdown(f"**Q{i+1}: {bank.questions[qid]}**")
+    options = bank.options[qid]
+    selected = st.radio(
+        f"Select your answer for Q{i+1}",
+        range(len(options)),
+        format_func=lambda k: options[k],
+        key=f"q_{i}"
+    )
+    if st.button("Next" if i + 1 < QUIZ_LENGTH else "Finish Quiz"):
+        st.session_state.answers[i] = selected
+        correct = bank.grade([qid], [selected])
+        log_answers(student_id, [qid], correct)
+        nxt = None
+        if i + 1 < QUIZ_LENGTH:
+            nxt = get_question_stats().next_question(student_id, exclude=ids)
+        if nxt is None:
+            st.session_state.quiz_submitted = True
+        else:
+            st.session_state.question_ids = ids + (int(nxt),)
+        st.rerun()
 
-    if not os.path.exists(result_file):
-        with open(result_file, "w") as f:
-            f.write("Name,Student_ID,DateTime,Score,Total_Questions\n")
 
+def save_result(name, student_id, score, total_questions):
+    """Append quiz result with date & time through the storage backend."""
     current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    new_entry = f"{name},{student_id},{current_time},{score},{total_questions}\n"
-
-    with open(result_file, "a") as f:
-        f.write(new_entry)
+    get_storage().add_quiz_result({
+        "Name": name,
+        "Student_ID": student_id,
+        "DateTime": current_time,
+        "Score": score,
+        "Total_Questions": total_questions
+    })
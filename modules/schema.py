@@ -0,0 +1,104 @@
+import sys
+import numpy as np
+import pandas as pd
+from modules.data_store import DATASETS
+
+
+def dataset_dtypes(name):
+    """Compact dtypes registered for dataset `name` (see DATASETS)."""
+    return DATASETS[name].get("dtypes") or {}
+
+
+def fitting_int_dtype(values, dtype):
+    """
+    `dtype`, or the narrowest wider signed integer that holds every value:
+    astype would silently wrap 40000 into an int16 as -25536.
+    """
+    if not len(values):
+        return dtype
+    lo, hi = values.min(), values.max()
+    for candidate in ("int8", "int16", "int32", "int64"):
+        if np.dtype(candidate).itemsize < np.dtype(dtype).itemsize:
+            continue
+        info = np.iinfo(candidate)
+        if info.min <= lo and hi <= info.max:
+            return candidate
+    return "float64"
+
+
+def apply_dtypes(df, dtypes):
+    """
+    Coerces columns to the given dtypes. Dates that fail to parse become
+    NaT and numbers that fail become NaN; integer columns with gaps stay
+    float so missing values survive, and ones whose values don't fit the
+    registered width are widened instead of wrapping.
+    """
+    if not dtypes:
+        return df
+    df = df.copy()
+    for col, dtype in dtypes.items():
+        if col not in df.columns:
+            continue
+        if dtype.startswith("datetime64"):
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+        elif dtype.startswith("int") or dtype.startswith("float"):
+            values = pd.to_numeric(df[col], errors="coerce")
+            if dtype.startswith("float"):
+                df[col] = values.astype(dtype)
+            elif not values.isna().any():
+                df[col] = values.astype(fitting_int_dtype(values, dtype))
+            else:
+                df[col] = values
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def apply_schema(df, name):
+    return apply_dtypes(df, dataset_dtypes(name))
+
+
+def value_bytes(value):
+    """Approximate deep size of a session value: frames, arrays, containers."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(value_bytes(k) + value_bytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(value_bytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def session_memory(state):
+    """Per-key byte estimate for a session_state-like mapping, largest first."""
+    sizes = {str(k): value_bytes(v) for k, v in dict(state).items()}
+    return dict(sorted(sizes.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def memory_report():
+    """
+    Bytes each dataset takes with pandas' inferred dtypes versus the
+    registered compact dtypes.
+    """
+    rows = []
+    for name, spec in DATASETS.items():
+        try:
+            inferred = pd.read_csv(spec["path"])
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            continue
+        compact = apply_schema(inferred, name)
+        rows.append({
+            "Dataset": name,
+            "Rows": len(inferred),
+            "Inferred_Bytes": value_bytes(inferred),
+            "Compact_Bytes": value_bytes(compact),
+        })
+    return pd.DataFrame(rows, columns=["Dataset", "Rows", "Inferred_Bytes", "Compact_Bytes"])
+
+
+if __name__ == "__main__":
+    print(memory_report().to_string(index=False))
@@ -0,0 +1,213 @@
+import os
+import io
+import json
+import hashlib
+import argparse
+import time
+import pandas as pd
+from modules.schema import apply_dtypes
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # optional: without pyarrow every load parses the CSV
+    pa = None
+
+SNAPSHOT_DIR_NAME = ".snapshots"
+SNAPSHOTS_ENABLED = os.environ.get("TEACHER_ASSISTANT_SNAPSHOTS", "1") != "0"
+_META_KEY = b"teacher_assistant.source"
+# Appended rows are parsed from the CSV tail on load; the snapshot itself is
+# only rewritten once this many have piled up since it was last written.
+REWRITE_TAIL_ROWS = 1000
+# The snapshot records a hash of the CSV's last bytes it covers; an append
+# leaves them untouched, an in-place rewrite of the same inode does not.
+TAIL_CHECK_BYTES = 4096
+
+
+def available():
+    return pa is not None and SNAPSHOTS_ENABLED
+
+
+def snapshot_path(csv_path):
+    folder = os.path.join(os.path.dirname(csv_path) or ".", SNAPSHOT_DIR_NAME)
+    name = os.path.splitext(os.path.basename(csv_path))[0] + ".arrow"
+    return os.path.join(folder, name)
+
+
+def _source_stat(csv_path, dtypes=None):
+    """What a snapshot was built from; it is stale if any of this differs."""
+    stat = os.stat(csv_path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "inode": stat.st_ino,
+            "dtypes": dtypes or {}}
+
+
+def _text_columns(dtypes):
+    """Columns declared as text are read verbatim, so e.g. '0012' keeps its zeros."""
+    return {col: str for col, dtype in (dtypes or {}).items() if dtype == "str"} or None
+
+
+def read_csv_typed(csv_path, columns=None, dtypes=None):
+    """Parses the CSV (a path or a binary buffer) with `dtypes`."""
+    try:
+        df = pd.read_csv(csv_path, dtype=_text_columns(dtypes), keep_default_na=not _text_columns(dtypes))
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        return pd.DataFrame(columns=columns or [])
+    return apply_dtypes(df, dtypes)
+
+
+def _write_snapshot(df, csv_path, source):
+    path = snapshot_path(csv_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    meta = dict(table.schema.metadata or {})
+    meta[_META_KEY] = json.dumps(source).encode()
+    table = table.replace_schema_metadata(meta)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    # Uncompressed IPC: loading is a plain read, with no decompression or
+    # CSV parsing and type inference.
+    with pa.OSFile(tmp, "wb") as sink:
+        with ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, path)
+
+
+def _fingerprint(data):
+    return hashlib.sha1(data[-TAIL_CHECK_BYTES:]).hexdigest()
+
+
+def _read_snapshot(csv_path):
+    """
+    Returns (frame, source stat recorded at write time) or (None, None).
+    to_pandas copies the columns out of the Arrow buffers (categoricals and
+    strings can't be shared), so the file is simply read, not kept mapped.
+    """
+    path = snapshot_path(csv_path)
+    try:
+        with pa.OSFile(path, "rb") as source:
+            table = ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None, None
+    meta = (table.schema.metadata or {}).get(_META_KEY)
+    if meta is None:
+        return None, None
+    return table.to_pandas(), json.loads(meta)
+
+
+def _read_tail(csv_path, recorded, end, columns, dtypes=None):
+    """
+    Parses the complete rows between the snapshot's recorded size and `end`.
+    Returns (frame or None, offset just past the last complete row,
+    fingerprint at that offset), so a row still being written is left for
+    the next load; or None if the bytes the snapshot covers have changed,
+    i.e. the file was rewritten rather than appended to.
+    """
+    offset = recorded["size"]
+    with open(csv_path, "rb") as f:
+        f.seek(max(offset - TAIL_CHECK_BYTES, 0))
+        before = f.read(offset - f.tell())
+        if not before.endswith(b"\n") or _fingerprint(before) != recorded.get("tail"):
+            return None
+        data = f.read(end - offset)
+    data = data[:data.rfind(b"\n") + 1]
+    if not data.strip():
+        return None, offset, recorded["tail"]
+    tail = pd.read_csv(io.BytesIO(data), header=None, names=list(columns),
+                       dtype=_text_columns(dtypes), keep_default_na=not _text_columns(dtypes))
+    return tail, offset + len(data), _fingerprint(before + data)
+
+
+def load_snapshot(csv_path, columns=None, dtypes=None):
+    """
+    Loads `csv_path` through its Arrow snapshot, regenerating the snapshot
+    when the CSV changed. If the CSV only grew in place (our writers append),
+    just the new tail is parsed; the snapshot is rewritten to include it
+    once REWRITE_TAIL_ROWS rows have accumulated.
+    Falls back to parsing the CSV when pyarrow is unavailable.
+    """
+    if not available():
+        return read_csv_typed(csv_path, columns, dtypes)
+    try:
+        current = _source_stat(csv_path, dtypes)
+    except OSError:
+        return pd.DataFrame(columns=columns or [])
+
+    df, recorded = _read_snapshot(csv_path)
+    if df is not None and all(recorded.get(k) == v for k, v in current.items()):
+        return df
+
+    # Only the bytes that existed at the stat above are read, so rows
+    # appended meanwhile are picked up by the next load rather than being
+    # stamped into the snapshot under the old size.
+    if (df is not None and recorded.get("dtypes") == current["dtypes"]
+            and recorded["inode"] == current["inode"] and recorded["size"] < current["size"]):
+        try:
+            found = _read_tail(csv_path, recorded, current["size"], df.columns, dtypes)
+        except (OSError, pd.errors.ParserError, ValueError):
+            found = None
+        if found is not None:
+            tail, end, tail_hash = found
+            if tail is None:
+                return df
+            df = pd.concat([df, apply_dtypes(tail, dtypes)], ignore_index=True)
+            df = apply_dtypes(df, dtypes)
+            if len(tail) >= REWRITE_TAIL_ROWS:
+                _try_write(df, csv_path, dict(current, size=end, tail=tail_hash))
+            return df
+
+    try:
+        with open(csv_path, "rb") as f:
+            data = f.read(current["size"])
+    except OSError:
+        return pd.DataFrame(columns=columns or [])
+    df = read_csv_typed(io.BytesIO(data), columns, dtypes)
+    if current["size"] > 0:
+        _try_write(df, csv_path, dict(current, tail=_fingerprint(data)))
+    return df
+
+
+def _try_write(df, csv_path, source):
+    try:
+        _write_snapshot(df, csv_path, source)
+    except (OSError, pa.ArrowException):
+        pass  # snapshot is only an accelerator; the CSV stays the source of truth
+
+
+def rebuild_snapshots():
+    """Regenerates snapshots for every known dataset. Returns {name: rows}."""
+    from modules.data_store import DATASETS
+    built = {}
+    for name, spec in DATASETS.items():
+        if not os.path.exists(spec["path"]):
+            continue
+        source = _source_stat(spec["path"], spec.get("dtypes"))
+        with open(spec["path"], "rb") as f:
+            data = f.read(source["size"])
+        df = read_csv_typed(io.BytesIO(data), spec["columns"], spec.get("dtypes"))
+        _write_snapshot(df, spec["path"], dict(source, tail=_fingerprint(data)))
+        built[name] = len(df)
+    return built
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build Arrow snapshots of the CSV datasets.")
+    parser.add_argument("command", choices=["build", "bench"])
+    args = parser.parse_args()
+    if not available():
+        raise SystemExit("pyarrow is not installed (or TEACHER_ASSISTANT_SNAPSHOTS=0)")
+
+    from modules.data_store import DATASETS
+    if args.command == "build":
+        for name, rows in rebuild_snapshots().items():
+            print(f"{name}: {rows} rows -> {snapshot_path(DATASETS[name]['path'])}")
+    else:
+        rebuild_snapshots()
+        for name, spec in DATASETS.items():
+            if not os.path.exists(spec["path"]):
+                continue
+            t = time.perf_counter()
+            read_csv_typed(spec["path"], spec["columns"], spec.get("dtypes"))
+            csv_ms = (time.perf_counter() - t) * 1000
+            t = time.perf_counter()
+            load_snapshot(spec["path"], spec["columns"], spec.get("dtypes"))
+            snap_ms = (time.perf_counter() - t) * 1000
+            print(f"{name:15s} csv {csv_ms:8.2f} ms   snapshot {snap_ms:8.2f} ms")
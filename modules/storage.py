@@ -0,0 +1,308 @@
+import os
+import sqlite3
+import argparse
+import threading
+from datetime import datetime
+import pandas as pd
+from modules.csv_writer import get_writer, rewrite
+from modules.schema import apply_schema
+from modules.data_store import DATA_DIR, DATASETS, load_dataset, load_cached, bump_generation, data_version, generation
+
+# Select the backend with TEACHER_ASSISTANT_STORAGE=csv|sqlite (default csv).
+STORAGE_BACKEND = os.environ.get("TEACHER_ASSISTANT_STORAGE", "csv")
+DB_PATH = os.environ.get("TEACHER_ASSISTANT_DB", os.path.join(DATA_DIR, "dashboard.db"))
+
+TABLES = {
+    "appointments": DATASETS["appointments"]["columns"],
+    "thoughts": DATASETS["thoughts"]["columns"],
+    "quiz_results": DATASETS["quiz_results"]["columns"],
+    "users": DATASETS["users"]["columns"],
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS appointments (
+    Student_Name TEXT, Student_ID TEXT, Teacher_ID TEXT,
+    Teacher_Name TEXT, Slot TEXT, Date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_appointments_student ON appointments(Student_ID);
+CREATE INDEX IF NOT EXISTS idx_appointments_teacher ON appointments(Teacher_ID);
+CREATE INDEX IF NOT EXISTS idx_appointments_date ON appointments(Date);
+
+CREATE TABLE IF NOT EXISTS thoughts (
+    Student_Name TEXT, Student_ID TEXT, Teacher_Name TEXT, Thought TEXT, Date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_thoughts_student ON thoughts(Student_ID);
+CREATE INDEX IF NOT EXISTS idx_thoughts_date ON thoughts(Date);
+
+CREATE TABLE IF NOT EXISTS quiz_results (
+    Name TEXT, Student_ID TEXT, DateTime TEXT, Score INTEGER, Total_Questions INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_quiz_results_student ON quiz_results(Student_ID);
+CREATE INDEX IF NOT EXISTS idx_quiz_results_datetime ON quiz_results(DateTime);
+
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY, password TEXT
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY, value TEXT
+);
+"""
+
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class CSVStorage:
+    """
+    Default backend: the append-only CSV files under data/.
+    Reads go through the shared data_store cache.
+    """
+    name = "csv"
+
+    def __init__(self):
+        for table in TABLES:
+            self._ensure_file(table)
+
+    def _ensure_file(self, table):
+        path = DATASETS[table]["path"]
+        if not os.path.exists(path) or os.stat(path).st_size == 0:
+            with open(path, "w") as f:
+                f.write(",".join(TABLES[table]) + "\n")
+            bump_generation(path)
+
+    def version(self, table):
+        """Token that changes whenever `table` changes; used to key derived caches."""
+        return data_version(table)
+
+    def _append(self, table, row):
+        get_writer().append(DATASETS[table]["path"], TABLES[table], row)
+
+    def _clear(self, table):
+        get_writer().flush()
+        path = DATASETS[table]["path"]
+        if os.path.exists(path):
+            os.remove(path)
+        bump_generation(path)
+        self._ensure_file(table)
+
+    # appointments
+    def add_appointment(self, row):
+        self._append("appointments", row)
+
+    def appointments(self):
+        return load_dataset("appointments")
+
+    def appointments_for_student(self, student_id):
+        df = self.appointments()
+        if "Student_ID" not in df.columns:
+            return pd.DataFrame()
+        return df[df['Student_ID'].astype(str) == str(student_id)]
+
+    def count_appointments(self):
+        return len(self.appointments())
+
+    def clear_appointments(self):
+        self._clear("appointments")
+
+    # thoughts
+    def add_thought(self, row):
+        self._append("thoughts", row)
+
+    def thoughts(self):
+        return load_dataset("thoughts")
+
+    def count_thoughts(self):
+        return len(self.thoughts())
+
+    def clear_thoughts(self):
+        self._clear("thoughts")
+
+    # quiz results
+    def add_quiz_result(self, row):
+        self._append("quiz_results", row)
+
+    def quiz_results(self):
+        return load_dataset("quiz_results")
+
+    # users
+    def add_user(self, username, password):
+        self._append("users", {"username": username, "password": password})
+
+    def users(self):
+        return load_dataset("users")
+
+    def set_passwords(self, passwords):
+        """Replaces the stored password of each username in `passwords` in one rewrite."""
+        def _update(rows):
+            u, p = rows[0].index('username'), rows[0].index('password')
+            for row in rows[1:]:
+                if len(row) > max(u, p) and row[u] in passwords:
+                    row[p] = passwords[row[u]]
+            return rows
+        rewrite(DATASETS["users"]["path"], _update)
+
+
+class SQLiteStorage:
+    """
+    SQLite backend in WAL mode. Per-student lookups and admin counts are
+    answered by indexed queries instead of scanning whole CSV files.
+    """
+    name = "sqlite"
+
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        migrate_csv_to_sqlite(db_path)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def version(self, table):
+        """Token that changes whenever `table` changes; used to key derived caches."""
+        return (generation(f"sqlite:{table}"), data_version(self.db_path),
+                data_version(self.db_path + "-wal"))
+
+    def _insert(self, table, row):
+        columns = TABLES[table]
+        placeholders = ",".join("?" for _ in columns)
+        with self._conn() as conn:
+            conn.execute(f"INSERT INTO {table} ({','.join(columns)}) VALUES ({placeholders})",
+                         [row.get(c) for c in columns])
+        bump_generation(f"sqlite:{table}")
+
+    def _read_table(self, table):
+        def _read():
+            df = pd.read_sql_query(f"SELECT {','.join(TABLES[table])} FROM {table} ORDER BY rowid",
+                                   self._conn())
+            return apply_schema(df, table)
+        return load_cached(f"sqlite:{self.db_path}:{table}", self.version(table), _read)
+
+    def _clear(self, table):
+        with self._conn() as conn:
+            conn.execute(f"DELETE FROM {table}")
+        bump_generation(f"sqlite:{table}")
+
+    # appointments
+    def add_appointment(self, row):
+        self._insert("appointments", row)
+
+    def appointments(self):
+        return self._read_table("appointments")
+
+    def appointments_for_student(self, student_id):
+        df = pd.read_sql_query(
+            f"SELECT {','.join(TABLES['appointments'])} FROM appointments "
+            "WHERE Student_ID = ? ORDER BY rowid",
+            self._conn(), params=(str(student_id),))
+        return apply_schema(df, "appointments")
+
+    def count_appointments(self):
+        return self._conn().execute("SELECT COUNT(*) FROM appointments").fetchone()[0]
+
+    def clear_appointments(self):
+        self._clear("appointments")
+
+    # thoughts
+    def add_thought(self, row):
+        self._insert("thoughts", row)
+
+    def thoughts(self):
+        return self._read_table("thoughts")
+
+    def count_thoughts(self):
+        return self._conn().execute("SELECT COUNT(*) FROM thoughts").fetchone()[0]
+
+    def clear_thoughts(self):
+        self._clear("thoughts")
+
+    # quiz results
+    def add_quiz_result(self, row):
+        self._insert("quiz_results", row)
+
+    def quiz_results(self):
+        return self._read_table("quiz_results")
+
+    # users
+    def add_user(self, username, password):
+        self._insert("users", {"username": username, "password": password})
+
+    def users(self):
+        return self._read_table("users")
+
+    def set_passwords(self, passwords):
+        with self._conn() as conn:
+            conn.executemany("UPDATE users SET password = ? WHERE username = ?",
+                             [(p, u) for u, p in passwords.items()])
+        bump_generation("sqlite:users")
+
+
+def migrate_csv_to_sqlite(db_path=DB_PATH, force=False):
+    """
+    One-shot import of data/*.csv into the SQLite database. Does nothing if the
+    database has already been migrated unless force=True, in which case the
+    tables are emptied and re-imported.
+    Returns a dict of table -> rows imported.
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    done = conn.execute("SELECT value FROM meta WHERE key = 'migrated_at'").fetchone()
+    if done and not force:
+        conn.close()
+        return {}
+
+    imported = {}
+    with conn:
+        for table, columns in TABLES.items():
+            path = DATASETS[table]["path"]
+            try:
+                df = pd.read_csv(path, dtype=str, keep_default_na=False)
+            except (FileNotFoundError, pd.errors.EmptyDataError):
+                df = pd.DataFrame(columns=columns)
+            df = df.reindex(columns=columns)
+            if force:
+                conn.execute(f"DELETE FROM {table}")
+            placeholders = ",".join("?" for _ in columns)
+            verb = "INSERT OR REPLACE" if table == "users" else "INSERT"
+            conn.executemany(f"{verb} INTO {table} ({','.join(columns)}) VALUES ({placeholders})",
+                             df.itertuples(index=False, name=None))
+            imported[table] = len(df)
+            bump_generation(f"sqlite:{table}")
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_at', ?)", (_now(),))
+    conn.close()
+    return imported
+
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage():
+    """Returns the process-wide storage backend selected by STORAGE_BACKEND."""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = SQLiteStorage() if STORAGE_BACKEND == "sqlite" else CSVStorage()
+    return _storage
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate data/*.csv into the SQLite backend.")
+    parser.add_argument("command", choices=["migrate"])
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--force", action="store_true", help="re-import even if already migrated")
+    args = parser.parse_args()
+    counts = migrate_csv_to_sqlite(args.db, force=args.force)
+    if not counts:
+        print(f"{args.db} already migrated (use --force to re-import)")
+    for table, n in counts.items():
+        print(f"{table}: {n} rows")
@@ -0,0 +1,232 @@
+import os
+import argparse
+import numpy as np
+import pandas as pd
+from modules.data_store import DATASETS
+from modules.availability import WEEKDAYS
+
+FIRST_NAMES = ["Arun", "Leena", "Chirag", "Nikita", "Om", "Qadir", "Priya", "Rahul", "Kajal", "Raman",
+               "Aman", "Sneha", "Vikram", "Meera", "Farhan", "Isha", "Karan", "Tanvi", "Yash", "Zoya",
+               "Aria", "Mason", "Noah", "Emma", "Liam", "Olivia", "Ravi", "Anita", "Dev", "Pooja"]
+LAST_NAMES = ["Das", "Mehta", "Sharma", "Gupta", "Reddy", "Bansal", "Dhakad", "Verma", "Iyer", "Khan",
+              "Singh", "Patel", "Nair", "Joshi", "Kapoor", "Young", "Taylor", "Rao", "Bose", "Malik"]
+SUBJECTS = ["Mathematics", "Physics", "Chemistry", "Biology", "Computer Science", "Statistics",
+            "Economics", "History", "Geography", "English", "Law", "Philosophy"]
+BLOCKS = ["Block A", "Block B", "Block C", "Block D", "Block E"]
+DAY_PATTERNS = ["Mon-Fri", "Mon,Wed,Fri", "Tue,Thu", "Mon-Sat", "Wed-Fri", "Mon,Tue,Thu"]
+THOUGHTS = ["Explains concepts clearly.", "Very helpful during office hours.",
+            "Classes are engaging, but the pace is fast.", "Gives useful feedback on assignments.",
+            "I would like more practice problems.", "Patient and approachable.",
+            "Lectures are well organised.", "Could share notes before class."]
+QUESTION_TEMPLATES = [
+    ("What is {a} + {b}?", lambda a, b: a + b),
+    ("What is {a} x {b}?", lambda a, b: a * b),
+    ("What is {a} - {b}?", lambda a, b: a - b),
+]
+
+FAQ_VERBS = ["submit", "check", "change", "download", "pay", "renew", "cancel", "reset", "find", "request"]
+FAQ_THINGS = ["assignment", "fee receipt", "timetable", "library card", "hostel form", "exam schedule",
+              "attendance record", "password", "ID card", "scholarship form", "lab report", "transcript"]
+FAQ_CONTEXTS = ["for {subject}", "before the midterm", "after the deadline", "online", "at {block}",
+                "in semester {n}", "for the {subject} lab", "without the portal"]
+
+START = pd.Timestamp("2025-06-01")
+CHUNK_ROWS = 500_000
+
+
+def _names(rng, n):
+    first = np.array(FIRST_NAMES)[rng.integers(len(FIRST_NAMES), size=n)]
+    last = np.array(LAST_NAMES)[rng.integers(len(LAST_NAMES), size=n)]
+    return pd.Series(first).str.cat(pd.Series(last), sep=" ")
+
+
+def _hhmm(minutes):
+    minutes = pd.Series(minutes)
+    return (minutes // 60).astype(int).map("{:02d}".format) + ":" + (minutes % 60).astype(int).map("{:02d}".format)
+
+
+def _timestamps(rng, n, days=150):
+    seconds = rng.integers(0, days * 86400, size=n)
+    return (START + pd.to_timedelta(np.sort(seconds), unit="s")).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def make_teachers(n, rng):
+    lecture = rng.integers(16, 32, size=n) * 30          # 08:00 - 15:30
+    free = lecture + 60 + rng.integers(0, 4, size=n) * 30
+    return pd.DataFrame({
+        "Teacher_ID": [f"T{i:05d}" for i in range(1, n + 1)],
+        "Teacher_Name": _names(rng, n),
+        "Subject": np.array(SUBJECTS)[rng.integers(len(SUBJECTS), size=n)],
+        "Block": np.array(BLOCKS)[rng.integers(len(BLOCKS), size=n)],
+        "Room_Number": rng.integers(100, 500, size=n),
+        "Cabin_Number": rng.integers(100, 500, size=n),
+        "Lecture_Start": _hhmm(lecture),
+        "Lecture_End": _hhmm(lecture + 60),
+        "Free_Start": _hhmm(free),
+        "Free_End": _hhmm(free + 60),
+        "Available_Days": np.array(DAY_PATTERNS)[rng.integers(len(DAY_PATTERNS), size=n)],
+    })
+
+
+def make_students(n, rng):
+    return pd.DataFrame({
+        "Student_ID": rng.choice(np.arange(1000, 1000 + n * 10), size=n, replace=False).astype(str),
+        "Student_Name": _names(rng, n),
+        # Per-student probability of answering a quiz question correctly.
+        "Skill": rng.beta(5, 3, size=n),
+    })
+
+
+def make_appointments(n, teachers, students, rng):
+    # Popularity is skewed: a few teachers take most bookings.
+    weights = rng.zipf(1.6, size=len(teachers)).astype(float)
+    t = rng.choice(len(teachers), size=n, p=weights / weights.sum())
+    s = rng.integers(len(students), size=n)
+    booked = _timestamps(rng, n)
+    slot_day = pd.to_datetime(booked.str[:10]) + pd.to_timedelta(rng.integers(1, 8, size=n), unit="D")
+    start = teachers["Free_Start"].to_numpy()[t]
+    start_min = pd.Series(start).str[:2].astype(int) * 60 + pd.Series(start).str[3:].astype(int)
+    start_min = start_min + rng.integers(0, 2, size=n) * 30
+    slot = (pd.Series(np.array(WEEKDAYS)[slot_day.weekday]) + " " + pd.Series(slot_day.strftime("%Y-%m-%d"))
+            + " " + _hhmm(start_min) + "-" + _hhmm(start_min + 30))
+    return pd.DataFrame({
+        "Student_Name": students["Student_Name"].to_numpy()[s],
+        "Student_ID": students["Student_ID"].to_numpy()[s],
+        "Teacher_ID": teachers["Teacher_ID"].to_numpy()[t],
+        "Teacher_Name": teachers["Teacher_Name"].to_numpy()[t],
+        "Slot": slot.to_numpy(),
+        "Date": booked,
+    })
+
+
+def make_thoughts(n, teachers, students, rng):
+    t = rng.integers(len(teachers), size=n)
+    s = rng.integers(len(students), size=n)
+    return pd.DataFrame({
+        "Student_Name": students["Student_Name"].to_numpy()[s],
+        "Student_ID": students["Student_ID"].to_numpy()[s],
+        "Teacher_Name": teachers["Teacher_Name"].to_numpy()[t],
+        "Thought": np.array(THOUGHTS)[rng.integers(len(THOUGHTS), size=n)],
+        "Date": _timestamps(rng, n),
+    })
+
+
+def make_quiz_results(n, students, rng, questions=10):
+    s = rng.integers(len(students), size=n)
+    return pd.DataFrame({
+        "Name": students["Student_Name"].to_numpy()[s],
+        "Student_ID": students["Student_ID"].to_numpy()[s],
+        "DateTime": _timestamps(rng, n),
+        "Score": rng.binomial(questions, students["Skill"].to_numpy()[s]),
+        "Total_Questions": questions,
+    })
+
+
+def make_quiz_questions(n, rng):
+    a = rng.integers(2, 100, size=n)
+    b = rng.integers(2, 100, size=n)
+    kind = rng.integers(len(QUESTION_TEMPLATES), size=n)
+    questions, options = [], []
+    for x, y, k in zip(a, b, kind):
+        template, answer = QUESTION_TEMPLATES[k]
+        right = answer(x, y)
+        choices = [right, right + 1, right - 1, right + 10]
+        questions.append(template.format(a=x, b=y))
+        options.append(choices)
+    options = np.array(options)
+    # Shuffle each row's options and remember where the right answer went.
+    order = rng.permuted(np.tile(np.arange(4), (n, 1)), axis=1)
+    options = np.take_along_axis(options, order, axis=1)
+    correct = np.argmax(order == 0, axis=1)
+    return pd.DataFrame({
+        "Question": questions,
+        "Option_A": options[:, 0], "Option_B": options[:, 1],
+        "Option_C": options[:, 2], "Option_D": options[:, 3],
+        "Correct_Option": np.array(["A", "B", "C", "D"])[correct],
+        "Subject": np.array(["Arithmetic", "Algebra", "Numbers"])[kind],
+    })
+
+
+def make_faq(n, rng):
+    verbs = np.array(FAQ_VERBS)[rng.integers(len(FAQ_VERBS), size=n)]
+    things = np.array(FAQ_THINGS)[rng.integers(len(FAQ_THINGS), size=n)]
+    contexts = np.array(FAQ_CONTEXTS)[rng.integers(len(FAQ_CONTEXTS), size=n)]
+    subjects = np.array(SUBJECTS)[rng.integers(len(SUBJECTS), size=n)]
+    blocks = np.array(BLOCKS)[rng.integers(len(BLOCKS), size=n)]
+    semesters = rng.integers(1, 9, size=n)
+    questions = [f"How do I {v} my {t} {c.format(subject=s, block=b, n=k)}?"
+                 for v, t, c, s, b, k in zip(verbs, things, contexts, subjects, blocks, semesters)]
+    answers = [f"Go to the {b} office or the student portal to {v} your {t}." for v, t, b in zip(verbs, things, blocks)]
+    return pd.DataFrame({"Question": questions, "Answer": answers})
+
+
+def _write(path, frames):
+    """Writes an iterable of DataFrame chunks to one CSV without holding them all."""
+    header = True
+    rows = 0
+    with open(path, "w", newline="") as f:
+        for frame in frames:
+            frame.to_csv(f, header=header, index=False)
+            header = False
+            rows += len(frame)
+    return rows
+
+
+def _chunked(total, make, rng):
+    done = 0
+    while done < total:
+        n = min(CHUNK_ROWS, total - done)
+        yield make(n, rng)
+        done += n
+
+
+def generate(out_dir, teachers=1000, appointments=10_000, thoughts=5000, quiz_results=10_000,
+             quiz_questions=1000, students=None, seed=0, faq=1000):
+    """
+    Writes a synthetic data/ directory under `out_dir` with the same files
+    and columns as the real one. Large tables are generated and written in
+    chunks, so 10^7-row files don't need 10^7 rows in memory.
+    Returns {dataset: rows written}.
+    """
+    rng = np.random.default_rng(seed)
+    data_dir = os.path.join(out_dir, "data")
+    os.makedirs(data_dir, exist_ok=True)
+    path = lambda name: os.path.join(out_dir, DATASETS[name]["path"])
+
+    roster = make_teachers(teachers, rng)
+    people = make_students(students or max(10, max(appointments, quiz_results) // 20), rng)
+    written = {"teachers": _write(path("teachers"), [roster])}
+    written["appointments"] = _write(path("appointments"), _chunked(
+        appointments, lambda n, r: make_appointments(n, roster, people, r), rng))
+    written["thoughts"] = _write(path("thoughts"), _chunked(
+        thoughts, lambda n, r: make_thoughts(n, roster, people, r), rng))
+    written["quiz_results"] = _write(path("quiz_results"), _chunked(
+        quiz_results, lambda n, r: make_quiz_results(n, people, r), rng))
+    written["quiz_questions"] = _write(path("quiz_questions"), _chunked(quiz_questions, make_quiz_questions, rng))
+    written["faq"] = _write(path("faq"), _chunked(faq, make_faq, rng))
+    written["users"] = _write(path("users"), [pd.DataFrame({
+        "username": people["Student_Name"].str.replace(" ", "_") + "_" + people["Student_ID"],
+        "password": "changeme",
+    })])
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic data/ directory for load and benchmark runs.")
+    parser.add_argument("--out", required=True, help="directory to create data/ in (never the repo root)")
+    parser.add_argument("--teachers", type=int, default=1000)
+    parser.add_argument("--appointments", type=int, default=10_000)
+    parser.add_argument("--thoughts", type=int, default=5000)
+    parser.add_argument("--quiz-results", type=int, default=10_000)
+    parser.add_argument("--quiz-questions", type=int, default=1000)
+    parser.add_argument("--students", type=int, default=None)
+    parser.add_argument("--faq", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if os.path.abspath(args.out) == os.path.abspath("."):
+        raise SystemExit("Refusing to overwrite the real data/ directory; pass another --out")
+    counts = generate(args.out, args.teachers, args.appointments, args.thoughts, args.quiz_results,
+                      args.quiz_questions, args.students, args.seed, args.faq)
+    for name, rows in counts.items():
+        print(f"{name}: {rows} rows")
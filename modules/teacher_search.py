@@ -0,0 +1,231 @@
+import re
+import bisect
+import heapq
+from collections import defaultdict, Counter
+from modules.data_store import load_dataset, load_cached, data_version
+
+NGRAM = 3
+FUZZY_NGRAM = 2
+
+# Ranking tiers, highest first.
+SCORE_EXACT_ID = 100
+SCORE_EXACT_NAME = 90
+SCORE_ID_SUBSTRING = 70
+SCORE_TOKEN = 60
+SCORE_TOKEN_PREFIX = 50
+SCORE_SUBSTRING = 40
+SCORE_FUZZY = 30
+
+_TOKEN_RE = re.compile(r"\w+")
+_ID_RE = re.compile(r"[a-z]*\d+")
+
+
+def _normalize(text):
+    return " ".join(_TOKEN_RE.findall(str(text).lower()))
+
+
+def _ngrams(text, n=NGRAM):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _padded_ngrams(token, n=FUZZY_NGRAM):
+    return _ngrams(f"^{token}$", n)
+
+
+def _max_typos(word):
+    return 1 if len(word) <= 5 else 2
+
+
+def _edit_distance(a, b, limit):
+    """Optimal string alignment distance (adjacent swaps count once), capped at limit + 1."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class TeacherSearchIndex:
+    """
+    In-memory search index over the teacher roster.
+
+    - exact ID map: "t101" and "101" both resolve to T101
+    - inverted index of lowercase name tokens, plus a sorted token list for
+      prefix lookups via bisect
+    - trigram index over the full name/ID for substring search
+    - bigram index over name tokens; candidates sharing a bigram with a
+      query word are verified by edit distance for typo-tolerant matching
+
+    Built once per dataset version; queries touch only the posting lists of
+    the query's tokens and trigrams, not the whole roster.
+    """
+
+    def __init__(self, teacher_df):
+        self.df = teacher_df.reset_index(drop=True)
+        self.names = [_normalize(n) for n in self.df['Teacher_Name']]
+        self.ids = [str(t).lower() for t in self.df['Teacher_ID']]
+
+        self.id_map = {}
+        self.tokens = defaultdict(set)
+        self.substring_grams = defaultdict(set)
+        self.token_grams = defaultdict(set)
+
+        for pos, (name, tid) in enumerate(zip(self.names, self.ids)):
+            self.id_map.setdefault(tid, pos)
+            digits = "".join(ch for ch in tid if ch.isdigit())
+            if digits:
+                self.id_map.setdefault(digits, pos)
+            for gram in _ngrams(name) | _ngrams(tid):
+                self.substring_grams[gram].add(pos)
+            for token in name.split():
+                self.tokens[token].add(pos)
+
+        for token in self.tokens:
+            for gram in _padded_ngrams(token):
+                self.token_grams[gram].add(token)
+
+        self.sorted_tokens = sorted(self.tokens)
+        self.sorted_id_keys = sorted(self.id_map)
+
+    def __len__(self):
+        return len(self.df)
+
+    def _prefix_matches(self, prefix):
+        start = bisect.bisect_left(self.sorted_tokens, prefix)
+        matches = set()
+        for token in self.sorted_tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            matches |= self.tokens[token]
+        return matches
+
+    def _id_prefix_matches(self, prefix):
+        start = bisect.bisect_left(self.sorted_id_keys, prefix)
+        matches = set()
+        for key in self.sorted_id_keys[start:]:
+            if not key.startswith(prefix):
+                break
+            matches.add(self.id_map[key])
+        return matches
+
+    def _substring_matches(self, q):
+        grams = _ngrams(q)
+        if not grams:
+            return set()
+        postings = sorted((self.substring_grams.get(g, set()) for g in grams), key=len)
+        candidates = set(postings[0])
+        for p in postings[1:]:
+            candidates &= p
+            if not candidates:
+                return candidates
+        return {pos for pos in candidates if q in self.names[pos] or q in self.ids[pos]}
+
+    def _fuzzy_matches(self, q):
+        """
+        Scores positions by how many query words match a name token within a
+        small edit distance; closer matches score higher.
+        """
+        scores = Counter()
+        for word in q.split():
+            limit = _max_typos(word)
+            candidates = set()
+            for g in _padded_ngrams(word):
+                candidates |= self.token_grams.get(g, set())
+            best = {}
+            for token in candidates:
+                dist = _edit_distance(word, token, limit)
+                if dist <= limit:
+                    similarity = 1 - dist / max(len(word), len(token))
+                    for pos in self.tokens[token]:
+                        best[pos] = max(best.get(pos, 0), similarity)
+            scores.update(best)
+        return scores
+
+    def search(self, query, limit=None):
+        """
+        Returns (position, score) pairs ranked best first.
+        """
+        q = _normalize(query)
+        if not q:
+            return []
+        scores = {}
+
+        def hit(positions, score):
+            for pos in positions:
+                if scores.get(pos, 0) < score:
+                    scores[pos] = score
+
+        compact = q.replace(" ", "")
+        if compact in self.id_map:
+            hit([self.id_map[compact]], SCORE_EXACT_ID)
+
+        if _ID_RE.fullmatch(compact):
+            if len(compact) >= NGRAM:
+                hit(self._substring_matches(compact), SCORE_ID_SUBSTRING)
+            else:
+                hit(self._id_prefix_matches(compact), SCORE_ID_SUBSTRING)
+        else:
+            words = q.split()
+            token_sets = [self.tokens.get(w, set()) for w in words]
+            if all(token_sets):
+                exact = set.intersection(*token_sets)
+                hit({pos for pos in exact if self.names[pos] == q}, SCORE_EXACT_NAME)
+                hit(exact, SCORE_TOKEN)
+            prefix_sets = [self._prefix_matches(w) for w in words]
+            if all(prefix_sets):
+                hit(set.intersection(*prefix_sets), SCORE_TOKEN_PREFIX)
+            if len(q) >= NGRAM:
+                hit(self._substring_matches(q), SCORE_SUBSTRING)
+            if not scores:
+                words_count = len(q.split())
+                for pos, similarity in self._fuzzy_matches(q).items():
+                    hit([pos], SCORE_FUZZY * similarity / words_count)
+
+        key = lambda kv: (-kv[1], self.names[kv[0]])
+        if limit:
+            return heapq.nsmallest(limit, scores.items(), key=key)
+        return sorted(scores.items(), key=key)
+
+    def find_mention(self, text):
+        """
+        Position of the teacher a free-text question is about, or None.
+        An ID anywhere in the text ("T101 kaha milenge?") wins; otherwise the
+        teacher whose name shares the most words with the text, preferring
+        one whose whole name appears.
+        """
+        words = _normalize(text).split()
+        for word in words:
+            if word in self.id_map and any(ch.isdigit() for ch in word):
+                return self.id_map[word]
+
+        counts = Counter()
+        for word in set(words):
+            counts.update(self.tokens.get(word, ()))
+        if not counts:
+            return None
+        key = lambda pos: (counts[pos], counts[pos] == len(self.names[pos].split()), -pos)
+        return max(counts, key=key)
+
+    def search_df(self, query, limit=None):
+        """Returns the matching teacher rows as a DataFrame, best match first."""
+        ranked = self.search(query, limit)
+        return self.df.iloc[[pos for pos, _ in ranked]]
+
+
+def get_teacher_index():
+    """Returns the search index for the current version of the teacher dataset."""
+    return load_cached("teacher_search_index", data_version("teachers"),
+                       lambda: TeacherSearchIndex(load_dataset("teachers")))
+
+
+def search_teachers(query, limit=None):
+    return get_teacher_index().search_df(query, limit)
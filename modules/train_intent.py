@@ -0,0 +1,268 @@
+import os
+import re
+import json
+import stat
+import time
+import random
+import hashlib
+import argparse
+import tempfile
+from collections import Counter
+import numpy as np
+from modules.data_store import load_dataset
+from modules.intent_model import MODEL_PATH, normalize_query, get_intent_model
+
+# The notebook's templates, applied to every teacher on the roster rather
+# than the first 90.
+INTENT_TEMPLATES = {
+    "find_location": [
+        "Where is {name}?", "{tid} kaha milenge?", "{name} abhi kahan hain?",
+        "{tid} ki location kya hai?", "Tell me the location of {name}",
+    ],
+    "check_availability": [
+        "Is {name} free right now?", "{tid} ka free time kab hai?", "When is {name} available?",
+        "{tid} abhi padhate hain kya?", "{name} ki next free slot kya hai?",
+    ],
+    "book_appointment": [
+        "Book appointment with {name} at 2 PM", "Mujhe {tid} ke sath 3 baje milna hai",
+        "Can I meet {name} tomorrow?", "{tid} se baat karni hai", "Schedule meeting with {name}",
+    ],
+}
+GREETINGS = ["Hi", "Hello", "Namaste", "Hey bot", "Good morning", "Kaise ho", "Are you there?", "Hi assistant",
+             "Hello there", "Good evening", "Hey", "Namaste ji"]
+FALLBACKS = ["What is the weather?", "Tell me a joke", "Open camera", "Play music", "Who is Elon Musk?",
+             "What is the time?", "Sing a song", "Aaj ka news kya hai?", "Set an alarm", "Who won the match?"]
+
+# Hashed word uni- and bigrams: stateless, so chunks can be featurized in
+# parallel and an existing model can keep learning without refitting a vocabulary.
+N_FEATURES = 2 ** 18
+CHUNK_QUERIES = 20_000
+# Above this share of changed teachers an update retrains from scratch.
+MAX_UPDATE_SHARE = 0.2
+UPDATE_EPOCHS = 5
+# Unchanged queries mixed into an update so old teachers aren't forgotten.
+REPLAY_QUERIES = 2000
+KEEP_VERSIONS = 3
+
+_VERSION_RE = re.compile(r"\.v(\d+)\.pkl$")
+
+
+def meta_path(model_path=MODEL_PATH):
+    return os.path.splitext(model_path)[0] + ".json"
+
+
+def _fingerprint(name, tid):
+    return hashlib.sha1(f"{tid}\x00{name}".encode("utf-8")).hexdigest()[:12]
+
+
+def roster_fingerprints(teacher_df):
+    """{Teacher_ID: hash of id + name}; only these fields feed the corpus."""
+    ids = teacher_df['Teacher_ID'].astype(str)
+    names = teacher_df['Teacher_Name'].astype(str)
+    return {tid: _fingerprint(name, tid) for tid, name in zip(ids, names)}
+
+
+def build_corpus(teacher_df, per_intent=None, seed=0):
+    """
+    Templated (queries, intents) for every teacher, plus greetings and
+    fallbacks. per_intent samples that many templates per intent and
+    teacher (all of them when None), to keep huge rosters quick.
+    """
+    rng = random.Random(seed)
+    queries, intents = [], []
+    pairs = list(zip(teacher_df['Teacher_Name'].astype(str), teacher_df['Teacher_ID'].astype(str)))
+    for intent, templates in INTENT_TEMPLATES.items():
+        for name, tid in pairs:
+            chosen = templates if per_intent is None else rng.sample(templates, min(per_intent, len(templates)))
+            queries.extend(t.format(name=name, tid=tid) for t in chosen)
+            intents.extend([intent] * len(chosen))
+    queries += GREETINGS + FALLBACKS
+    intents += ["greeting"] * len(GREETINGS) + ["fallback"] * len(FALLBACKS)
+    return [normalize_query(q) for q in queries], np.array(intents)
+
+
+def _vectorizer():
+    from sklearn.feature_extraction.text import HashingVectorizer
+    return HashingVectorizer(ngram_range=(1, 2), n_features=N_FEATURES, alternate_sign=False, norm="l2")
+
+
+def featurize(queries, n_jobs=1):
+    """Sparse feature matrix for `queries`, transformed in chunks across n_jobs workers."""
+    import scipy.sparse as sp
+    from joblib import Parallel, delayed
+    vectorizer = _vectorizer()
+    chunks = [queries[i:i + CHUNK_QUERIES] for i in range(0, len(queries), CHUNK_QUERIES)] or [[]]
+    if n_jobs == 1 or len(chunks) == 1:
+        return sp.vstack([vectorizer.transform(c) for c in chunks]).tocsr()
+    parts = Parallel(n_jobs=n_jobs)(delayed(vectorizer.transform)(c) for c in chunks)
+    return sp.vstack(parts).tocsr()
+
+
+def _class_weights(intents):
+    """'balanced' weights, computed up front because partial_fit can't take 'balanced'."""
+    counts = Counter(intents)
+    return {c: len(intents) / (len(counts) * n) for c, n in counts.items()}
+
+
+def train_full(teacher_df, n_jobs=-1, per_intent=None, holdout=0.1, seed=0):
+    """Trains a new HashingVectorizer + SGD logistic-regression pipeline. Returns (pipeline, info)."""
+    from sklearn.linear_model import SGDClassifier
+    from sklearn.pipeline import Pipeline
+    start = time.perf_counter()
+    queries, intents = build_corpus(teacher_df, per_intent, seed)
+    X = featurize(queries, n_jobs)
+
+    order = np.random.default_rng(seed).permutation(len(queries))
+    n_test = int(len(order) * holdout)
+    test, train = order[:n_test], order[n_test:]
+    clf = SGDClassifier(loss="log_loss", alpha=1e-5, max_iter=5, tol=1e-3, n_jobs=n_jobs,
+                        class_weight=_class_weights(intents), random_state=seed)
+    clf.fit(X[train], intents[train])
+    accuracy = float((clf.predict(X[test]) == intents[test]).mean()) if n_test else None
+
+    pipeline = Pipeline([("features", _vectorizer()), ("clf", clf)])
+    return pipeline, {"mode": "full", "samples": len(queries), "holdout_accuracy": accuracy,
+                      "seconds": round(time.perf_counter() - start, 3)}
+
+
+def changed_teachers(teacher_df, previous):
+    """Rows of `teacher_df` that are new or renamed since the roster in `previous` fingerprints."""
+    current = roster_fingerprints(teacher_df)
+    changed = [tid for tid, fp in current.items() if previous.get(tid) != fp]
+    return teacher_df[teacher_df['Teacher_ID'].astype(str).isin(changed)]
+
+
+def train_update(pipeline, teacher_df, changed_df, n_jobs=-1, seed=0):
+    """
+    Continues training `pipeline` with partial_fit on the changed teachers'
+    queries, mixed with a sample of the rest so the model doesn't drift
+    towards the new names. Returns (pipeline, info).
+    """
+    start = time.perf_counter()
+    new_q, new_y = build_corpus(changed_df, seed=seed)
+    old_q, old_y = build_corpus(teacher_df, per_intent=1, seed=seed)
+    rng = np.random.default_rng(seed)
+    keep = rng.choice(len(old_q), size=min(REPLAY_QUERIES, len(old_q)), replace=False)
+    queries = new_q + [old_q[i] for i in keep]
+    intents = np.concatenate([new_y, old_y[keep]])
+    X = featurize(queries, n_jobs)
+
+    clf = pipeline.named_steps["clf"]
+    for _ in range(UPDATE_EPOCHS):
+        order = rng.permutation(len(queries))
+        clf.partial_fit(X[order], intents[order], classes=clf.classes_)
+    return pipeline, {"mode": "update", "samples": len(queries), "changed_teachers": len(changed_df),
+                      "seconds": round(time.perf_counter() - start, 3)}
+
+
+def load_meta(model_path=MODEL_PATH):
+    try:
+        with open(meta_path(model_path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _atomic_write(path, write):
+    """
+    Writes through a temp file in the same directory, fsyncs, then renames
+    over `path`. The file keeps `path`'s old mode (0644 if it is new) rather
+    than mkstemp's 0600.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _versions(model_path):
+    base = os.path.splitext(os.path.basename(model_path))[0]
+    folder = os.path.dirname(model_path) or "."
+    found = []
+    for name in os.listdir(folder):
+        m = _VERSION_RE.search(name)
+        if name.startswith(base + ".v") and m:
+            found.append((int(m.group(1)), os.path.join(folder, name)))
+    return sorted(found)
+
+
+def save_model(pipeline, info, teacher_df, model_path=MODEL_PATH):
+    """
+    Writes the model as the next numbered version (model.vN.pkl) and then
+    atomically swaps it in as `model_path`, with its metadata alongside.
+    Readers see either the old model or the new one, never a partial file.
+    Returns the new version number.
+    """
+    import joblib
+    os.makedirs(os.path.dirname(model_path) or ".", exist_ok=True)
+    versions = _versions(model_path)
+    version = (versions[-1][0] if versions else 0) + 1
+    versioned = f"{os.path.splitext(model_path)[0]}.v{version}.pkl"
+    _atomic_write(versioned, lambda f: joblib.dump(pipeline, f))
+    with open(versioned, "rb") as src:
+        _atomic_write(model_path, lambda f: f.write(src.read()))
+
+    meta = dict(info, version=version, trained_at=time.strftime("%Y-%m-%d %H:%M:%S"),
+                teachers=len(teacher_df), roster=roster_fingerprints(teacher_df))
+    _atomic_write(meta_path(model_path), lambda f: f.write(json.dumps(meta).encode("utf-8")))
+
+    for _, old in (versions + [(version, versioned)])[:-KEEP_VERSIONS]:
+        os.remove(old)
+    return version
+
+
+def retrain(incremental=True, n_jobs=-1, per_intent=None, model_path=MODEL_PATH, teacher_df=None):
+    """
+    Brings the intent model in line with the current teacher roster.
+    With incremental=True and a hashed model already on disk, only new or
+    renamed teachers are trained in; otherwise the model is rebuilt.
+    Reloads the in-process model afterwards. Returns the info dict.
+    """
+    teacher_df = load_dataset("teachers") if teacher_df is None else teacher_df
+    meta = load_meta(model_path)
+    pipeline = None
+    if incremental and meta.get("roster") and os.path.exists(model_path):
+        import joblib
+        candidate = joblib.load(model_path)
+        if hasattr(candidate, "named_steps") and hasattr(candidate.named_steps.get("clf"), "partial_fit"):
+            pipeline = candidate
+
+    changed = changed_teachers(teacher_df, meta.get("roster", {}))
+    if pipeline is not None and len(changed) <= MAX_UPDATE_SHARE * max(len(teacher_df), 1):
+        if changed.empty:
+            return {"mode": "unchanged", "version": meta.get("version"), "seconds": 0.0}
+        pipeline, info = train_update(pipeline, teacher_df, changed, n_jobs)
+    else:
+        pipeline, info = train_full(teacher_df, n_jobs, per_intent)
+
+    info["version"] = save_model(pipeline, info, teacher_df, model_path)
+    if os.path.abspath(model_path) == os.path.abspath(get_intent_model().path):
+        get_intent_model().reload()
+    return info
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the assistant's intent model from the current teacher roster.")
+    parser.add_argument("command", choices=["full", "update"],
+                        help="full: retrain from scratch; update: train in only new or renamed teachers")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="parallel workers (-1 = all cores)")
+    parser.add_argument("--per-intent", type=int, default=None,
+                        help="templates sampled per intent and teacher (default: all)")
+    parser.add_argument("--model", default=MODEL_PATH)
+    args = parser.parse_args()
+
+    info = retrain(incremental=args.command == "update", n_jobs=args.n_jobs,
+                   per_intent=args.per_intent, model_path=args.model)
+    print(json.dumps(info, indent=2))
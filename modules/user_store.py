@@ -0,0 +1,270 @@
+import os
+import hmac
+import time
+import base64
+import hashlib
+import argparse
+import threading
+from collections import deque
+import pandas as pd
+from modules.data_store import load_cached, store_cached
+from modules.storage import get_storage
+
+# Hashing scheme and cost for new passwords. Existing hashes keep the cost
+# they were made with and are upgraded on the next successful login.
+HASH_SCHEME = os.environ.get("TEACHER_ASSISTANT_PASSWORD_HASH", "scrypt")
+SCRYPT_N = int(os.environ.get("TEACHER_ASSISTANT_SCRYPT_N", 2 ** 14))
+SCRYPT_R = 8
+SCRYPT_P = 1
+PBKDF2_ITERATIONS = int(os.environ.get("TEACHER_ASSISTANT_PBKDF2_ITERATIONS", 200_000))
+SALT_BYTES = 16
+
+# Failed logins allowed per username within the window before it is locked.
+MAX_FAILED_ATTEMPTS = 5
+LOCKOUT_WINDOW = 300
+
+CACHE_KEY = "user_index"
+
+
+def _b64(raw):
+    return base64.b64encode(raw).decode("ascii")
+
+
+def _unb64(text):
+    return base64.b64decode(text.encode("ascii"))
+
+
+def _scrypt(password, salt, n, r, p):
+    return hashlib.scrypt(password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+                          maxmem=256 * n * r + 1024 * 1024, dklen=32)
+
+
+def hash_password(password, scheme=None):
+    """
+    Returns a self-describing salted hash:
+    scrypt$n$r$p$salt$hash or pbkdf2_sha256$iterations$salt$hash.
+    """
+    scheme = scheme or HASH_SCHEME
+    salt = os.urandom(SALT_BYTES)
+    if scheme == "scrypt":
+        digest = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${_b64(salt)}${_b64(digest)}"
+    if scheme == "pbkdf2_sha256":
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, PBKDF2_ITERATIONS)
+        return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${_b64(salt)}${_b64(digest)}"
+    raise ValueError(f"Unknown password hash scheme: {scheme}")
+
+
+def is_hashed(stored):
+    return stored.startswith("scrypt$") or stored.startswith("pbkdf2_sha256$")
+
+
+def needs_rehash(stored):
+    """True for plaintext entries and hashes made with a different scheme or cost."""
+    if stored.startswith("scrypt$"):
+        _, n, r, p, _, _ = stored.split("$")
+        return HASH_SCHEME != "scrypt" or (int(n), int(r), int(p)) != (SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    if stored.startswith("pbkdf2_sha256$"):
+        _, iterations, _, _ = stored.split("$")
+        return HASH_SCHEME != "pbkdf2_sha256" or int(iterations) != PBKDF2_ITERATIONS
+    return True
+
+
+def verify_password(password, stored):
+    """Constant-time check of `password` against a stored hash (or a legacy plaintext entry)."""
+    try:
+        if stored.startswith("scrypt$"):
+            _, n, r, p, salt, digest = stored.split("$")
+            candidate = _scrypt(password, _unb64(salt), int(n), int(r), int(p))
+            return hmac.compare_digest(candidate, _unb64(digest))
+        if stored.startswith("pbkdf2_sha256$"):
+            _, iterations, salt, digest = stored.split("$")
+            candidate = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), _unb64(salt), int(iterations))
+            return hmac.compare_digest(candidate, _unb64(digest))
+    except (ValueError, TypeError):
+        return False
+    return hmac.compare_digest(password.encode("utf-8"), stored.encode("utf-8"))
+
+
+class LoginRateLimiter:
+    """
+    Sliding-window count of failed logins per username. A username with
+    MAX_FAILED_ATTEMPTS failures inside LOCKOUT_WINDOW seconds is refused
+    until the oldest failure ages out; a successful login clears it.
+    """
+
+    def __init__(self, max_attempts=MAX_FAILED_ATTEMPTS, window=LOCKOUT_WINDOW):
+        self.max_attempts = max_attempts
+        self.window = window
+        self._failures = {}
+        self._lock = threading.Lock()
+
+    def _prune(self, attempts, now):
+        while attempts and attempts[0] <= now - self.window:
+            attempts.popleft()
+
+    def retry_after(self, username, now=None):
+        """Seconds until `username` may try again, or 0 if not locked."""
+        now = now or time.monotonic()
+        with self._lock:
+            attempts = self._failures.get(username)
+            if not attempts:
+                return 0
+            self._prune(attempts, now)
+            if len(attempts) < self.max_attempts:
+                return 0
+            return int(attempts[0] + self.window - now) + 1
+
+    def failed(self, username, now=None):
+        now = now or time.monotonic()
+        with self._lock:
+            attempts = self._failures.setdefault(username, deque(maxlen=self.max_attempts))
+            self._prune(attempts, now)
+            attempts.append(now)
+            if len(self._failures) > 10_000:
+                for name in [k for k, v in self._failures.items() if not v or v[-1] <= now - self.window]:
+                    del self._failures[name]
+
+    def succeeded(self, username):
+        with self._lock:
+            self._failures.pop(username, None)
+
+
+class UserStore:
+    """
+    Username -> stored password index over the users table, cached per
+    table version, so a login is one dict lookup plus one hash check.
+    """
+
+    def __init__(self, users_df):
+        self.index = dict(zip(users_df['username'].astype(str), users_df['password'].astype(str)))
+        self._lock = threading.Lock()
+
+    def get(self, username):
+        return self.index.get(username)
+
+    def __contains__(self, username):
+        return username in self.index
+
+    def put(self, username, stored):
+        with self._lock:
+            self.index[username] = stored
+
+
+_dummy_hash = None
+
+_rate_limiter = LoginRateLimiter()
+_write_lock = threading.Lock()
+
+
+def _get_dummy_hash():
+    """Verified against when the username is unknown, so a miss costs as much as a hit."""
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = hash_password("not-a-real-password")
+    return _dummy_hash
+
+
+def get_user_store():
+    storage = get_storage()
+    return load_cached(CACHE_KEY, storage.version("users"), lambda: UserStore(storage.users()))
+
+
+def create_user(username, password):
+    """Adds a user with a hashed password. Returns False if the name is taken."""
+    storage = get_storage()
+    stored = hash_password(password)
+    with _write_lock:
+        users = get_user_store()
+        if username in users:
+            return False
+        storage.add_user(username, stored)
+        users.put(username, stored)
+        store_cached(CACHE_KEY, storage.version("users"), users)
+    return True
+
+
+def authenticate(username, password):
+    """
+    Returns (status, retry_after) where status is "ok", "not_found",
+    "bad_password" or "locked". Legacy plaintext or outdated hashes are
+    re-hashed with the current settings on success.
+    """
+    wait = _rate_limiter.retry_after(username)
+    if wait:
+        return "locked", wait
+
+    stored = get_user_store().get(username)
+    if stored is None:
+        verify_password(password, _get_dummy_hash())
+        _rate_limiter.failed(username)
+        return "not_found", 0
+    if not verify_password(password, stored):
+        _rate_limiter.failed(username)
+        return "bad_password", 0
+
+    _rate_limiter.succeeded(username)
+    if needs_rehash(stored):
+        _set_passwords({username: hash_password(password)})
+    return "ok", 0
+
+
+def _set_passwords(passwords):
+    storage = get_storage()
+    with _write_lock:
+        users = get_user_store()
+        storage.set_passwords(passwords)
+        for username, stored in passwords.items():
+            users.put(username, stored)
+        store_cached(CACHE_KEY, storage.version("users"), users)
+
+
+def migrate_plaintext_passwords():
+    """Hashes every plaintext password in the users table. Returns how many were converted."""
+    users = get_user_store()
+    plain = {u: hash_password(p) for u, p in list(users.index.items()) if not is_hashed(p)}
+    if plain:
+        _set_passwords(plain)
+    return len(plain)
+
+
+def benchmark(rounds=20):
+    """Milliseconds per hash+verify for a few cost settings, to help tune them."""
+    results = []
+    settings = [("scrypt", n) for n in (2 ** 12, 2 ** 13, 2 ** 14, 2 ** 15)] + \
+               [("pbkdf2_sha256", i) for i in (50_000, 100_000, 200_000, 400_000)]
+    salt = os.urandom(SALT_BYTES)
+    for scheme, cost in settings:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            if scheme == "scrypt":
+                _scrypt("benchmark-password", salt, cost, SCRYPT_R, SCRYPT_P)
+            else:
+                hashlib.pbkdf2_hmac("sha256", b"benchmark-password", salt, cost)
+        ms = (time.perf_counter() - start) / rounds * 1000
+        results.append({"scheme": scheme, "cost": cost, "ms_per_login": round(ms, 2),
+                        "logins_per_core_per_min": int(60_000 / ms)})
+
+    users = UserStore(pd.DataFrame({
+        "username": [f"user{i}" for i in range(100_000)],
+        "password": ["x"] * 100_000,
+    }))
+    start = time.perf_counter()
+    for i in range(100_000):
+        users.get(f"user{i}")
+    lookup_us = (time.perf_counter() - start) / 100_000 * 1e6
+    return results, round(lookup_us, 3)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="User store maintenance.")
+    parser.add_argument("command", choices=["migrate", "bench"])
+    args = parser.parse_args()
+    if args.command == "migrate":
+        print(f"Hashed {migrate_plaintext_passwords()} plaintext passwords")
+    else:
+        rows, lookup_us = benchmark()
+        for row in rows:
+            print(f"{row['scheme']:14s} cost={row['cost']:<7d} {row['ms_per_login']:8.2f} ms/login  "
+                  f"~{row['logins_per_core_per_min']} logins/core/min")
+        print(f"index lookup (100k users): {lookup_us} us")
@@ -0,0 +1,126 @@
+import time
+import logging
+import importlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from modules.data_store import DATASETS
+
+logger = logging.getLogger(__name__)
+
+# Navigation order, where each page's render function lives and the
+# datasets it reads. A page's module (and whatever heavy libraries it pulls
+# in: matplotlib, reportlab, plotly, the intent model) is only imported the
+# first time someone opens it, and only its own datasets are loaded per render.
+PAGES = {
+    "Home": {"render": "modules.views.home:render",
+             "datasets": ["teachers", "appointments"]},
+    "Book Appointment": {"render": "modules.views.book_appointment:render",
+                         "datasets": ["teachers", "appointments"]},
+    "Student Thoughts": {"render": "modules.views.student_thoughts:render",
+                         "datasets": ["thoughts"]},
+    "Ask Assistant": {"render": "modules.views.ask_assistant:render",
+                      "datasets": ["teachers", "faq"]},
+    "Quiz": {"render": "modules.quiz:quiz_tab",
+             "datasets": ["quiz_questions", "quiz_answers"]},
+    "Progress Report": {"render": "modules.progress_report:progress_report_tab",
+                        "datasets": ["quiz_results", "thoughts"]},
+    "Admin Panel": {"render": "modules.admin_panel:admin_panel",
+                    "datasets": ["teachers", "appointments", "thoughts", "quiz_results",
+                                 "quiz_questions", "quiz_answers"]},
+    "About": {"render": "modules.views.about:render", "datasets": []},
+}
+
+# Columns a dataset must have before any page that reads it is rendered.
+REQUIRED_COLUMNS = {
+    "teachers": DATASETS["teachers"]["columns"],
+}
+LOAD_WORKERS = 4
+TIMINGS_KEPT = 200
+
+_pool = None
+_pool_lock = threading.Lock()
+_timings = deque(maxlen=TIMINGS_KEPT)
+
+
+def page_names():
+    return list(PAGES)
+
+
+def page_module(name):
+    return PAGES[name]["render"].split(":")[0]
+
+
+def load_page(name):
+    """Imports the page's module on first use and returns its render function."""
+    module_name, func_name = PAGES[name]["render"].split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def _load(name):
+    """Tables the storage backend owns come from it (CSV or SQLite); the rest from data/."""
+    from modules.storage import TABLES, get_storage
+    from modules.data_store import load_dataset
+    if name in TABLES:
+        return getattr(get_storage(), name)()
+    return load_dataset(name)
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=LOAD_WORKERS, thread_name_prefix="page-data")
+    return _pool
+
+
+def preload(names):
+    """
+    Loads `names` into the shared cache, concurrently when there is more than
+    one, so the page's own reads are cache hits. Returns {name: DataFrame}.
+    """
+    names = list(dict.fromkeys(names))
+    if len(names) <= 1:
+        return {name: _load(name) for name in names}
+    futures = {name: _get_pool().submit(_load, name) for name in names}
+    return {name: future.result() for name, future in futures.items()}
+
+
+def missing_columns(frames):
+    """{dataset: [missing columns]} for the loaded datasets that fail REQUIRED_COLUMNS."""
+    missing = {}
+    for name, df in frames.items():
+        absent = [c for c in REQUIRED_COLUMNS.get(name, []) if c not in df.columns]
+        if absent:
+            missing[name] = absent
+    return missing
+
+
+def render_timings():
+    """Recent renders as dicts of page, load_ms and render_ms, oldest first."""
+    return list(_timings)
+
+
+def render_page(name):
+    """
+    Loads only the datasets the page declares, then renders it. The time
+    spent in each step is logged and kept for the Admin Panel.
+    """
+    import streamlit as st
+    start = time.perf_counter()
+    frames = preload(PAGES[name]["datasets"])
+    loaded = time.perf_counter()
+    missing = missing_columns(frames)
+    if missing:
+        for dataset, columns in missing.items():
+            st.error(f"{dataset.capitalize()} CSV missing required columns: {', '.join(columns)}")
+        st.stop()
+    try:
+        load_page(name)()
+    finally:
+        done = time.perf_counter()
+        timing = {"page": name, "load_ms": round((loaded - start) * 1000, 2),
+                  "render_ms": round((done - loaded) * 1000, 2)}
+        _timings.append(timing)
+        logger.info("page %s: load %.1f ms, render %.1f ms", name, timing["load_ms"], timing["render_ms"])
@@ -0,0 +1,31 @@
+import streamlit as st
+
+
+def render():
+    st.markdown("""
+    <h2 style='color:#00ffff'>About this Project</h2>
+    <p>Advanced <b>Teacher Assistant</b> with interactive booking, analytics, and AI-driven features.</p>
+    <h3> Project Maker</h3>
+    <p><b>Shailendra Dhakad</b> – Artificial Intelligence/Machine Learning Student</p>
+
+    <h3> Features</h3>
+    <ul>
+        <li>Teacher Search & Availability</li>
+        <li>Interactive Appointment Booking</li>
+        <li>Student Dashboard & History</li>
+        <li>Admin Panel for Management</li>
+        <li>Motivational & Inventor Cards</li>
+        <li>Quick Stats & Top Teachers</li>
+        <li>Dark Neon Theme</li>
+        <li>Student Thoughts Sharing</li>
+    </ul>
+
+    <h3> Future Roadmap</h3>
+    <ul>
+        <li>AI-based Teacher & Slot Suggestions</li>
+        <li>Email & PDF Notifications</li>
+        <li>Dark/Light Mode Toggle</li>
+        <li>Advanced Analytics & Graphs</li>
+        <li>Gamified Badges for Students</li>
+    </ul>
+    """, unsafe_allow_html=True)
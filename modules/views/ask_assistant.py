@@ -0,0 +1,44 @@
+import streamlit as st
+import pandas as pd
+from modules.intent_model import get_intent_model
+from modules.assistant import answer_query, answer_queries
+from modules.faq import answer_faq
+
+
+def render():
+    # Start loading the model while the user is still typing.
+    get_intent_model().warm_up_async()
+
+    st.title(" Ask Assistant")
+    st.write("Ask where a teacher sits, when they are free, or how to meet them — by name or ID.")
+    question = st.text_input("Your question", placeholder="Where is Arun Das? / T101 ka free time kab hai?")
+    if question:
+        try:
+            result = answer_query(question)
+        except Exception as e:
+            st.error(f"The assistant model could not be loaded: {e}")
+            return
+        st.success(result['answer'])
+        st.caption(f"Intent: {result['intent']}")
+
+    with st.expander(" Search the student FAQ"):
+        faq_query = st.text_input("Search FAQ", key="faq_query")
+        if faq_query:
+            hits = answer_faq(faq_query, k=3)
+            if not hits:
+                st.info("No matching FAQ entries.")
+            for hit in hits:
+                st.markdown(f"**{hit['question']}**  \n{hit['answer']}")
+                st.caption(f"Match: {hit['score']:.0%}")
+
+    with st.expander(" Ask several questions at once"):
+        batch = st.text_area("One question per line")
+        if st.button("Answer All"):
+            questions = [q for q in batch.splitlines() if q.strip()]
+            if not questions:
+                st.error("Please enter at least one question!")
+            else:
+                try:
+                    st.dataframe(pd.DataFrame(answer_queries(questions)), use_container_width=True)
+                except Exception as e:
+                    st.error(f"The assistant model could not be loaded: {e}")
@@ -0,0 +1,64 @@
+import streamlit as st
+from modules.storage import get_storage
+from modules.teacher_search import search_teachers
+from modules.aggregates import get_aggregates
+from modules.appointment import show_calendar, book_appointment, get_appointments_by_student
+
+
+def render():
+    st.title(" Book Appointment")
+    student_name = st.text_input(" Student Name")
+    student_id = st.text_input(" Student ID")
+    teacher_query = st.text_input(" Search Teacher by Name or ID")
+
+    selected_teacher = None
+    if teacher_query:
+        selected_teacher = search_teachers(teacher_query, limit=1)
+
+    if selected_teacher is not None and not selected_teacher.empty:
+        teacher_row = selected_teacher.iloc[0]
+        st.markdown(f"""
+        <div class="teacher-card">
+            <h3>{teacher_row['Teacher_Name']} ({teacher_row['Teacher_ID']})</h3>
+            <p><b>Subject:</b> {teacher_row['Subject']} | <b>Block:</b> {teacher_row['Block']} | <b>Room:</b> {teacher_row['Room_Number']}</p>
+            <p><b>Free Slots:</b> {teacher_row['Free_Start']} - {teacher_row['Free_End']} | <b>Days:</b> {teacher_row['Available_Days']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        appt_df = get_storage().appointments()
+        if not appt_df.empty:
+
+            top_teachers = get_aggregates().top_teachers(3)
+            st.info(" Popular Teachers based on past appointments:")
+            for t, count in top_teachers:
+                st.write(f"- {t} — {count} bookings")
+
+            if student_id:
+                student_history = appt_df[appt_df['Student_ID'].astype(str) == student_id]
+                if not student_history.empty:
+                    last_teacher = student_history.iloc[-1]['Teacher_Name']
+                    last_slot = student_history.iloc[-1]['Slot']
+                    st.info(f"Recommended next slot: Try with {last_teacher} at {last_slot} again if available")
+                else:
+                    st.info("No past appointments, pick any free slot shown below.")
+        else:
+            st.info("No past appointment data yet. Suggestions will appear here once students book appointments.")
+
+        available_slots = show_calendar(teacher_row)
+        if available_slots:
+            st.markdown("### Select Slot")
+            for slot in available_slots:
+                if st.button(f"Book: {slot}"):
+                    if not student_name or not student_id:
+                        st.error("Please enter Student Name and ID")
+                    else:
+                        if book_appointment(student_name, student_id, teacher_row, slot):
+                            st.success(f"Appointment booked with {teacher_row['Teacher_Name']} at {slot}")
+
+    if student_id:
+        st.markdown("### Your Appointments")
+        df_student = get_appointments_by_student(student_id)
+        if not df_student.empty:
+            st.dataframe(df_student, use_container_width=True)
+        else:
+            st.info("No appointments found for this Student ID.")
@@ -0,0 +1,59 @@
+import streamlit as st
+from modules.ui_components import show_motivational_cards
+from modules.data_store import load_dataset
+from modules.storage import get_storage
+from modules.teacher_search import search_teachers
+from modules.aggregates import get_aggregates
+
+
+def render():
+    st.markdown("<h1 style='text-align:center; color:#00ffff;'>🎓 AI Teacher Assistant</h1>", unsafe_allow_html=True)
+    st.write("<p style='text-align:center; font-size:18px;'>Search teachers, view appointments, and get inspired by top tech innovators!</p>", unsafe_allow_html=True)
+
+    st.markdown("### Quick Stats")
+    stats = get_aggregates()
+    total_teachers = len(load_dataset("teachers"))
+    total_appointments = stats.total
+    most_booked_teacher = stats.most_booked_teacher() or "N/A"
+
+    st.markdown("<div style='margin-top:10px;'></div>", unsafe_allow_html=True)
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Total Teachers", total_teachers)
+    c2.metric("Total Appointments", total_appointments)
+    c3.metric("Most Booked Teacher", most_booked_teacher)
+
+    st.markdown("### Top 3 Teachers")
+    top3 = stats.top_teachers(3)
+    if top3:
+        for t, count in top3:
+            st.success(f" {t} — {count} Appointments")
+    else:
+        st.info("No appointments booked yet.")
+
+    st.markdown("### Recent Appointments")
+    recent = get_storage().appointments().tail(5)
+    if not recent.empty:
+        st.dataframe(recent, use_container_width=True)
+    else:
+        st.info("No recent appointments.")
+
+    show_motivational_cards()
+
+    st.markdown("### Search Teacher")
+    query = st.text_input("Search by Name or ID:")
+    if query:
+        result = search_teachers(query)
+
+        if not result.empty:
+            st.success(f"Found {len(result)} teacher(s)")
+            for _, t in result.iterrows():
+                with st.container():
+                    st.markdown(f"""
+                    <div class="teacher-card">
+                        <h3>{t['Teacher_Name']} ({t['Teacher_ID']})</h3>
+                        <p><b>Subject:</b> {t['Subject']} | <b>Block:</b> {t['Block']} | <b>Room:</b> {t['Room_Number']}</p>
+                        <p><b>Free Slots:</b> {t['Free_Start']} - {t['Free_End']} | <b>Days:</b> {t['Available_Days']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+        else:
+            st.error("Teacher not found!")
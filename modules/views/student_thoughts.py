@@ -0,0 +1,31 @@
+import streamlit as st
+from datetime import datetime
+from modules.storage import get_storage
+
+
+def render():
+    st.title(" Share Your Thoughts")
+    student_name = st.text_input(" Student Name")
+    student_id = st.text_input(" Student ID")
+    teacher_name = st.text_input(" Teacher Name")
+    thought = st.text_area(" Share your thoughts about the teacher")
+
+    if st.button("Submit Thought"):
+        if not student_name or not student_id or not teacher_name or not thought:
+            st.error("Please fill all fields!")
+        else:
+            get_storage().add_thought({
+                'Student_Name': student_name,
+                'Student_ID': student_id,
+                'Teacher_Name': teacher_name,
+                'Thought': thought,
+                'Date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+            st.success("Thought shared successfully!")
+
+    st.markdown("### Recent Thoughts")
+    updated_thoughts = get_storage().thoughts()
+    if not updated_thoughts.empty:
+        st.dataframe(updated_thoughts.tail(10), use_container_width=True)
+    else:
+        st.info("No thoughts shared yet.")